@@ -0,0 +1,92 @@
+"""
+Benchmark of the JSON codecs on a generated vacancy store.
+
+Generates a store of 100k vacancies in the JSONFileHandler layout and,
+for every installed codec, saves it through JSONFileHandler._save_file
+and parses it back, indented and compact. Throughput is reported in MB
+of file per second.
+
+Run from the project root:
+
+    poetry run python -m benchmarks.bench_json_codec
+"""
+import os
+import random
+import tempfile
+import time
+
+from src.file_handler_json import JSONFileHandler
+from src.json_codec import CODECS, get_codec
+from src.vacancy import Vacancy
+
+VACANCIES = 100_000
+ROUNDS = 3
+
+WORDS = (
+    'Python', 'разработчик', 'Senior', 'backend', 'Django', 'аналитик',
+    'данных', 'инженер', 'DevOps', 'ведущий', 'Java', 'менеджер'
+)
+
+
+def generate_store(count):
+    generator = random.Random(1)
+    store = {}
+    for number in range(count):
+        platform = 'HH.ru' if number % 2 else 'SuperJob.ru'
+        salary_from = generator.choice((None, generator.randrange(50, 300)))
+        vacancy = Vacancy(
+            platform=platform,
+            vacancy_id=number,
+            title=' '.join(generator.choices(WORDS, k=3)),
+            url=f'https://example.com/vacancy/{number}',
+            salary_from=salary_from * 1000 if salary_from else None,
+            salary_to=None,
+            currency='RUR',
+            description=' '.join(generator.choices(WORDS, k=25)),
+            employer=f'Employer {number % 5000}'
+        )
+        store.setdefault(platform, []).append(vacancy.to_dict())
+    return store
+
+
+def best_of(action):
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    store = generate_store(VACANCIES)
+    directory = tempfile.mkdtemp()
+    print(f'{VACANCIES} vacancies, best of {ROUNDS} rounds')
+
+    for name in CODECS:
+        codec = get_codec(name)
+        for compact in (False, True):
+            layout = 'compact' if compact else 'indented'
+            file_path = os.path.join(directory, f'{name}-{layout}.json')
+            handler = JSONFileHandler(file_path, codec=codec)
+
+            save = best_of(
+                lambda: JSONFileHandler._save_file(
+                    store, file_path, codec, compact
+                )
+            )
+            load = best_of(lambda: handler._parse_file(file_path))
+            size = os.path.getsize(file_path) / 2 ** 20
+            print(
+                f'{name:<8} {"compact" if compact else "indented":<9} '
+                f'{size:7.1f} MB  '
+                f'save {save * 1000:7.1f} ms {size / save:7.1f} MB/s  '
+                f'load {load * 1000:7.1f} ms {size / load:7.1f} MB/s'
+            )
+            os.remove(file_path)
+
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark of full-text search over a saved vacancy store.
+
+Generates a store of 500k vacancies whose titles and descriptions draw
+words from a Zipf-distributed vocabulary, saves it and searches it
+through a non-cached JSONFileHandler. Reports the one-off cost of
+parsing the file and building the index, then the median latency of
+repeated queries, which must not re-parse the unchanged file: the
+target is sub-millisecond boolean and ranked queries.
+
+Run from the project root:
+
+    poetry run python -m benchmarks.bench_search
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src.file_handler_json import JSONFileHandler
+from src.vacancy import Vacancy
+
+VACANCIES = 500_000
+VOCABULARY = 20_000
+QUERIES = 200
+
+QUERY_RANKS = (50, 200, 1000, 5000)
+
+
+def generate_store(count, words):
+    generator = random.Random(1)
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    store = {}
+    for number in range(count):
+        platform = 'HH.ru' if number % 2 else 'SuperJob.ru'
+        text = generator.choices(words, weights, k=28)
+        vacancy = Vacancy(
+            platform=platform,
+            vacancy_id=number,
+            title=' '.join(text[:3]),
+            url=f'https://example.com/vacancy/{number}',
+            salary_from=generator.randrange(50, 300) * 1000,
+            salary_to=None,
+            currency='RUR',
+            description=' '.join(text[3:]),
+            employer=f'Employer {number % 5000}'
+        )
+        store.setdefault(platform, []).append(vacancy.to_dict())
+    return store
+
+
+def median_ms(action, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        action(query)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    words = [f'word{number}' for number in range(VOCABULARY)]
+    generator = random.Random(2)
+    queries = []
+    for _ in range(QUERIES):
+        ranks = generator.sample(QUERY_RANKS, 2)
+        queries.append(' '.join(
+            words[rank + generator.randrange(rank)] for rank in ranks
+        ))
+
+    directory = tempfile.mkdtemp()
+    file_path = os.path.join(directory, 'vacancies.json')
+    JSONFileHandler._save_file(
+        generate_store(VACANCIES, words), file_path, compact=True
+    )
+    size = os.path.getsize(file_path) / 2 ** 20
+    print(f'{VACANCIES} vacancies, {size:.1f} MB, {QUERIES} queries')
+
+    handler = JSONFileHandler(file_path)
+    start = time.perf_counter()
+    handler.search_vacancies(queries[0], limit=10)
+    print(f'parse and index  {time.perf_counter() - start:8.2f} s')
+
+    for label, match_all in (('all words', True), ('any word', False)):
+        latency = median_ms(
+            lambda query: handler.search_vacancies(query, 10, match_all),
+            queries
+        )
+        print(f'top 10, {label:<9} {latency:8.3f} ms')
+
+    os.remove(file_path)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark of pooled sessions against bare requests.get.
+
+Starts a local keep-alive HTTP server that returns a HH.ru-like page and
+pulls 100 pages twice: once with a new connection per request (the old
+behaviour of ParserMixin.make_request) and once through the parser's
+pooled session. The number of TCP connections accepted by the server
+shows the handshakes saved.
+
+Run from the project root:
+
+    poetry run python -m benchmarks.bench_session
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+
+PAGES = 100
+
+PAGE_BODY = json.dumps({
+    'items': [
+        {
+            'id': str(number),
+            'name': f'Python developer {number}',
+            'alternate_url': f'https://hh.ru/vacancy/{number}',
+            'salary': {'from': 100000, 'to': 150000, 'currency': 'RUR'},
+            'snippet': {'requirement': 'Python', 'responsibility': None}
+        } for number in range(20)
+    ]
+}).encode('utf-8')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler that answers every GET with the same page.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(PAGE_BODY)))
+        self.end_headers()
+        self.wfile.write(PAGE_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class CountingServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server that counts accepted connections.
+    """
+
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+def run(label, fetch, server):
+    server.connections = 0
+    start = time.perf_counter()
+    for page in range(PAGES):
+        fetch(page)
+    elapsed = time.perf_counter() - start
+    print(
+        f'{label:<14} {elapsed * 1000:8.1f} ms '
+        f'{elapsed / PAGES * 1000:6.2f} ms/page '
+        f'{server.connections:4d} connections'
+    )
+
+
+def main():
+    server = CountingServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/vacancies'
+
+    run(
+        'requests.get',
+        lambda page: requests.get(url, params={'page': page}).json(),
+        server
+    )
+
+    # The stub server does not throttle, so neither does the parser.
+    with HHParser(rate_limiter=RateLimiter(default_rate=1e9)) as parser:
+        parser.url = url
+        run(
+            'pooled session',
+            lambda page: parser.make_request(
+                parser.url, {**parser.parameters, 'page': page},
+                parser.headers
+            ),
+            server
+        )
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
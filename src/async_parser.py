@@ -0,0 +1,441 @@
+"""Abstract base class for asyncio parsers module."""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List
+
+from src.constants import (
+    ASYNC_MAX_CONNECTIONS, ASYNC_MAX_IN_FLIGHT, MAX_RETRIES, REQUEST_TIMEOUT
+)
+from src.json_codec import JSONCodec, get_codec
+from src.metrics import METRICS
+from src.paging import PageWindow, PagingMixin
+from src.rate_limiter import RateLimiter
+from src.response_cache import MemoryResponseCache, ResponseCache
+from src.vacancy import Vacancy
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncParser(ABC):
+    """
+    Abstract base class for asyncio parsers.
+
+    The counterpart of Parser for event loops: requests never block the
+    loop, so one loop can drive many page requests across platforms.
+    parse_vacancies_sync runs a parser from synchronous code.
+    """
+
+    platform: str = ''
+
+    @abstractmethod
+    async def parse_vacancies(
+            self, keyword: str, count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Parses vacancies based on the given keyword and count.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            List[Dict[str, Any]]: The parsed vacancies.
+        """
+        pass
+
+    @abstractmethod
+    def iter_vacancies(
+            self, keyword: str, count: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields raw vacancies page by page as soon as each page arrives.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The raw vacancies.
+        """
+        pass
+
+    @abstractmethod
+    def stream_vacancies(
+            self, keyword: str, count: int
+    ) -> AsyncIterator[Vacancy]:
+        """
+        Yields Vacancy objects page by page as soon as each page arrives.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            AsyncIterator[Vacancy]: The vacancy objects.
+        """
+        pass
+
+    @abstractmethod
+    def keyword_parameters(self, keyword: str) -> Dict[str, Any]:
+        """
+        Returns the request parameters that search for a keyword.
+
+        Args:
+            keyword (str): The keyword to search for.
+
+        Returns:
+            Dict[str, Any]: The request parameters.
+        """
+        pass
+
+    async def vacancies(self, keyword: str, count: int) -> List[Vacancy]:
+        """
+        Collects the Vacancy objects of a search.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            List[Vacancy]: The vacancy objects.
+        """
+        return [
+            vacancy
+            async for vacancy in self.stream_vacancies(keyword, count)
+        ]
+
+    def parse_vacancies_sync(
+            self, keyword: str, count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs parse_vacancies on a new event loop and waits for it.
+
+        Must not be called from a running event loop. A session owned by
+        the parser is closed afterwards, since it is bound to the loop.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            List[Dict[str, Any]]: The parsed vacancies.
+        """
+        async def run() -> List[Dict[str, Any]]:
+            try:
+                return await self.parse_vacancies(keyword, count)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+
+class AsyncParserMixin(PagingMixin):
+    """
+    Mixin class for making HTTP requests with aiohttp.
+
+    A single aiohttp.ClientSession may be shared by any number of parsers,
+    so their requests go through one connection pool; without one, the
+    parser creates its own on first use. Call aclose() or use the parser
+    as an async context manager to release an owned session.
+
+    Requests are paced by the same per-host rate limiters as the
+    synchronous parsers and retried the same way, waiting with
+    asyncio.sleep instead of blocking.
+    """
+
+    def __init__(
+            self, max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+            session: 'aiohttp.ClientSession | None' = None,
+            cache: ResponseCache | None = None,
+            rate_limiter: RateLimiter | None = None,
+            timeout: float | tuple = REQUEST_TIMEOUT,
+            max_retries: int = MAX_RETRIES
+    ):
+        """
+        Initializes the mixin.
+
+        Args:
+            max_in_flight (int): The maximum number of pages of a search
+            requested at the same time.
+            session (aiohttp.ClientSession | None): The shared session.
+            Defaults to a session owned by the parser.
+            cache (ResponseCache | None): The cache of response bodies.
+            Responses are not cached if None.
+            rate_limiter (RateLimiter | None): The rate limiter. Defaults to
+            the process-wide limiter.
+            timeout (float | tuple): The request timeout in seconds, or the
+            (connect, read) timeouts.
+            max_retries (int): The maximum number of retries of a request.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for the asyncio parsers')
+        self.max_in_flight: int = max(1, max_in_flight)
+        self.session: aiohttp.ClientSession | None = session
+        self.owns_session: bool = session is None
+        self.cache: ResponseCache | None = cache
+        self.rate_limiter: RateLimiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter.shared()
+        )
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            self.timeout = aiohttp.ClientTimeout(
+                sock_connect=connect, sock_read=read
+            )
+        else:
+            self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries: int = max_retries
+        self.codec: JSONCodec = get_codec()
+
+    @staticmethod
+    def create_session(
+            limit: int = ASYNC_MAX_CONNECTIONS
+    ) -> 'aiohttp.ClientSession':
+        """
+        Creates a session to share between parsers. Must be called from a
+        running event loop.
+
+        Args:
+            limit (int): The maximum number of open connections.
+
+        Returns:
+            aiohttp.ClientSession: The session.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit)
+        )
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if self.session is None:
+            self.session = self.create_session()
+        return self.session
+
+    async def aclose(self) -> None:
+        """
+        Closes the session if the parser owns it.
+
+        Returns:
+            None
+        """
+        if self.owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def request_body(
+            self,
+            url: str, parameters: Dict[str, Any], headers: Dict[str, str]
+    ) -> bytes:
+        """
+        Makes an HTTP GET request and returns the raw response body.
+
+        Cache lookups and stores of caches other than MemoryResponseCache
+        may do disk I/O, so they run in a worker thread instead of
+        blocking the event loop.
+
+        Args:
+            url (str): The URL to make the request to.
+            parameters (Dict[str, Any]): The request parameters.
+            headers (Dict[str, str]): The request headers.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            aiohttp.ClientError: If the request still fails after the
+            last retry, or the server answered with another error.
+        """
+        if self.cache is not None:
+            body = await self._in_cache_thread(self.cache.get, url, parameters)
+            if body is not None:
+                METRICS.increment('cache_hits_total')
+                return body
+            METRICS.increment('cache_misses_total')
+
+        with METRICS.timer('fetch_seconds'):
+            body = await self._send(url, parameters, headers)
+        METRICS.increment('response_bytes_total', len(body))
+        if self.cache is not None:
+            await self._in_cache_thread(
+                self.cache.set, url, parameters, body
+            )
+        return body
+
+    async def _in_cache_thread(self, method: Callable, *args: Any) -> Any:
+        if isinstance(self.cache, MemoryResponseCache):
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def make_request(
+            self,
+            url: str, parameters: Dict[str, Any], headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Makes an HTTP GET request and returns the response as JSON.
+
+        Args:
+            url (str): The URL to make the request to.
+            parameters (Dict[str, Any]): The request parameters.
+            headers (Dict[str, str]): The request headers.
+
+        Returns:
+            Dict[str, Any]: The JSON response.
+        """
+        return self.codec.loads(
+            await self.request_body(url, parameters, headers)
+        )
+
+    async def _send(
+            self,
+            url: str, parameters: Dict[str, Any], headers: Dict[str, str]
+    ) -> bytes:
+        """
+        Sends a rate-limited GET request, retrying transient failures.
+
+        Args:
+            url (str): The URL to make the request to.
+            parameters (Dict[str, Any]): The request parameters.
+            headers (Dict[str, str]): The request headers.
+
+        Returns:
+            bytes: The body of the successful response.
+        """
+        bucket = self.rate_limiter.bucket(url)
+        session = self._get_session()
+        attempt = 0
+        while True:
+            delay = bucket.try_acquire()
+            waited = 0.0
+            while delay:
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = bucket.try_acquire()
+            if waited:
+                METRICS.observe('rate_limit_wait_seconds', waited)
+            METRICS.increment('requests_total')
+
+            try:
+                with METRICS.timer('request_seconds'):
+                    async with session.get(
+                            url, params=parameters, headers=headers,
+                            timeout=self.timeout
+                    ) as response:
+                        status = response.status
+                        if status not in self.RETRY_STATUSES:
+                            response.raise_for_status()
+                            body = await response.read()
+                        elif not self.can_retry(attempt):
+                            response.raise_for_status()
+                        retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not self.can_retry(attempt):
+                    raise
+                await asyncio.sleep(self.retry_delay(bucket, attempt))
+                attempt += 1
+                continue
+
+            if status not in self.RETRY_STATUSES:
+                bucket.succeeded()
+                return body
+
+            delay = self.retry_delay(bucket, attempt, status, retry_after)
+            if delay:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def fetch_page(
+            self, page: int, parameters: Dict[str, Any],
+            decode: Callable[[bytes], Any] | None = None
+    ) -> Any:
+        """
+        Fetches a single page.
+
+        Args:
+            page (int): The page number, starting at 0.
+            parameters (Dict[str, Any]): The request parameters.
+            decode (Callable[[bytes], Any] | None): Decodes the response
+            body. Defaults to JSON decoding.
+
+        Returns:
+            Any: The decoded response.
+        """
+        if decode is None:
+            decode = self.codec.loads
+        body = await self.request_body(
+            self.url, {**parameters, 'page': page}, self.headers
+        )
+        METRICS.increment('pages_total')
+        with METRICS.timer('decode_seconds'):
+            return decode(body)
+
+    async def iter_pages(
+            self, pages: int, parameters: Dict[str, Any],
+            decode: Callable[[bytes], Any] | None = None
+    ) -> AsyncIterator[Any]:
+        """
+        Yields up to the given number of pages.
+
+        Up to max_in_flight pages are requested ahead of the consumer.
+        Pages are always yielded in page order, and no more pages are
+        requested than the consumer asks for. Iteration stops after the
+        first page with fewer than per_page vacancies, see is_last_page.
+
+        Args:
+            pages (int): The maximum number of pages to fetch.
+            parameters (Dict[str, Any]): The request parameters.
+            decode (Callable[[bytes], Any] | None): Decodes a response
+            body. Defaults to JSON decoding.
+
+        Returns:
+            AsyncIterator[Any]: The decoded responses ordered by page.
+        """
+        window = PageWindow(
+            pages, self.max_in_flight,
+            lambda page: asyncio.ensure_future(
+                self.fetch_page(page, parameters, decode)
+            )
+        )
+        try:
+            for task in window:
+                response = await task
+                yield response
+                if self.is_last_page(response):
+                    return
+        finally:
+            cancelled = window.cancel()
+            if cancelled:
+                await asyncio.gather(*cancelled, return_exceptions=True)
+
+
+async def gather_vacancies(
+        parsers: Iterable[AsyncParser], keyword: str, count: int
+) -> Dict[str, List[Vacancy]]:
+    """
+    Runs a search on several platforms concurrently on the running loop.
+
+    Args:
+        parsers (Iterable[AsyncParser]): The parsers of the platforms.
+        keyword (str): The keyword to search for.
+        count (int): The number of vacancies to retrieve per platform.
+
+    Returns:
+        Dict[str, List[Vacancy]]: The vacancies by platform.
+    """
+    parsers = list(parsers)
+    results = await asyncio.gather(
+        *(parser.vacancies(keyword, count) for parser in parsers)
+    )
+    return {
+        parser.platform: vacancies
+        for parser, vacancies in zip(parsers, results)
+    }
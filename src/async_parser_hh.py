@@ -0,0 +1,117 @@
+""" Asyncio parser implementation for the HH.ru website. """
+from typing import TYPE_CHECKING, AsyncIterator
+
+from src.async_parser import AsyncParser, AsyncParserMixin
+from src.constants import ASYNC_MAX_IN_FLIGHT
+from src.decoders import HHPageDecoder
+from src.metrics import METRICS
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+from src.response_cache import ResponseCache
+from src.vacancy import Vacancy
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncHHParser(AsyncParser, AsyncParserMixin):
+    """
+    Asyncio parser implementation for the HH.ru website.
+    """
+
+    platform: str = HHParser.platform
+    items_key: str = HHParser.items_key
+    to_vacancy = staticmethod(HHParser.to_vacancy)
+
+    def __init__(
+            self, max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+            session: 'aiohttp.ClientSession | None' = None,
+            cache: ResponseCache | None = None,
+            rate_limiter: RateLimiter | None = None
+    ):
+        super().__init__(
+            max_in_flight=max_in_flight, session=session, cache=cache,
+            rate_limiter=rate_limiter
+        )
+        self.per_page: int = 20
+        self.url: str = 'https://api.hh.ru/vacancies'
+        self.headers: dict = {
+            'HHParser-User-Agent': 'Vacant/1.0 (mr.saatchyan@yandex.com)'
+        }
+        self.parameters: dict = {
+            'per_page': self.per_page,
+            'text': '',
+            'search_field': 'name'
+        }
+        self.decoder: HHPageDecoder = HHPageDecoder(
+            self.to_vacancy, self.codec
+        )
+
+    async def parse_vacancies(self, keyword: str, count: int) -> list[dict]:
+        """
+        Parses vacancies from the HH.ru website based on the given keyword
+        and count.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            list[dict]: The parsed vacancies.
+        """
+        return [
+            vacancy async for vacancy in self.iter_vacancies(keyword, count)
+        ]
+
+    async def iter_vacancies(
+            self, keyword: str, count: int
+    ) -> AsyncIterator[dict]:
+        """
+        Yields vacancies from the HH.ru website page by page.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            AsyncIterator[dict]: The raw vacancies.
+        """
+        parameters = {**self.parameters, **self.keyword_parameters(keyword)}
+        async for response in self.iter_pages(
+                self.count_pages(count), parameters
+        ):
+            for vacancy in response[self.items_key]:
+                yield vacancy
+
+    async def stream_vacancies(
+            self, keyword: str, count: int
+    ) -> AsyncIterator[Vacancy]:
+        """
+        Yields Vacancy objects from the HH.ru website page by page.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            AsyncIterator[Vacancy]: The vacancy objects.
+        """
+        parameters = {**self.parameters, **self.keyword_parameters(keyword)}
+        async for vacancies in self.iter_pages(
+                self.count_pages(count), parameters, self.decoder.decode
+        ):
+            METRICS.increment('vacancies_total', len(vacancies))
+            for vacancy in vacancies:
+                yield vacancy
+
+    def keyword_parameters(self, keyword: str) -> dict:
+        """
+        Returns the HH.ru parameters that search for a keyword.
+
+        Args:
+            keyword (str): The keyword to search for.
+
+        Returns:
+            dict: The request parameters.
+        """
+        return {'text': keyword if keyword else ''}
@@ -0,0 +1,300 @@
+""" Multi-keyword batch search module"""
+import queue
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Deque, Dict, Iterable, Iterator, List, Tuple
+
+import requests
+
+from src.constants import (
+    BATCH_MAX_WORKERS, BATCH_PLATFORM_CONCURRENCY, BATCH_RESULTS_PATH
+)
+from src.decoders import DECODE_ERRORS
+from src.file_handler_jsonl import JSONLFileHandler
+from src.json_codec import JSONCodec
+from src.parser import Parser
+from src.parser_hh import HHParser
+from src.parser_superjob import SuperJobParser
+from src.vacancy import Vacancy
+from src.vacancy_filter import SalaryRangeFilter
+
+
+class SearchQuery:
+    """
+    A single search of a batch.
+    """
+
+    __slots__ = ('keyword', 'platforms', 'count', 'salary_min_max')
+
+    def __init__(
+            self, keyword: str, platforms: Collection[str] | None = None,
+            count: int = 100, salary_min_max: List[int | None] | None = None
+    ):
+        """
+        Initializes the query.
+
+        Args:
+            keyword (str): The keyword to search for.
+            platforms (Collection[str] | None): The platform names, e.g.
+            'HH.ru'. Defaults to every platform of the batch.
+            count (int): The number of vacancies to fetch per platform.
+            salary_min_max (List[int | None] | None): The salary range
+            [min_salary, max_salary] for filtering.
+        """
+        self.keyword: str = keyword
+        self.platforms: Collection[str] | None = platforms
+        self.count: int = count
+        self.salary_min_max: List[int | None] = (
+            salary_min_max if salary_min_max is not None else [None, None]
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'SearchQuery({self.keyword!r}, {self.platforms!r}, '
+            f'{self.count!r}, {self.salary_min_max!r})'
+        )
+
+
+class _Stream:
+    """
+    The pagination state of a query on one platform.
+    """
+
+    __slots__ = (
+        'query', 'platform', 'parameters', 'pages', 'next_page', 'remaining'
+    )
+
+    def __init__(
+            self, query: SearchQuery, platform: str, parser: Parser
+    ):
+        self.query: SearchQuery = query
+        self.platform: str = platform
+        self.parameters: dict = {
+            **parser.parameters, **parser.keyword_parameters(query.keyword)
+        }
+        self.pages: int = parser.count_pages(query.count)
+        self.next_page: int = 0
+        self.remaining: int = query.count
+
+
+class BatchSearch:
+    """
+    Runs many searches through one shared pagination scheduler.
+
+    The page requests of all queries go through a single worker pool.
+    Every platform has its own cap of requests in flight, so a slow or
+    strictly limited platform never occupies the whole pool, and one
+    parser (one connection pool) per platform serves all queries. Pages
+    of a query are requested in order; its stream stops at the first
+    short page or once count vacancies were collected.
+
+    Results are yielded as pages arrive, tagged with their query.
+    """
+
+    def __init__(
+            self, parsers: Dict[str, Parser] | None = None,
+            max_workers: int = BATCH_MAX_WORKERS,
+            concurrency: Dict[str, int] | None = None
+    ):
+        """
+        Initializes the batch search.
+
+        Args:
+            parsers (Dict[str, Parser] | None): The parsers by platform
+            name. Defaults to HH.ru and SuperJob.ru parsers.
+            max_workers (int): The size of the shared worker pool.
+            concurrency (Dict[str, int] | None): The maximum number of
+            requests in flight per platform. Defaults to
+            BATCH_PLATFORM_CONCURRENCY, 1 for platforms not listed.
+        """
+        self.concurrency: Dict[str, int] = (
+            concurrency if concurrency is not None
+            else BATCH_PLATFORM_CONCURRENCY
+        )
+        if parsers is None:
+            parsers = {
+                parser_class.platform: parser_class(
+                    pool_size=self.concurrency.get(parser_class.platform, 1)
+                )
+                for parser_class in (HHParser, SuperJobParser)
+            }
+        self.parsers: Dict[str, Parser] = parsers
+        self.max_workers: int = max(1, max_workers)
+        self.salary_filter: SalaryRangeFilter = SalaryRangeFilter()
+
+    def close(self) -> None:
+        """
+        Closes the parsers and their pooled connections.
+
+        Returns:
+            None
+        """
+        for parser in self.parsers.values():
+            parser.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _streams(
+            self, queries: Iterable[SearchQuery]
+    ) -> Dict[str, Deque[_Stream]]:
+        streams = {platform: deque() for platform in self.parsers}
+        for query in queries:
+            for platform, parser in self.parsers.items():
+                if query.platforms is not None \
+                        and platform not in query.platforms:
+                    continue
+                stream = _Stream(query, platform, parser)
+                if stream.pages:
+                    streams[platform].append(stream)
+        return streams
+
+    def _filter(
+            self, stream: _Stream, vacancies: List[Vacancy]
+    ) -> List[Vacancy]:
+        salary_min_max = stream.query.salary_min_max
+        if salary_min_max.count(None) != 2:
+            vacancies = list(
+                self.salary_filter.iter_filtered_vacancies(
+                    vacancies, salary_min_max
+                )
+            )
+        vacancies = vacancies[:stream.remaining]
+        stream.remaining -= len(vacancies)
+        return vacancies
+
+    def run(
+            self, queries: Iterable[SearchQuery]
+    ) -> Iterator[Tuple[SearchQuery, List[Vacancy]]]:
+        """
+        Runs the queries and yields their vacancies page by page.
+
+        Pages are yielded in the order they arrive. A query whose request
+        fails after all retries, or whose response cannot be decoded, is
+        reported on stderr and dropped, the other queries go on.
+
+        Args:
+            queries (Iterable[SearchQuery]): The queries to run.
+
+        Returns:
+            Iterator[Tuple[SearchQuery, List[Vacancy]]]: The query and the
+            filtered vacancies of every fetched page.
+        """
+        waiting = self._streams(queries)
+        in_flight = {platform: 0 for platform in self.parsers}
+        futures = set()
+        completed = queue.SimpleQueue()
+
+        def schedule(executor: ThreadPoolExecutor) -> None:
+            for platform, streams in waiting.items():
+                parser = self.parsers[platform]
+                limit = self.concurrency.get(platform, 1)
+                while streams and in_flight[platform] < limit:
+                    stream = streams[0]
+                    if stream.next_page >= stream.pages:
+                        streams.popleft()
+                        continue
+                    page = stream.next_page
+                    future = executor.submit(
+                        parser.fetch_page, page, stream.parameters,
+                        parser.decoder.decode
+                    )
+                    future.add_done_callback(
+                        lambda done, stream=stream, page=page: completed.put(
+                            (stream, page, done)
+                        )
+                    )
+                    futures.add(future)
+                    in_flight[platform] += 1
+                    stream.next_page += 1
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            schedule(executor)
+            while futures:
+                stream, page, future = completed.get()
+                futures.discard(future)
+                in_flight[stream.platform] -= 1
+                vacancies = []
+
+                # Pages past the end of a stream are dropped.
+                if page < stream.pages:
+                    try:
+                        vacancies = future.result()
+                    except (requests.RequestException, *DECODE_ERRORS) \
+                            as error:
+                        print(
+                            f'Query "{stream.query.keyword}" failed on '
+                            f'{stream.platform}: {error!r}',
+                            file=sys.stderr
+                        )
+                        stream.pages = 0
+
+                if len(vacancies) < self.parsers[stream.platform].per_page:
+                    stream.pages = min(stream.pages, page + 1)
+                vacancies = self._filter(stream, vacancies)
+                if not stream.remaining:
+                    stream.pages = 0
+                schedule(executor)
+
+                if vacancies:
+                    yield stream.query, vacancies
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def search(
+            self, queries: Iterable[SearchQuery]
+    ) -> List[Tuple[SearchQuery, Dict[str, List[Vacancy]]]]:
+        """
+        Runs the queries and collects their vacancies.
+
+        Args:
+            queries (Iterable[SearchQuery]): The queries to run.
+
+        Returns:
+            List[Tuple[SearchQuery, Dict[str, List[Vacancy]]]]: Every
+            query with its vacancies by platform, in query order.
+        """
+        queries = list(queries)
+        results = {id(query): {} for query in queries}
+        for query, vacancies in self.run(queries):
+            for vacancy in vacancies:
+                results[id(query)].setdefault(
+                    vacancy.platform, []
+                ).append(vacancy)
+        return [(query, results[id(query)]) for query in queries]
+
+
+def save_results(
+        results: Iterable[Tuple[SearchQuery, List[Vacancy]]],
+        file_path: str = BATCH_RESULTS_PATH,
+        codec: JSONCodec | None = None
+) -> int:
+    """
+    Adds batch results to a JSON Lines store as they arrive.
+
+    Every page is appended with one write through JSONLFileHandler, each
+    vacancy with an additional 'query' key holding the keyword of its
+    query. Like any store, the file keeps one live record per vacancy: a
+    vacancy found by several queries is tagged with the last of them.
+
+    Args:
+        results (Iterable[Tuple[SearchQuery, List[Vacancy]]]): The results,
+        e.g. BatchSearch.run.
+        file_path (str): The path of the JSON Lines file.
+        codec (JSONCodec | None): The JSON codec. Defaults to the fastest
+        installed one.
+
+    Returns:
+        int: The number of written vacancies.
+    """
+    handler = JSONLFileHandler(file_path, codec=codec)
+    written = 0
+    for query, vacancies in results:
+        handler.add_vacancies(vacancies, {'query': query.keyword})
+        written += len(vacancies)
+    return written
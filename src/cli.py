@@ -0,0 +1,302 @@
+""" Non-interactive command line interface module"""
+import argparse
+import csv
+import io
+import os
+import sys
+from typing import BinaryIO, Iterable, List, Sequence
+
+import requests
+
+from src.constants import CONVERSION_THRESHOLD
+from src.decoders import DECODE_ERRORS
+from src.dedup import Deduplicator
+from src.file_handler_json import JSONFileHandler
+from src.file_handler_jsonl import JSONLFileHandler
+from src.file_handler_sqlite import COLUMNS, SQLiteFileHandler
+from src.json_codec import get_codec
+from src.main import stream_vacancies
+from src.metrics import METRICS
+from src.vacancy import Vacancy
+
+PLATFORM_KEYS = {
+    'hh': '1',
+    'superjob': '2'
+}
+
+PLATFORM_NAMES = {
+    'hh': 'HH.ru',
+    'superjob': 'SuperJob.ru'
+}
+
+STORE_EXTENSIONS = ('.json', '.jsonl', '.db', '.sqlite', '.sqlite3')
+
+
+def store_path(value: str) -> str:
+    """
+    Validates the --store argument.
+
+    Args:
+        value (str): The path of the store.
+
+    Returns:
+        str: The path.
+
+    Raises:
+        argparse.ArgumentTypeError: If the extension is not supported.
+    """
+    if not value.endswith(STORE_EXTENSIONS):
+        raise argparse.ArgumentTypeError(
+            f'unsupported store {value}, expected one of '
+            f'{", ".join(STORE_EXTENSIONS)}'
+        )
+    return value
+
+
+def parse_arguments(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Args:
+        argv (Sequence[str] | None): The arguments without the program
+        name. Defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog='vacant',
+        description='Search HH.ru and SuperJob.ru vacancies and write them '
+                    'to stdout as JSON Lines or CSV.'
+    )
+    parser.add_argument(
+        'keyword', nargs='?', default='',
+        help='the keyword to search for in vacancy titles'
+    )
+    parser.add_argument(
+        '-p', '--platform', dest='platforms', action='append',
+        choices=sorted(PLATFORM_KEYS),
+        help='the platform to search, may be repeated (default: all)'
+    )
+    parser.add_argument(
+        '-n', '--count', type=int, default=100,
+        help='the number of vacancies to fetch per platform (default: 100)'
+    )
+    parser.add_argument(
+        '--salary-min', type=int, help='the minimum salary'
+    )
+    parser.add_argument(
+        '--salary-max', type=int, help='the maximum salary'
+    )
+    parser.add_argument(
+        '-w', '--workers', type=int, default=1,
+        help='the number of pages fetched concurrently per platform '
+             '(default: 1)'
+    )
+    parser.add_argument(
+        '--processes', type=int, default=0,
+        help='the number of processes converting pages of pulls of at '
+             f'least {CONVERSION_THRESHOLD} vacancies, 0 to convert them '
+             'in-process (default: 0)'
+    )
+    parser.add_argument(
+        '-f', '--format', choices=('jsonl', 'csv'), default='jsonl',
+        help='the output format (default: jsonl)'
+    )
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='the output file, "-" for stdout (default: -)'
+    )
+    parser.add_argument(
+        '-s', '--store', type=store_path,
+        help='also save the vacancies to a store, picked by extension: '
+             '.json, .jsonl or .db/.sqlite'
+    )
+    parser.add_argument(
+        '--dedup', action='store_true',
+        help='drop postings already returned for this or another platform'
+    )
+    parser.add_argument(
+        '--metrics',
+        help='record stage timings and counters and write them to this '
+             'file when the run ends: JSON for .json files, Prometheus text '
+             'otherwise'
+    )
+    return parser.parse_args(argv)
+
+
+def write_jsonl(vacancies: Iterable[Vacancy], output: BinaryIO) -> int:
+    """
+    Writes vacancies as JSON Lines, one line as soon as each arrives.
+
+    Args:
+        vacancies (Iterable[Vacancy]): The vacancies to write.
+        output (BinaryIO): The binary output stream.
+
+    Returns:
+        int: The number of written vacancies.
+    """
+    codec = get_codec()
+    written = 0
+    for vacancy in vacancies:
+        output.write(codec.dumps(vacancy.to_dict(), compact=True) + b'\n')
+        written += 1
+    return written
+
+
+def write_csv(vacancies: Iterable[Vacancy], output: BinaryIO) -> int:
+    """
+    Writes vacancies as CSV with a header row, one row as soon as each
+    arrives.
+
+    Args:
+        vacancies (Iterable[Vacancy]): The vacancies to write.
+        output (BinaryIO): The binary output stream.
+
+    Returns:
+        int: The number of written vacancies.
+    """
+    text = io.TextIOWrapper(
+        output, encoding='utf-8', newline='', write_through=True
+    )
+    writer = csv.DictWriter(text, fieldnames=COLUMNS)
+    writer.writeheader()
+    written = 0
+    try:
+        for vacancy in vacancies:
+            writer.writerow(vacancy.to_dict())
+            written += 1
+    finally:
+        # The wrapper must not close the underlying stream.
+        text.detach()
+    return written
+
+
+WRITERS = {
+    'jsonl': write_jsonl,
+    'csv': write_csv
+}
+
+
+def save_to_store(file_path: str, vacancies: List[Vacancy]) -> None:
+    """
+    Adds vacancies to the store at file_path with a single write.
+
+    Args:
+        file_path (str): The path of a .json, .jsonl or .db store.
+        vacancies (List[Vacancy]): The vacancies to add.
+
+    Returns:
+        None
+    """
+    if file_path.endswith('.jsonl'):
+        JSONLFileHandler(file_path).add_vacancies(vacancies)
+    elif file_path.endswith('.json'):
+        JSONFileHandler(file_path).add_vacancies_to_json(vacancies)
+    else:
+        with SQLiteFileHandler(file_path) as handler:
+            handler.add_vacancies(vacancies)
+
+
+def collect(vacancies: Iterable[Vacancy], into: List[Vacancy]):
+    """
+    Passes vacancies through, appending each to a list.
+
+    Args:
+        vacancies (Iterable[Vacancy]): The vacancies.
+        into (List[Vacancy]): The list to append to.
+
+    Returns:
+        Iterator[Vacancy]: The same vacancies.
+    """
+    for vacancy in vacancies:
+        into.append(vacancy)
+        yield vacancy
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Runs a search with the command line arguments.
+
+    Vacancies are written as they arrive, platform after platform, and
+    are never collected unless they have to be saved to a store.
+
+    Args:
+        argv (Sequence[str] | None): The arguments without the program
+        name. Defaults to sys.argv.
+
+    Returns:
+        int: The exit status.
+    """
+    arguments = parse_arguments(argv)
+    if arguments.metrics:
+        METRICS.enabled = True
+        try:
+            return _run(arguments)
+        finally:
+            METRICS.export(arguments.metrics)
+    return _run(arguments)
+
+
+def _run(arguments: argparse.Namespace) -> int:
+    platforms = arguments.platforms or sorted(PLATFORM_KEYS)
+    selected_platforms = {
+        PLATFORM_KEYS[platform]: PLATFORM_NAMES[platform]
+        for platform in platforms
+    }
+
+    streams = stream_vacancies(
+        selected_platforms, arguments.count, arguments.keyword,
+        [arguments.salary_min, arguments.salary_max],
+        max_workers=arguments.workers, processes=arguments.processes,
+        deduplicator=Deduplicator() if arguments.dedup else None
+    )
+
+    def chained():
+        try:
+            for stream in streams.values():
+                yield from stream
+        finally:
+            for stream in streams.values():
+                stream.close()
+
+    vacancies = chained()
+    stored = []
+    if arguments.store:
+        vacancies = collect(vacancies, stored)
+
+    to_stdout = arguments.output == '-'
+    output = sys.stdout.buffer if to_stdout else open(arguments.output, 'wb')
+    try:
+        WRITERS[arguments.format](vacancies, output)
+        output.flush()
+    except BrokenPipeError:
+        # The reader went away, e.g. `vacant python | head`. Point stdout
+        # at devnull so the interpreter does not fail flushing it on exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except requests.RequestException as error:
+        print(f'Request failed: {error}', file=sys.stderr)
+        return 1
+    except DECODE_ERRORS as error:
+        print(f'Invalid response: {error!r}', file=sys.stderr)
+        return 1
+    finally:
+        vacancies.close()
+        if not to_stdout:
+            output.close()
+
+    if arguments.store:
+        save_to_store(arguments.store, stored)
+    return 0
+
+
+def run() -> None:
+    """
+    Console script entry point.
+    """
+    sys.exit(main())
+
+
+if __name__ == '__main__':
+    run()
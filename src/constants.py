@@ -4,3 +4,43 @@ import os
 SUPER_JOB_API_SECRET = os.environ.get('SUPER_JOB_API_SECRET')
 
 FILE_PATH = 'vacancies.json'
+JSONL_FILE_PATH = 'vacancies.jsonl'
+SQLITE_FILE_PATH = 'vacancies.db'
+JSONL_COMPACT_MIN_RECORDS = 1000
+JSONL_COMPACT_RATIO = 0.5
+
+CACHE_DIR = '.cache/responses'
+CACHE_TTL = 15 * 60
+CACHE_MAX_ENTRIES = 1000
+
+REQUEST_TIMEOUT = (5, 30)
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+DEFAULT_RATE_LIMIT = 5.0
+RATE_LIMITS = {
+    'api.hh.ru': 10.0,
+    'api.superjob.ru': 2.0
+}
+
+SYNC_STATE_PATH = 'sync_state.json'
+SYNC_MAX_COUNT = 2000
+
+BATCH_MAX_WORKERS = 8
+BATCH_PLATFORM_CONCURRENCY = {
+    'HH.ru': 4,
+    'SuperJob.ru': 2
+}
+BATCH_RESULTS_PATH = 'batch_results.jsonl'
+
+CONVERSION_THRESHOLD = 5000
+CONVERSION_CHUNK_PAGES = 50
+
+ASYNC_MAX_IN_FLIGHT = 10
+ASYNC_MAX_CONNECTIONS = 100
+
+METRICS_ENABLED = os.environ.get('VACANT_METRICS', '') not in ('', '0')
+METRICS_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
@@ -0,0 +1,207 @@
+""" Schema-driven vacancy decoders module"""
+from abc import ABC, abstractmethod
+from json import JSONDecodeError
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from src.json_codec import JSONCodec, get_codec
+from src.metrics import METRICS
+from src.vacancy import Vacancy
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class HHSalary(msgspec.Struct):
+        salary_from: int | None = msgspec.field(name='from', default=None)
+        salary_to: int | None = msgspec.field(name='to', default=None)
+        currency: str | None = None
+
+    class HHSnippet(msgspec.Struct):
+        requirement: str | None = None
+        responsibility: str | None = None
+
+    class HHEmployer(msgspec.Struct):
+        name: str | None = None
+
+    class HHItem(msgspec.Struct):
+        id: str
+        name: str
+        alternate_url: str
+        snippet: HHSnippet
+        salary: HHSalary | None = None
+        employer: HHEmployer | None = None
+
+    class HHPage(msgspec.Struct):
+        items: List[HHItem]
+
+    class SuperJobObject(msgspec.Struct):
+        id: int
+        profession: str
+        link: str
+        payment_from: int | None = None
+        payment_to: int | None = None
+        currency: str | None = None
+        vacancyRichText: str | None = None
+        firm_name: str | None = None
+
+    class SuperJobPage(msgspec.Struct):
+        objects: List[SuperJobObject]
+
+
+# The errors raised for malformed or unexpected documents: every codec
+# raises json.JSONDecodeError, and the typed decoders msgspec.DecodeError,
+# of which msgspec.ValidationError is a subclass.
+DECODE_ERRORS: Tuple[Type[Exception], ...] = (
+    (JSONDecodeError, msgspec.DecodeError) if msgspec is not None
+    else (JSONDecodeError,)
+)
+
+
+class VacancyDecoder(ABC):
+    """
+    Abstract base class for decoders of raw JSON bytes into vacancies.
+
+    With msgspec installed, documents are decoded into typed structs that
+    declare only the fields a Vacancy needs: everything else is skipped
+    by the parser without being materialized, and no dictionaries are
+    built. Otherwise the bytes are decoded with the given codec and the
+    resulting dictionaries are converted.
+    """
+
+    def __init__(
+            self, convert: Callable[[Dict[str, Any]], Vacancy],
+            codec: JSONCodec | None = None
+    ):
+        """
+        Initializes the decoder.
+
+        Args:
+            convert (Callable[[Dict[str, Any]], Vacancy]): Converts a
+            decoded dictionary on the fallback path.
+            codec (JSONCodec | None): The codec of the fallback path.
+            Defaults to the fastest installed one.
+        """
+        self.convert: Callable[[Dict[str, Any]], Vacancy] = convert
+        self.codec: JSONCodec = codec if codec is not None else get_codec()
+
+    @abstractmethod
+    def decode(self, data: bytes) -> List[Vacancy]:
+        """
+        Decodes a JSON document into vacancies.
+
+        Args:
+            data (bytes): The JSON document.
+
+        Returns:
+            List[Vacancy]: The vacancies in document order.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON or, on
+            the fallback path, lacks a required field.
+            msgspec.DecodeError: If the document does not match the
+            schema, with msgspec installed.
+        """
+        pass
+
+    def _convert_document(self, data: bytes, key: str) -> List[Vacancy]:
+        """
+        Decodes a page with the codec and converts its vacancies.
+
+        Args:
+            data (bytes): The JSON document.
+            key (str): The key of the vacancy list.
+
+        Returns:
+            List[Vacancy]: The vacancies in document order.
+        """
+        try:
+            with METRICS.timer('json_decode_seconds'):
+                items = self.codec.loads(data)[key]
+            with METRICS.timer('vacancy_build_seconds'):
+                return [self.convert(item) for item in items]
+        except (KeyError, TypeError) as error:
+            raise JSONDecodeError(
+                f'Unexpected document: {error!r}', '', 0
+            ) from None
+
+
+class HHPageDecoder(VacancyDecoder):
+    """
+    Decodes a page of the HH.ru vacancies API.
+    """
+
+    def __init__(
+            self, convert: Callable[[Dict[str, Any]], Vacancy],
+            codec: JSONCodec | None = None
+    ):
+        super().__init__(convert, codec)
+        self._decoder = (
+            msgspec.json.Decoder(HHPage) if msgspec is not None else None
+        )
+
+    @staticmethod
+    def _to_vacancy(item: 'HHItem') -> Vacancy:
+        salary = item.salary
+        snippet = item.snippet
+        return Vacancy(
+            platform='HH.ru',
+            vacancy_id=item.id,
+            title=item.name,
+            url=item.alternate_url,
+            salary_from=salary.salary_from if salary else None,
+            salary_to=salary.salary_to if salary else None,
+            currency=salary.currency if salary else None,
+            description=snippet.requirement if snippet.requirement
+            else snippet.responsibility,
+            employer=item.employer.name if item.employer else None
+        )
+
+    def decode(self, data: bytes) -> List[Vacancy]:
+        if self._decoder is None:
+            return self._convert_document(data, 'items')
+
+        with METRICS.timer('json_decode_seconds'):
+            items = self._decoder.decode(data).items
+        with METRICS.timer('vacancy_build_seconds'):
+            return [self._to_vacancy(item) for item in items]
+
+
+class SuperJobPageDecoder(VacancyDecoder):
+    """
+    Decodes a page of the SuperJob vacancies API.
+    """
+
+    def __init__(
+            self, convert: Callable[[Dict[str, Any]], Vacancy],
+            codec: JSONCodec | None = None
+    ):
+        super().__init__(convert, codec)
+        self._decoder = (
+            msgspec.json.Decoder(SuperJobPage) if msgspec is not None
+            else None
+        )
+
+    @staticmethod
+    def _to_vacancy(item: 'SuperJobObject') -> Vacancy:
+        return Vacancy(
+            platform='SuperJob.ru',
+            vacancy_id=item.id,
+            title=item.profession,
+            url=item.link,
+            salary_from=item.payment_from,
+            salary_to=item.payment_to,
+            currency=item.currency,
+            description=item.vacancyRichText,
+            employer=item.firm_name
+        )
+
+    def decode(self, data: bytes) -> List[Vacancy]:
+        if self._decoder is None:
+            return self._convert_document(data, 'objects')
+
+        with METRICS.timer('json_decode_seconds'):
+            items = self._decoder.decode(data).objects
+        with METRICS.timer('vacancy_build_seconds'):
+            return [self._to_vacancy(item) for item in items]
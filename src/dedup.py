@@ -0,0 +1,328 @@
+""" Vacancy de-duplication module"""
+import hashlib
+import random
+import threading
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from urllib.parse import urlsplit
+
+from src.inverted_index import tokenize
+from src.vacancy import Vacancy
+
+
+def normalize_text(text: str | None) -> str:
+    """
+    Normalizes text for comparison: markup, punctuation and case are
+    dropped and 'ё' is folded to 'е'.
+
+    Args:
+        text (str | None): The text to normalize.
+
+    Returns:
+        str: The normalized words separated by single spaces.
+    """
+    return ' '.join(tokenize(text))
+
+
+def normalize_url(url: str | None) -> str:
+    """
+    Normalizes a vacancy URL: scheme, 'www.', query, fragment and the
+    trailing slash are dropped.
+
+    Args:
+        url (str | None): The URL to normalize.
+
+    Returns:
+        str: The host and path, or an empty string if url is empty.
+    """
+    if not url:
+        return ''
+    parts = urlsplit(url.strip().lower())
+    host = parts.netloc.removeprefix('www.')
+    return f'{host}{parts.path.rstrip("/")}'
+
+
+# Platform spellings of one currency: HH.ru reports roubles as 'RUR',
+# SuperJob.ru as 'rub'.
+CURRENCY_ALIASES: Dict[str, str] = {'rur': 'rub'}
+
+
+def normalize_currency(currency: str | None) -> str:
+    """
+    Normalizes a currency code: case is dropped and platform spellings of
+    one currency are mapped to one code.
+
+    Args:
+        currency (str | None): The currency code.
+
+    Returns:
+        str: The normalized code, or an empty string if currency is empty.
+    """
+    code = (currency or '').strip().lower()
+    return CURRENCY_ALIASES.get(code, code)
+
+
+def _digest(*parts: object) -> bytes:
+    return hashlib.blake2b(
+        '\x1f'.join(str(part) for part in parts).encode('utf-8'),
+        digest_size=16
+    ).digest()
+
+
+def fingerprint(vacancy: Vacancy) -> bytes:
+    """
+    Computes the content fingerprint of a vacancy.
+
+    Two postings with the same normalized title, employer and salary get
+    the same fingerprint, whatever their platform, ID or URL. The
+    fingerprint identifies a posting republished on another platform, it
+    does not tell apart postings of one platform.
+
+    A salary bound of 0, which SuperJob.ru reports for a missing bound, is
+    treated as missing, and the currency is ignored when both bounds are.
+
+    Args:
+        vacancy (Vacancy): The vacancy.
+
+    Returns:
+        bytes: A 16-byte digest.
+    """
+    salary_from = vacancy.salary_from or None
+    salary_to = vacancy.salary_to or None
+    currency = (
+        normalize_currency(vacancy.currency)
+        if salary_from is not None or salary_to is not None else ''
+    )
+    return _digest(
+        normalize_text(vacancy.title),
+        normalize_text(vacancy.employer),
+        salary_from,
+        salary_to,
+        currency
+    )
+
+
+class MinHasher:
+    """
+    MinHash signatures of character shingles, for estimating the Jaccard
+    similarity of short texts such as titles.
+
+    Shingles are hashed once with a 64-bit BLAKE2 digest, each signature
+    position then takes the minimum of the hashes XOR-ed with its own
+    random mask, which keeps the inner loop in C.
+    """
+
+    def __init__(
+            self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1
+    ):
+        """
+        Initializes the hash functions.
+
+        Args:
+            num_perm (int): The number of hash functions, i.e. the length
+            of the signatures.
+            shingle_size (int): The number of characters per shingle.
+            seed (int): The seed of the hash function masks.
+        """
+        generator = random.Random(seed)
+        self.num_perm: int = num_perm
+        self.shingle_size: int = shingle_size
+        self._masks: List[int] = [
+            generator.getrandbits(64) for _ in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> Set[str]:
+        """
+        Splits text into overlapping character shingles.
+
+        Args:
+            text (str): The normalized text.
+
+        Returns:
+            Set[str]: The shingles, or the text itself if it is shorter
+            than one shingle.
+        """
+        size = self.shingle_size
+        if len(text) <= size:
+            return {text}
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        Computes the MinHash signature of a text.
+
+        Args:
+            text (str): The normalized text.
+
+        Returns:
+            Tuple[int, ...]: num_perm minimum hash values.
+        """
+        hashes = [
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode('utf-8'), digest_size=8)
+                .digest(), 'little'
+            )
+            for shingle in self.shingles(text)
+        ]
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self._masks)
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """
+        Estimates the Jaccard similarity of two signatures.
+
+        Args:
+            first (Tuple[int, ...]): A signature.
+            second (Tuple[int, ...]): Another signature of the same length.
+
+        Returns:
+            float: The share of equal positions.
+        """
+        equal = sum(1 for a, b in zip(first, second) if a == b)
+        return equal / len(first)
+
+
+class Deduplicator:
+    """
+    Streaming de-duplication of vacancies.
+
+    A vacancy is a duplicate if a vacancy with the same platform and ID or
+    the same normalized URL was seen before, or if a vacancy of another
+    platform had the same content fingerprint. With near_duplicates set,
+    postings whose title and employer are similar (MinHash estimate of at
+    least threshold) to a posting of another platform and whose salary is
+    equal are dropped as well; candidates are found with locality
+    sensitive hashing over signature bands keyed by salary, so each check
+    costs a few dictionary lookups instead of a scan.
+
+    Content is only compared across platforms: within a platform, postings
+    with different IDs are distinct even if their title, employer and
+    salary are equal, e.g. two openings of one employer.
+
+    Only digests (and signatures in near-duplicate mode) of unique
+    postings are kept. The first posting seen wins. The instance may be
+    shared by streams consumed in different threads.
+    """
+
+    def __init__(
+            self, near_duplicates: bool = False, threshold: float = 0.8,
+            num_perm: int = 64, bands: int = 16
+    ):
+        """
+        Initializes an empty de-duplicator.
+
+        Args:
+            near_duplicates (bool): Also drop similar postings.
+            threshold (float): The minimum estimated similarity of title
+            and employer for near-duplicates.
+            num_perm (int): The length of the MinHash signatures.
+            bands (int): The number of LSH bands, num_perm must be
+            divisible by it.
+        """
+        if num_perm % bands:
+            raise ValueError('num_perm must be divisible by bands')
+        self.near_duplicates: bool = near_duplicates
+        self.threshold: float = threshold
+        self.duplicates: int = 0
+        self._unique: int = 0
+        self._seen: Set[bytes] = set()
+        self._fingerprints: Dict[bytes, Set[str]] = {}
+        self._hasher = MinHasher(num_perm) if near_duplicates else None
+        self._rows: int = num_perm // bands
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        self._signatures: List[Tuple[str, Tuple[int, ...]]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._unique
+
+    def _bands(
+            self, signature: Tuple[int, ...], salary: int
+    ) -> List[Tuple[int, bytes]]:
+        rows = self._rows
+        return [
+            (band, _digest(salary, *signature[start:start + rows]))
+            for band, start in enumerate(range(0, len(signature), rows))
+        ]
+
+    def _is_near_duplicate(
+            self, platform: str, signature: Tuple[int, ...],
+            bands: List[Tuple[int, bytes]]
+    ) -> bool:
+        checked = set()
+        for band in bands:
+            for candidate in self._buckets.get(band, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                candidate_platform, candidate_signature = (
+                    self._signatures[candidate]
+                )
+                if candidate_platform != platform and MinHasher.similarity(
+                        signature, candidate_signature
+                ) >= self.threshold:
+                    return True
+        return False
+
+    def is_duplicate(self, vacancy: Vacancy) -> bool:
+        """
+        Checks whether a vacancy duplicates one seen before, and remembers
+        it if it does not.
+
+        Args:
+            vacancy (Vacancy): The vacancy to check.
+
+        Returns:
+            bool: True if the vacancy is a duplicate.
+        """
+        keys = [_digest('id', vacancy.platform, vacancy.vacancy_id)]
+        content = fingerprint(vacancy)
+        url = normalize_url(vacancy.url)
+        if url:
+            keys.append(_digest('url', url))
+
+        signature = bands = None
+        if self._hasher is not None:
+            signature = self._hasher.signature(
+                f'{normalize_text(vacancy.title)} '
+                f'{normalize_text(vacancy.employer)}'
+            )
+            bands = self._bands(signature, vacancy.avg_salary)
+
+        with self._lock:
+            platforms = self._fingerprints.get(content, ())
+            duplicate = (
+                any(key in self._seen for key in keys)
+                or any(other != vacancy.platform for other in platforms)
+                or signature is not None and self._is_near_duplicate(
+                    vacancy.platform, signature, bands
+                )
+            )
+            if duplicate:
+                self.duplicates += 1
+                return True
+
+            self._seen.update(keys)
+            self._fingerprints.setdefault(content, set()).add(
+                vacancy.platform
+            )
+            self._unique += 1
+            if signature is not None:
+                position = len(self._signatures)
+                self._signatures.append((vacancy.platform, signature))
+                for band in bands:
+                    self._buckets.setdefault(band, []).append(position)
+            return False
+
+    def filter(self, vacancies: Iterable[Vacancy]) -> Iterator[Vacancy]:
+        """
+        Lazily yields the vacancies that are not duplicates.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies to de-duplicate.
+
+        Returns:
+            Iterator[Vacancy]: The unique vacancies in input order.
+        """
+        for vacancy in vacancies:
+            if not self.is_duplicate(vacancy):
+                yield vacancy
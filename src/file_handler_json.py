@@ -2,65 +2,328 @@
 This class handles the JSON files containing vacancies.
 """
 
-import json
+import os
+import sys
+import tempfile
 from json import JSONDecodeError
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Tuple
 
 from src.constants import FILE_PATH
 from src.file_handler import FileHandler
+from src.file_lock import FileLock
+from src.filter_pipeline import FilterPipeline
+from src.inverted_index import InvertedIndex
+from src.json_codec import JSONCodec, get_codec
+from src.metrics import METRICS
 from src.vacancy import Vacancy
-from src.vacancy_filter import SalaryRangeFilter
 
 
 class JSONFileHandler(FileHandler):
     """
     A class that handles JSON files containing vacancies.
+
+    The file holds vacancies grouped by platform. In memory they are kept
+    in a primary-key index {platform: {vacancy_id: vacancy}}, so lookups
+    and deletes by (platform, vacancy_id) take constant time.
+
+    The file is parsed only when its inode, size or modification time
+    changed since the handler last read or wrote it, so repeated loads and
+    searches of an unchanged store cost one stat call. In cached mode adds
+    and deletes stay in memory until flush() is called.
+
+    Saves are atomic and take an advisory lock on the file only while
+    merging and writing, so several processes can share one store without
+    losing each other's updates.
+
+    Encoding and decoding go through a pluggable codec, the fastest
+    installed one (orjson, msgspec, then the standard json module) by
+    default. In compact mode the file is written without indentation.
+
+    Full-text search runs on an inverted index that is built on first use
+    and updated incrementally on adds and deletes. If an index path is
+    given, the index is persisted there with the signature of the file
+    version it reflects, and reused as long as the file is unchanged.
+    Changes to the index are persisted by flush(), not on every write.
     """
 
-    __file_path: str = FILE_PATH
-    __data = []
+    def __init__(
+            self, file_path: str = FILE_PATH, cached: bool = False,
+            index_path: str | None = None, codec: JSONCodec | None = None,
+            compact: bool = False
+    ):
+        """
+        Initializes the handler.
 
-    @classmethod
-    def _read_file(cls, file_path: str) -> None:
+        Args:
+            file_path (str): The path of the JSON file.
+            cached (bool): Keep the data in memory between calls and batch
+            writes until flush().
+            index_path (str | None): The path of the persisted search
+            index. The index is kept in memory only if None.
+            codec (JSONCodec | None): The JSON codec. Defaults to the
+            fastest installed one.
+            compact (bool): Write the file without indentation.
+        """
+        self.__file_path: str = file_path
+        self.__cached: bool = cached
+        self.__index_path: str | None = index_path
+        self.__codec: JSONCodec = codec if codec is not None else get_codec()
+        self.__compact: bool = compact
+        self.__search_index: InvertedIndex | None = None
+        self.__index_unsaved: bool = False
+        self.__data: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.__signature: Tuple[int, int, int] | None = None
+        self.__pending: Dict[
+            Tuple[str, int], Dict[str, Any] | None
+        ] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+    @staticmethod
+    def _file_signature(file_path: str) -> Tuple[int, int, int] | None:
+        """
+        Returns what identifies the current version of a file.
+
+        Args:
+            file_path (str): The path of the file.
+
+        Returns:
+            Tuple[int, int, int] | None: The inode, size and modification
+            time in nanoseconds, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _build_index(
+            data: Dict[str, List[Dict[str, Any]]] | List[Dict[str, Any]]
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """
+        Builds the primary-key index from the file content.
+
+        Args:
+            data (Dict[str, List[Dict[str, Any]]] | List[Dict[str, Any]]):
+            The vacancies grouped by platform, or a flat list of vacancies.
+
+        Returns:
+            Dict[str, Dict[int, Dict[str, Any]]]: The vacancies by platform
+            and vacancy ID.
+        """
+        if isinstance(data, list):
+            vacancies = data
+        else:
+            vacancies = (
+                vacancy
+                for platform_vacancies in data.values()
+                for vacancy in platform_vacancies
+            )
+
+        index = {}
+        for vacancy in vacancies:
+            index.setdefault(vacancy['platform'], {})[
+                int(vacancy['vacancy_id'])
+            ] = vacancy
+        return index
+
+    def _serialize(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Converts the primary-key index back to the file layout.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The vacancies grouped by
+            platform.
+        """
+        return {
+            platform: list(vacancies.values())
+            for platform, vacancies in self.__data.items()
+        }
+
+    def _parse_file(
+            self, file_path: str
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """
+        Parses the JSON file into the primary-key index.
+
+        Args:
+            file_path (str): The path of the JSON file.
+
+        Returns:
+            Dict[str, Dict[int, Dict[str, Any]]]: The vacancies by platform
+            and vacancy ID.
+        """
+        with METRICS.timer('load_seconds'):
+            with open(file_path, 'rb') as f:
+                return self._build_index(self.__codec.loads(f.read()))
+
+    def _read_file(self, file_path: str) -> None:
         """
         Reads the JSON file and loads the data.
 
+        The file is skipped if it did not change since the last read or
+        write, or if there are unflushed changes in cached mode.
+
         Args:
             file_path (str): The path of the JSON file.
 
         Returns:
             None
         """
+        if self.__pending:
+            return
+        signature = self._file_signature(file_path)
+        if signature is not None and signature == self.__signature:
+            return
+
         try:
-            with open(file_path, 'r') as f:
-                cls.__data = json.load(f)
+            signature = self._file_signature(file_path)
+            self.__data = self._parse_file(file_path)
+            self.__signature = signature
         except FileNotFoundError:
-            print(f'File {file_path} not found, new file created')
-            cls._save_file(cls.__data, cls.__file_path)
+            print(
+                f'File {file_path} not found, new file created',
+                file=sys.stderr
+            )
+            self._write_file()
         except JSONDecodeError:
-            print(f'File {file_path} is not valid JSON')
+            print(f'File {file_path} is not valid JSON', file=sys.stderr)
+
+    def _write_file(self, replace: bool = False) -> None:
+        """
+        Saves the in-memory data to the JSON file.
+
+        The file is locked for the duration of the write. Unless replace is
+        set, changes written by other processes since the last read are
+        merged first: the pending adds and deletes of this handler are
+        applied on top of the current file content.
+
+        Args:
+            replace (bool): Overwrite the file instead of merging.
+
+        Returns:
+            None
+        """
+        index = self.__search_index
+        index_current = (
+            index is not None and index.source_signature == self.__signature
+        )
+        with FileLock(self.__file_path):
+            signature = self._file_signature(self.__file_path)
+            if not replace and signature != self.__signature:
+                index_current = False
+                try:
+                    merged = self._parse_file(self.__file_path)
+                except (FileNotFoundError, JSONDecodeError):
+                    merged = {}
+                for (platform, vacancy_id), vacancy in self.__pending.items():
+                    if vacancy is None:
+                        merged.get(platform, {}).pop(vacancy_id, None)
+                    else:
+                        merged.setdefault(platform, {})[vacancy_id] = vacancy
+                self.__data = merged
+
+            self._save_file(
+                self._serialize(), self.__file_path,
+                self.__codec, self.__compact
+            )
+            self.__signature = self._file_signature(self.__file_path)
+        self.__pending.clear()
+
+        if index_current:
+            index.source_signature = self.__signature
+            self.__index_unsaved = self.__index_path is not None
+        else:
+            self.__search_index = None
+            self.__index_unsaved = False
+
+    def _commit(
+            self, platform: str, vacancy_id: int,
+            vacancy: Dict[str, Any] | None
+    ) -> None:
+        """
+        Records a change, and persists it unless in cached mode.
+
+        Args:
+            platform (str): The platform of the changed vacancy.
+            vacancy_id (int): The ID of the changed vacancy.
+            vacancy (Dict[str, Any] | None): The new vacancy data, or None
+            if the vacancy was deleted.
+
+        Returns:
+            None
+        """
+        self.__pending[(platform, vacancy_id)] = vacancy
+        if not self.__cached:
+            self._write_file()
+
+    def flush(self) -> None:
+        """
+        Writes the changes made in cached mode to the JSON file, and the
+        changes of the search index to the index file.
+
+        Returns:
+            None
+        """
+        if self.__pending:
+            self._write_file()
+        if self.__index_unsaved and self._index_is_current():
+            self.__search_index.save(self.__index_path, self.__codec)
+        self.__index_unsaved = False
 
     @classmethod
     def _save_file(
-            cls, data: List[Dict[str, Any]], file_path: str = FILE_PATH
+            cls, data: Dict[str, List[Dict[str, Any]]],
+            file_path: str = FILE_PATH, codec: JSONCodec | None = None,
+            compact: bool = False
     ) -> None:
         """
         Saves the data to a JSON file.
 
+        The data is written and synced to a temporary file in the same
+        directory, which then atomically replaces the target, so readers
+        never see a partially written file.
+
         Args:
-            data (List[Dict[str, Any]]): The data to be saved.
+            data (Dict[str, List[Dict[str, Any]]]): The data to be saved.
             file_path (str): The path of the JSON file.
+            codec (JSONCodec | None): The JSON codec. Defaults to the
+            fastest installed one.
+            compact (bool): Write the file without indentation.
 
         Returns:
             None
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with METRICS.timer('save_seconds'):
+            encoded = (codec if codec is not None else get_codec()).dumps(
+                data, compact
+            )
+            descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(file_path)),
+                prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(descriptor, 'wb') as f:
+                    f.write(encoded)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, file_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        METRICS.increment('saved_bytes_total', len(encoded))
 
     def _add_vacancy(self, vacancy: Vacancy) -> None:
         """
         Adds a vacancy to the JSON data.
 
+        A vacancy with the same platform and ID is replaced.
+
         Args:
             vacancy (Vacancy): The vacancy object to be added.
 
@@ -68,21 +331,36 @@ class JSONFileHandler(FileHandler):
             None
         """
         self._read_file(self.__file_path)
-        self.__data.append(vacancy.to_dict())
-        self._save_file(self.__data, self.__file_path)
-
-    def _get_vacancy(self, vacancy_id: int) -> Dict[str, Any]:
+        vacancy_data = vacancy.to_dict()
+        self.__data.setdefault(vacancy.platform, {})[
+            vacancy.vacancy_id
+        ] = vacancy_data
+        if self._index_is_current():
+            self.__search_index.add_dict(vacancy_data)
+        self._commit(vacancy.platform, vacancy.vacancy_id, vacancy_data)
+
+    def _get_vacancy(
+            self, vacancy_id: int, platform: str | None = None
+    ) -> Dict[str, Any] | None:
         """
         Retrieves a vacancy from the JSON data based on the vacancy ID.
 
         Args:
             vacancy_id (int): The ID of the vacancy to retrieve.
+            platform (str | None): The platform of the vacancy. If None,
+            every platform is searched.
 
         Returns:
-            Dict[str, Any]: The vacancy data.
+            Dict[str, Any] | None: The vacancy data, or None if not found.
         """
         self._read_file(self.__file_path)
-        return self.__data[vacancy_id]
+        if platform is not None:
+            return self.__data.get(platform, {}).get(int(vacancy_id))
+
+        for vacancies in self.__data.values():
+            if int(vacancy_id) in vacancies:
+                return vacancies[int(vacancy_id)]
+        return None
 
     def _delete_vacancy(self, vacancy: Vacancy) -> None:
         """
@@ -95,11 +373,87 @@ class JSONFileHandler(FileHandler):
             None
         """
         self._read_file(self.__file_path)
-        try:
-            self.__data.remove(vacancy.to_dict())
-        except ValueError:
-            print(f'Vacancy "{vacancy.title}" not found')
-        self._save_file(self.__data, self.__file_path)
+        vacancies = self.__data.get(vacancy.platform, {})
+        if vacancies.pop(vacancy.vacancy_id, None) is None:
+            print(f'Vacancy "{vacancy.title}" not found', file=sys.stderr)
+            return
+        if self._index_is_current():
+            self.__search_index.remove(vacancy)
+        self._commit(vacancy.platform, vacancy.vacancy_id, None)
+
+    def _index_is_current(self) -> bool:
+        """
+        Checks whether the search index reflects the in-memory data.
+
+        Returns:
+            bool: True if the index was built for the loaded file version.
+        """
+        return (
+            self.__search_index is not None
+            and self.__search_index.source_signature == self.__signature
+        )
+
+    def _get_search_index(self) -> InvertedIndex:
+        """
+        Returns the search index, loading or rebuilding it if it is stale.
+
+        The persisted index is used if it was saved for the current file
+        version and there are no unflushed changes, otherwise the index is
+        rebuilt from the in-memory data and persisted.
+
+        Returns:
+            InvertedIndex: The up-to-date search index.
+        """
+        self._read_file(self.__file_path)
+        if self._index_is_current():
+            return self.__search_index
+
+        index = None
+        if self.__index_path is not None and not self.__pending:
+            try:
+                index = InvertedIndex.load(self.__index_path, self.__codec)
+            except (FileNotFoundError, JSONDecodeError, KeyError, ValueError):
+                index = None
+            if index is not None \
+                    and index.source_signature != self.__signature:
+                index = None
+
+        if index is None:
+            index = InvertedIndex.from_dicts(
+                vacancy
+                for vacancies in self.__data.values()
+                for vacancy in vacancies.values()
+            )
+            index.source_signature = self.__signature
+            if self.__index_path is not None and not self.__pending:
+                index.save(self.__index_path, self.__codec)
+
+        self.__search_index = index
+        return index
+
+    def search_vacancies(
+            self, query: str, limit: int | None = None,
+            match_all: bool = True
+    ) -> List[Vacancy]:
+        """
+        Searches the saved vacancies by title and description.
+
+        Args:
+            query (str): The query words, a word ending with '*' matches
+            every word with that prefix.
+            limit (int | None): The maximum number of results.
+            match_all (bool): Require every query word instead of any.
+
+        Returns:
+            List[Vacancy]: The matching vacancies, most relevant first.
+        """
+        index = self._get_search_index()
+        return [
+            Vacancy.from_dict(self.__data[platform][vacancy_id])
+            for (platform, vacancy_id), _ in index.rank(
+                query, limit, match_all
+            )
+        ]
 
     def _load_vacancies(
             self,
@@ -109,6 +463,9 @@ class JSONFileHandler(FileHandler):
         """
         Loads vacancies from the JSON data based on the given parameters.
 
+        Vacancy objects are created lazily and loading of a platform stops
+        once count vacancies matched.
+
         Args:
             platforms (dict): The platforms to be loaded.
             count (int): The number of vacancies to be loaded.
@@ -120,29 +477,18 @@ class JSONFileHandler(FileHandler):
             parameters.
         """
         self._read_file(self.__file_path)
+        pipeline = FilterPipeline.from_arguments(
+            platforms, count, word_to_search, salary_min_max
+        )
 
         result = {}
         for platform, vacancies in self.__data.items():
-            if platform not in platforms.values():
+            if not pipeline.accepts_platform(platform):
                 continue
 
-            vacancies_obj_list = [
-                Vacancy(
-                    platform=vacancy['platform'],
-                    vacancy_id=vacancy['vacancy_id'],
-                    title=vacancy['title'],
-                    url=vacancy['url'],
-                    salary_from=vacancy['salary_from'],
-                    salary_to=vacancy['salary_to'],
-                    currency=vacancy['currency'],
-                    description=vacancy['description']
-                ) for vacancy in vacancies
-            ]
-            salary_filter = SalaryRangeFilter()
-            vacancies_filtered = salary_filter.filter_vacancies(
-                vacancies_obj_list, salary_min_max
+            result[platform] = pipeline.apply(
+                Vacancy.from_dict(vacancy) for vacancy in vacancies.values()
             )
-            result[platform] = vacancies_filtered
         return result
 
     def load_vacancies_from_json(
@@ -168,6 +514,41 @@ class JSONFileHandler(FileHandler):
             word_to_search, salary_min_max
         )
 
+    def top_vacancies_from_json(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads the best-paid vacancies matching the given parameters.
+
+        Every platform is scanned once with a heap of count vacancies,
+        the matching vacancies are never collected and sorted. Vacancies
+        with equal salary come out most recently inserted first.
+
+        Args:
+            platforms (dict | None): The platforms to be loaded, all if
+            None.
+            count (int): The number of vacancies per platform.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The vacancies by platform, highest salary first.
+        """
+        self._read_file(self.__file_path)
+        pipeline = FilterPipeline.from_arguments(
+            platforms, count, word_to_search, salary_min_max
+        )
+
+        return {
+            platform: pipeline.top(
+                Vacancy.from_dict(vacancy) for vacancy in vacancies.values()
+            )
+            for platform, vacancies in self.__data.items()
+            if pipeline.accepts_platform(platform)
+        }
+
     def save_all_vacancies_to_json(self, vacancies) -> None:
         """
         Saves all the vacancies to the JSON file.
@@ -178,7 +559,37 @@ class JSONFileHandler(FileHandler):
         Returns:
             None
         """
-        self._save_file(vacancies)
+        self.__data = self._build_index(vacancies)
+        self.__search_index = None
+        self.__pending.clear()
+        self._write_file(replace=True)
+
+    def add_vacancies_to_json(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Adds several vacancies to the JSON data with a single write.
+
+        Vacancies with the same platform and ID are replaced.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancy objects to be added.
+
+        Returns:
+            None
+        """
+        self._read_file(self.__file_path)
+        index_current = self._index_is_current()
+        for vacancy in vacancies:
+            vacancy_data = vacancy.to_dict()
+            self.__data.setdefault(vacancy.platform, {})[
+                vacancy.vacancy_id
+            ] = vacancy_data
+            if index_current:
+                self.__search_index.add_dict(vacancy_data)
+            self.__pending[(vacancy.platform, vacancy.vacancy_id)] = (
+                vacancy_data
+            )
+        if self.__pending and not self.__cached:
+            self._write_file()
 
     def add_vacancy_to_json(self, vacancy: Vacancy) -> None:
         """
@@ -192,17 +603,20 @@ class JSONFileHandler(FileHandler):
         """
         self._add_vacancy(vacancy)
 
-    def get_vacancy_from_json(self, vacancy_id: int) -> Dict[str, Any]:
+    def get_vacancy_from_json(
+            self, vacancy_id: int, platform: str | None = None
+    ) -> Dict[str, Any] | None:
         """
         Retrieves a vacancy from the JSON data based on the vacancy ID.
 
         Args:
             vacancy_id (int): The ID of the vacancy to retrieve.
+            platform (str | None): The platform of the vacancy.
 
         Returns:
-            Dict[str, Any]: The vacancy data.
+            Dict[str, Any] | None: The vacancy data, or None if not found.
         """
-        return self._get_vacancy(vacancy_id)
+        return self._get_vacancy(vacancy_id, platform)
 
     def delete_vacancy_from_json(self, vacancy: Vacancy) -> None:
         """
@@ -0,0 +1,460 @@
+"""
+This class handles the append-only JSON Lines log of vacancies.
+"""
+
+import os
+import sys
+import tempfile
+from json import JSONDecodeError
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.constants import (
+    JSONL_COMPACT_MIN_RECORDS, JSONL_COMPACT_RATIO, JSONL_FILE_PATH
+)
+from src.file_handler import FileHandler
+from src.file_lock import FileLock
+from src.filter_pipeline import FilterPipeline
+from src.json_codec import JSONCodec, get_codec
+from src.vacancy import Vacancy
+
+
+class JSONLFileHandler(FileHandler):
+    """
+    A log-structured vacancy store on top of a JSON Lines file.
+
+    Every line is either a vacancy dictionary or a tombstone
+    {"platform": ..., "vacancy_id": ..., "deleted": true}. Adds and deletes
+    append one line, the latest line of a (platform, vacancy_id) wins.
+    Once superseded lines outnumber the live ones by the compaction ratio,
+    the log is rewritten with the live vacancies only.
+
+    Appends and compactions hold an advisory lock on the log and are
+    synced to disk, so several processes can share one log. Every
+    operation first applies the lines appended by others since the
+    handler last read the log. A line without its trailing newline is
+    left by a writer that crashed mid-append: readers ignore it and the
+    next append truncates it, so it never corrupts the following record.
+    """
+
+    def __init__(
+            self,
+            file_path: str = JSONL_FILE_PATH,
+            compact_min_records: int = JSONL_COMPACT_MIN_RECORDS,
+            compact_ratio: float = JSONL_COMPACT_RATIO,
+            codec: JSONCodec | None = None
+    ):
+        """
+        Initializes the handler, the log is replayed on first use.
+
+        Args:
+            file_path (str): The path of the JSON Lines file.
+            compact_min_records (int): The number of superseded lines below
+            which the log is never compacted.
+            compact_ratio (float): The share of superseded lines in the log
+            that triggers a compaction.
+            codec (JSONCodec | None): The JSON codec. Defaults to the
+            fastest installed one.
+        """
+        self.__file_path: str = file_path
+        self.__compact_min_records: int = compact_min_records
+        self.__compact_ratio: float = compact_ratio
+        self.__codec: JSONCodec = codec if codec is not None else get_codec()
+        self.__records: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self.__log_lines: int = 0
+        self.__inode: int | None = None
+        self.__position: int = 0
+
+    @staticmethod
+    def _key(platform: str, vacancy_id: int) -> Tuple[str, int]:
+        """
+        Builds the primary key of a vacancy.
+
+        Args:
+            platform (str): The platform of the vacancy.
+            vacancy_id (int): The ID of the vacancy.
+
+        Returns:
+            Tuple[str, int]: The primary key.
+        """
+        return platform, int(vacancy_id)
+
+    def _replay_log(self) -> None:
+        """
+        Applies the complete lines appended to the log since the last
+        read. The whole log is replayed on first use, or if it was
+        compacted or replaced in the meantime.
+
+        Returns:
+            None
+        """
+        try:
+            f = open(self.__file_path, 'rb')
+        except FileNotFoundError:
+            self.__records, self.__log_lines = {}, 0
+            self.__inode, self.__position = None, 0
+            return
+
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self.__inode or stat.st_size < self.__position:
+                self.__records, self.__log_lines = {}, 0
+                self.__inode, self.__position = stat.st_ino, 0
+            if stat.st_size == self.__position:
+                return
+
+            f.seek(self.__position)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                self.__position += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = self.__codec.loads(line)
+                except JSONDecodeError:
+                    print(
+                        f'Skipping invalid line in {self.__file_path}',
+                        file=sys.stderr
+                    )
+                    continue
+                self.__log_lines += 1
+                self._apply(record)
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """
+        Applies one log record to the live vacancies.
+
+        Args:
+            record (Dict[str, Any]): A vacancy or a tombstone.
+
+        Returns:
+            None
+        """
+        key = self._key(record['platform'], record['vacancy_id'])
+        if record.get('deleted'):
+            self.__records.pop(key, None)
+        else:
+            self.__records[key] = record
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Appends records to the log with a single synced write, and applies
+        them.
+
+        A partial line left by a crashed writer is truncated first, so the
+        records always start on a new line.
+
+        Args:
+            records (List[Dict[str, Any]]): Vacancies or tombstones.
+
+        Returns:
+            None
+        """
+        if not records:
+            return
+        encoded = b''.join(
+            self.__codec.dumps(record, compact=True) + b'\n'
+            for record in records
+        )
+        with FileLock(self.__file_path):
+            self._replay_log()
+            with open(self.__file_path, 'ab') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != self.__inode:
+                    self.__inode, self.__position = stat.st_ino, 0
+                if stat.st_size > self.__position:
+                    os.ftruncate(f.fileno(), self.__position)
+                f.write(encoded)
+                f.flush()
+                os.fsync(f.fileno())
+            self.__position += len(encoded)
+            for record in records:
+                self._apply(record)
+            self.__log_lines += len(records)
+
+            dead_lines = self.__log_lines - len(self.__records)
+            if dead_lines >= self.__compact_min_records \
+                    and dead_lines >= self.__compact_ratio * self.__log_lines:
+                self._rewrite()
+
+    def compact(self) -> None:
+        """
+        Rewrites the log with the live vacancies only.
+
+        The new log is written and synced next to the old one and renamed
+        over it, so a crash never leaves a truncated file behind.
+
+        Returns:
+            None
+        """
+        with FileLock(self.__file_path):
+            self._replay_log()
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        """
+        Replaces the log with the live vacancies, the lock must be held.
+
+        Returns:
+            None
+        """
+        encoded = b''.join(
+            self.__codec.dumps(record, compact=True) + b'\n'
+            for record in self.__records.values()
+        )
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.__file_path)),
+            prefix=f'.{os.path.basename(self.__file_path)}.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                f.write(encoded)
+                f.flush()
+                os.fsync(f.fileno())
+                inode = os.fstat(f.fileno()).st_ino
+            os.replace(temp_path, self.__file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.__inode, self.__position = inode, len(encoded)
+        self.__log_lines = len(self.__records)
+
+    def _add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Appends a vacancy to the log.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be added.
+
+        Returns:
+            None
+        """
+        self._replay_log()
+        self._append([vacancy.to_dict()])
+
+    def _get_vacancy(
+            self, vacancy_id: int, platform: str | None = None
+    ) -> Dict[str, Any] | None:
+        """
+        Retrieves a vacancy by its ID.
+
+        Args:
+            vacancy_id (int): The ID of the vacancy to retrieve.
+            platform (str | None): The platform of the vacancy. If None,
+            every platform is searched.
+
+        Returns:
+            Dict[str, Any] | None: The vacancy data, or None if not found.
+        """
+        self._replay_log()
+        if platform is not None:
+            return self.__records.get(self._key(platform, vacancy_id))
+
+        for (_, record_id), record in self.__records.items():
+            if record_id == int(vacancy_id):
+                return record
+        return None
+
+    def _delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Appends a tombstone for a vacancy to the log.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be deleted.
+
+        Returns:
+            None
+        """
+        self._replay_log()
+        key = self._key(vacancy.platform, vacancy.vacancy_id)
+        if key not in self.__records:
+            print(f'Vacancy "{vacancy.title}" not found', file=sys.stderr)
+            return
+
+        self._append([{
+            'platform': vacancy.platform,
+            'vacancy_id': vacancy.vacancy_id,
+            'deleted': True
+        }])
+
+    def _load_vacancies(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads vacancies from the log based on the given parameters.
+
+        Args:
+            platforms (dict): The platforms to be loaded.
+            count (int): The number of vacancies to be loaded.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The loaded vacancies filtered by the given
+            parameters.
+        """
+        self._replay_log()
+        pipeline = FilterPipeline.from_arguments(
+            platforms, count, word_to_search, salary_min_max
+        )
+
+        grouped = {}
+        for (platform, _), record in self.__records.items():
+            if pipeline.accepts_platform(platform):
+                grouped.setdefault(platform, []).append(record)
+
+        return {
+            platform: pipeline.apply(
+                Vacancy.from_dict(record) for record in records
+            )
+            for platform, records in grouped.items()
+        }
+
+    def load_vacancies(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads vacancies from the log based on the given parameters.
+
+        Args:
+            platforms (dict): The platforms to be loaded.
+            count (int): The number of vacancies to be loaded.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The loaded vacancies filtered by the
+            given parameters.
+        """
+        return self._load_vacancies(
+            platforms, count,
+            word_to_search, salary_min_max
+        )
+
+    def top_vacancies(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads the best-paid vacancies matching the given parameters.
+
+        The records are grouped by platform in a single pass, then every
+        platform is scanned once with a heap of count vacancies, the
+        matching vacancies are never collected and sorted. Vacancies with
+        equal salary come out most recently inserted first.
+
+        Args:
+            platforms (dict | None): The platforms to be loaded, all if
+            None.
+            count (int): The number of vacancies per platform.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The vacancies by platform, highest salary first.
+        """
+        self._replay_log()
+        pipeline = FilterPipeline.from_arguments(
+            platforms, count, word_to_search, salary_min_max
+        )
+
+        grouped = {}
+        for (platform, _), record in self.__records.items():
+            if pipeline.accepts_platform(platform):
+                grouped.setdefault(platform, []).append(record)
+
+        result = {}
+        for platform, records in grouped.items():
+            vacancies = pipeline.top(
+                Vacancy.from_dict(record) for record in records
+            )
+            if vacancies:
+                result[platform] = vacancies
+        return result
+
+    def save_all_vacancies(
+            self, vacancies: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        """
+        Replaces the content of the log with the given vacancies.
+
+        Args:
+            vacancies (Dict[str, List[Dict[str, Any]]]): The vacancy
+            dictionaries grouped by platform, as saved by user_interface.
+
+        Returns:
+            None
+        """
+        with FileLock(self.__file_path):
+            self.__records = {}
+            for platform_vacancies in vacancies.values():
+                for record in platform_vacancies:
+                    self._apply(record)
+            self._rewrite()
+
+    def add_vacancies(
+            self, vacancies: Iterable[Vacancy],
+            fields: Dict[str, Any] | None = None
+    ) -> None:
+        """
+        Appends several vacancies to the log with a single write.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancy objects to be added.
+            fields (Dict[str, Any] | None): Additional fields stored with
+            every vacancy, e.g. the query that found it.
+
+        Returns:
+            None
+        """
+        if fields is None:
+            records = [vacancy.to_dict() for vacancy in vacancies]
+        else:
+            records = [
+                {**fields, **vacancy.to_dict()} for vacancy in vacancies
+            ]
+        self._append(records)
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Appends a vacancy to the log.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be added.
+
+        Returns:
+            None
+        """
+        self._add_vacancy(vacancy)
+
+    def get_vacancy(
+            self, vacancy_id: int, platform: str | None = None
+    ) -> Dict[str, Any] | None:
+        """
+        Retrieves a vacancy by its ID.
+
+        Args:
+            vacancy_id (int): The ID of the vacancy to retrieve.
+            platform (str | None): The platform of the vacancy.
+
+        Returns:
+            Dict[str, Any] | None: The vacancy data, or None if not found.
+        """
+        return self._get_vacancy(vacancy_id, platform)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Deletes a vacancy by appending a tombstone to the log.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be deleted.
+
+        Returns:
+            None
+        """
+        self._delete_vacancy(vacancy)
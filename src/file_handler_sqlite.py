@@ -0,0 +1,442 @@
+"""
+This class handles the SQLite database containing vacancies.
+"""
+
+import sqlite3
+import sys
+from typing import Any, Dict, Iterable, Iterator, List
+
+from src.constants import SQLITE_FILE_PATH
+from src.file_handler import FileHandler
+from src.filter_pipeline import FilterPipeline
+from src.vacancy import Vacancy
+
+COLUMNS = (
+    'platform', 'vacancy_id', 'title', 'url', 'salary_from', 'salary_to',
+    'currency', 'description', 'avg_salary', 'employer'
+)
+
+SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS vacancies (
+        platform TEXT NOT NULL,
+        vacancy_id INTEGER NOT NULL,
+        title TEXT,
+        url TEXT,
+        salary_from INTEGER,
+        salary_to INTEGER,
+        currency TEXT,
+        description TEXT,
+        avg_salary INTEGER NOT NULL DEFAULT 0,
+        employer TEXT,
+        PRIMARY KEY (platform, vacancy_id)
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_vacancies_platform_avg_salary
+    ON vacancies (platform, avg_salary)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_vacancies_avg_salary
+    ON vacancies (avg_salary)
+    '''
+)
+
+
+class SQLiteFileHandler(FileHandler):
+    """
+    A class that stores vacancies in an indexed SQLite database.
+
+    The primary key (platform, vacancy_id) serves lookups and deletes, the
+    (platform, avg_salary) and avg_salary indexes serve the platform and
+    salary range filters, which run inside SQLite instead of Python.
+    Filter pipelines are pushed down into SQL as far as they translate.
+    """
+
+    def __init__(self, file_path: str = SQLITE_FILE_PATH):
+        """
+        Opens the database and creates the schema if needed.
+
+        Args:
+            file_path (str): The path of the SQLite database.
+        """
+        self.__file_path: str = file_path
+        self.__connection = sqlite3.connect(file_path)
+        self.__connection.row_factory = sqlite3.Row
+        with self.__connection:
+            for statement in SCHEMA:
+                self.__connection.execute(statement)
+            self._migrate()
+
+    def _migrate(self) -> None:
+        """
+        Adds the columns missing from databases created by older versions.
+
+        Returns:
+            None
+        """
+        existing = {
+            row['name'] for row in
+            self.__connection.execute('PRAGMA table_info(vacancies)')
+        }
+        if 'employer' not in existing:
+            self.__connection.execute(
+                'ALTER TABLE vacancies ADD COLUMN employer TEXT'
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+
+        Returns:
+            None
+        """
+        self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _to_row(vacancy: Dict[str, Any]) -> tuple:
+        """
+        Converts a vacancy dictionary to a row of the vacancies table.
+
+        Args:
+            vacancy (Dict[str, Any]): The vacancy as a dictionary.
+
+        Returns:
+            tuple: The values ordered as COLUMNS.
+        """
+        return tuple(vacancy.get(column) for column in COLUMNS)
+
+    def _execute_insert(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Inserts or replaces vacancies in the current transaction.
+
+        A vacancy already stored is updated in place, so it keeps its
+        rowid and its position in the store order, as in the JSON stores.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): The vacancy dictionaries.
+
+        Returns:
+            None
+        """
+        placeholders = ', '.join('?' * len(COLUMNS))
+        updates = ', '.join(
+            f'{column} = excluded.{column}' for column in COLUMNS[2:]
+        )
+        self.__connection.executemany(
+            f'INSERT INTO vacancies ({", ".join(COLUMNS)}) '
+            f'VALUES ({placeholders}) '
+            f'ON CONFLICT (platform, vacancy_id) DO UPDATE SET {updates}',
+            (self._to_row(vacancy) for vacancy in vacancies)
+        )
+
+    def _insert(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Inserts or replaces vacancies in a single transaction.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): The vacancy dictionaries.
+
+        Returns:
+            None
+        """
+        with self.__connection:
+            self._execute_insert(vacancies)
+
+    def _add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Adds a vacancy to the database.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be added.
+
+        Returns:
+            None
+        """
+        self._insert([vacancy.to_dict()])
+
+    def _get_vacancy(
+            self, vacancy_id: int, platform: str | None = None
+    ) -> Dict[str, Any] | None:
+        """
+        Retrieves a vacancy by its ID.
+
+        Args:
+            vacancy_id (int): The ID of the vacancy to retrieve.
+            platform (str | None): The platform of the vacancy. If None,
+            every platform is searched.
+
+        Returns:
+            Dict[str, Any] | None: The vacancy data, or None if not found.
+        """
+        if platform is not None:
+            row = self.__connection.execute(
+                'SELECT * FROM vacancies '
+                'WHERE platform = ? AND vacancy_id = ?',
+                (platform, int(vacancy_id))
+            ).fetchone()
+        else:
+            row = self.__connection.execute(
+                'SELECT * FROM vacancies WHERE vacancy_id = ?',
+                (int(vacancy_id),)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def _delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Deletes a vacancy from the database.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be deleted.
+
+        Returns:
+            None
+        """
+        with self.__connection:
+            cursor = self.__connection.execute(
+                'DELETE FROM vacancies '
+                'WHERE platform = ? AND vacancy_id = ?',
+                (vacancy.platform, vacancy.vacancy_id)
+            )
+        if not cursor.rowcount:
+            print(f'Vacancy "{vacancy.title}" not found', file=sys.stderr)
+
+    def _platforms(self, platforms: Dict[str, str] | None) -> List[str]:
+        """
+        Returns the platforms to query.
+
+        Args:
+            platforms (Dict[str, str] | None): The selected platforms, all
+            stored platforms if None.
+
+        Returns:
+            List[str]: The platform names.
+        """
+        if platforms is not None:
+            return list(platforms.values())
+        return [
+            platform for platform, in self.__connection.execute(
+                'SELECT DISTINCT platform FROM vacancies ORDER BY platform'
+            )
+        ]
+
+    def _load_vacancies(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads vacancies from the database based on the given parameters.
+
+        The conditions are evaluated by SQLite where possible, see
+        query_vacancies.
+
+        Args:
+            platforms (dict | None): The platforms to be loaded, all if
+            None.
+            count (int): The number of vacancies to be loaded.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The loaded vacancies filtered by the given
+            parameters.
+        """
+        pipeline = FilterPipeline.from_arguments(
+            platforms, count, word_to_search, salary_min_max
+        )
+
+        result = {}
+        for platform in self._platforms(platforms):
+            vacancies = list(self.query_vacancies(pipeline, platform))
+            if vacancies:
+                result[platform] = vacancies
+        return result
+
+    def query_vacancies(
+            self, pipeline: FilterPipeline, platform: str | None = None,
+            by_salary: bool = False
+    ) -> Iterator[Vacancy]:
+        """
+        Lazily yields the vacancies matching a filter pipeline.
+
+        Predicates with an SQL translation are pushed down into the query.
+        If nothing is left to check in Python, the limit is pushed down as
+        well, otherwise rows are streamed from the cursor until the limit
+        is reached.
+
+        Ordered by salary, the rows come from a backward scan of the salary
+        indexes, so the best-paid vacancies are found without a sort in
+        either case. The index entries of equal salaries are ordered by
+        rowid, so ties come out most recently inserted first, like
+        top_by_salary over the JSON stores.
+
+        Args:
+            pipeline (FilterPipeline): The filter pipeline.
+            platform (str | None): Restrict the query to one platform.
+            by_salary (bool): Order by salary, highest first, instead of
+            insertion order.
+
+        Returns:
+            Iterator[Vacancy]: The matching vacancies.
+        """
+        condition, residual = pipeline.split_sql()
+        conditions, parameters = [], []
+        if platform is not None:
+            conditions.append('platform = ?')
+            parameters.append(platform)
+        if condition is not None:
+            conditions.append(condition[0])
+            parameters.extend(condition[1])
+
+        query = 'SELECT * FROM vacancies'
+        if conditions:
+            query += f' WHERE {" AND ".join(conditions)}'
+        query += ' ORDER BY avg_salary DESC, rowid DESC' if by_salary \
+            else ' ORDER BY rowid'
+        if residual is None and pipeline.limit is not None:
+            query += ' LIMIT ?'
+            parameters.append(pipeline.limit)
+
+        rows = self.__connection.execute(query, parameters)
+        vacancies = (Vacancy.from_dict(row) for row in rows)
+        if residual is None:
+            yield from vacancies
+        else:
+            yield from FilterPipeline(residual, pipeline.limit).run(vacancies)
+
+    def top_vacancies(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads the best-paid vacancies matching the given parameters.
+
+        Args:
+            platforms (dict | None): The platforms to be loaded, all if
+            None.
+            count (int): The number of vacancies per platform.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The vacancies by platform, highest salary first.
+        """
+        pipeline = FilterPipeline.from_arguments(
+            platforms, count, word_to_search, salary_min_max
+        )
+
+        result = {}
+        for platform in self._platforms(platforms):
+            vacancies = list(
+                self.query_vacancies(pipeline, platform, by_salary=True)
+            )
+            if vacancies:
+                result[platform] = vacancies
+        return result
+
+    def load_vacancies(
+            self,
+            platforms, count,
+            word_to_search, salary_min_max
+    ):
+        """
+        Loads vacancies from the database based on the given parameters.
+
+        Args:
+            platforms (dict | None): The platforms to be loaded, all if
+            None.
+            count (int): The number of vacancies to be loaded.
+            word_to_search (str): The word to be searched for.
+            salary_min_max (list): The salary range to be filtered.
+
+        Returns:
+            result (Dict): The loaded vacancies filtered by the
+            given parameters.
+        """
+        return self._load_vacancies(
+            platforms, count,
+            word_to_search, salary_min_max
+        )
+
+    def save_all_vacancies(
+            self, vacancies: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        """
+        Replaces the content of the database with the given vacancies.
+
+        The old rows are deleted and the new ones inserted in a single
+        transaction, so a failed insert leaves the old content in place.
+
+        Args:
+            vacancies (Dict[str, List[Dict[str, Any]]]): The vacancy
+            dictionaries grouped by platform, as saved by user_interface.
+
+        Returns:
+            None
+        """
+        with self.__connection:
+            self.__connection.execute('DELETE FROM vacancies')
+            self._execute_insert(
+                vacancy
+                for platform_vacancies in vacancies.values()
+                for vacancy in platform_vacancies
+            )
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Adds several vacancies in a single transaction.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancy objects to be added.
+
+        Returns:
+            None
+        """
+        self._insert(vacancy.to_dict() for vacancy in vacancies)
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Adds a vacancy to the database.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be added.
+
+        Returns:
+            None
+        """
+        self._add_vacancy(vacancy)
+
+    def get_vacancy(
+            self, vacancy_id: int, platform: str | None = None
+    ) -> Dict[str, Any] | None:
+        """
+        Retrieves a vacancy by its ID.
+
+        Args:
+            vacancy_id (int): The ID of the vacancy to retrieve.
+            platform (str | None): The platform of the vacancy.
+
+        Returns:
+            Dict[str, Any] | None: The vacancy data, or None if not found.
+        """
+        return self._get_vacancy(vacancy_id, platform)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Deletes a vacancy from the database.
+
+        Args:
+            vacancy (Vacancy): The vacancy object to be deleted.
+
+        Returns:
+            None
+        """
+        self._delete_vacancy(vacancy)
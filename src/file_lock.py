@@ -0,0 +1,60 @@
+""" Advisory file lock module"""
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class FileLock:
+    """
+    An exclusive advisory lock on a file, held by a sidecar '.lock' file.
+
+    The lock only coordinates processes that use it too, readers are not
+    blocked. On platforms without fcntl the lock is a no-op.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initializes the lock.
+
+        Args:
+            file_path (str): The path of the file to be locked.
+        """
+        self.lock_path: str = f'{file_path}.lock'
+        self.__descriptor: int | None = None
+
+    def acquire(self) -> None:
+        """
+        Blocks until the lock is acquired.
+
+        Returns:
+            None
+        """
+        self.__descriptor = os.open(
+            self.lock_path, os.O_RDWR | os.O_CREAT, 0o644
+        )
+        if fcntl is not None:
+            fcntl.flock(self.__descriptor, fcntl.LOCK_EX)
+
+    def release(self) -> None:
+        """
+        Releases the lock.
+
+        Returns:
+            None
+        """
+        if self.__descriptor is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self.__descriptor, fcntl.LOCK_UN)
+        os.close(self.__descriptor)
+        self.__descriptor = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
@@ -0,0 +1,431 @@
+""" Composable vacancy filter pipeline module"""
+import heapq
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from src.vacancy import Vacancy
+
+SQLCondition = Tuple[str, List[Any]]
+
+
+def _salary_rank(item: Tuple[int, Vacancy]) -> Tuple[int, int]:
+    position, vacancy = item
+    return vacancy.avg_salary, position
+
+
+def top_by_salary(
+        vacancies: Iterable[Vacancy], count: int | None
+) -> List[Vacancy]:
+    """
+    Selects the best-paid vacancies with a bounded heap.
+
+    Only count vacancies are held at a time, the input is consumed once
+    and never sorted as a whole. Vacancies with equal salary come out in
+    reverse input order, so with vacancies in store order the most
+    recently inserted comes first, the order of the salary indexes of
+    SQLiteFileHandler.
+
+    Args:
+        vacancies (Iterable[Vacancy]): The vacancies, e.g. a parser or
+        storage stream.
+        count (int | None): The number of vacancies to select, all if
+        None or 0.
+
+    Returns:
+        List[Vacancy]: At most count vacancies, highest salary first.
+    """
+    ranked = enumerate(vacancies)
+    if not count:
+        selected = sorted(ranked, key=_salary_rank, reverse=True)
+    else:
+        selected = heapq.nlargest(count, ranked, key=_salary_rank)
+    return [vacancy for _, vacancy in selected]
+
+
+class VacancyPredicate(ABC):
+    """
+    Abstract base class for vacancy predicates.
+
+    Predicates are combined with & and |. Each one estimates its relative
+    evaluation cost and selectivity (the share of vacancies it accepts),
+    which combinations use to evaluate the cheapest, most decisive
+    predicates first.
+    """
+
+    cost: float = 1.0
+    selectivity: float = 0.5
+
+    @abstractmethod
+    def matches(self, vacancy: Vacancy) -> bool:
+        """
+        Checks whether a vacancy satisfies the predicate.
+
+        Args:
+            vacancy (Vacancy): The vacancy to check.
+
+        Returns:
+            bool: True if the vacancy matches.
+        """
+        pass
+
+    def to_sql(self) -> SQLCondition | None:
+        """
+        Translates the predicate to an SQL condition on the vacancies table.
+
+        Returns:
+            SQLCondition | None: The condition and its parameters, or None
+            if the predicate cannot be evaluated by SQL.
+        """
+        return None
+
+    def __and__(self, other: 'VacancyPredicate') -> 'AllOf':
+        return AllOf([self, other])
+
+    def __or__(self, other: 'VacancyPredicate') -> 'AnyOf':
+        return AnyOf([self, other])
+
+
+class SalaryRangePredicate(VacancyPredicate):
+    """
+    Matches vacancies within a salary range, like SalaryRangeFilter:
+    vacancies without salary are skipped and both bounds are exclusive.
+    """
+
+    cost = 1.0
+    selectivity = 0.3
+
+    def __init__(self, min_salary: int | None, max_salary: int | None):
+        self.min_salary: int | None = min_salary
+        self.max_salary: int | None = max_salary
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        salary = vacancy.avg_salary
+        if salary == 0:
+            return False
+        if self.min_salary is not None and salary <= self.min_salary:
+            return False
+        if self.max_salary is not None and salary >= self.max_salary:
+            return False
+        return True
+
+    def to_sql(self) -> SQLCondition:
+        conditions, parameters = ['avg_salary != 0'], []
+        if self.min_salary is not None:
+            conditions.append('avg_salary > ?')
+            parameters.append(self.min_salary)
+        if self.max_salary is not None:
+            conditions.append('avg_salary < ?')
+            parameters.append(self.max_salary)
+        return ' AND '.join(conditions), parameters
+
+
+class KeywordPredicate(VacancyPredicate):
+    """
+    Matches vacancies whose title or description contains a word,
+    ignoring case.
+    """
+
+    cost = 4.0
+    selectivity = 0.2
+
+    def __init__(self, word: str):
+        self.word: str = word.casefold()
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return (
+            self.word in vacancy.title.casefold()
+            or self.word in vacancy.description.casefold()
+        )
+
+    def to_sql(self) -> SQLCondition | None:
+        # SQLite LIKE ignores case for ASCII letters only.
+        if not self.word.isascii():
+            return None
+        pattern = '%{}%'.format(
+            self.word.replace('\\', '\\\\')
+            .replace('%', '\\%')
+            .replace('_', '\\_')
+        )
+        return (
+            "(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')",
+            [pattern, pattern]
+        )
+
+
+class CurrencyPredicate(VacancyPredicate):
+    """
+    Matches vacancies paid in one of the given currencies, ignoring case.
+    """
+
+    cost = 0.5
+    selectivity = 0.5
+
+    def __init__(self, currencies: Iterable[str]):
+        self.currencies: frozenset = frozenset(
+            currency.lower() for currency in currencies
+        )
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return (
+            vacancy.currency is not None
+            and vacancy.currency.lower() in self.currencies
+        )
+
+    def to_sql(self) -> SQLCondition:
+        placeholders = ', '.join('?' * len(self.currencies))
+        return (
+            f'lower(currency) IN ({placeholders})',
+            sorted(self.currencies)
+        )
+
+
+class PlatformPredicate(VacancyPredicate):
+    """
+    Matches vacancies from one of the given platforms.
+    """
+
+    cost = 0.5
+    selectivity = 0.5
+
+    def __init__(self, platforms: Iterable[str]):
+        self.platforms: frozenset = frozenset(platforms)
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return vacancy.platform in self.platforms
+
+    def to_sql(self) -> SQLCondition:
+        placeholders = ', '.join('?' * len(self.platforms))
+        return f'platform IN ({placeholders})', sorted(self.platforms)
+
+
+class AllOf(VacancyPredicate):
+    """
+    Matches vacancies that satisfy every predicate.
+
+    Predicates are evaluated in ascending cost / (1 - selectivity), so the
+    cheap ones that reject the most vacancies run first, and evaluation
+    stops at the first rejection.
+    """
+
+    def __init__(self, predicates: Iterable[VacancyPredicate]):
+        flattened = []
+        for predicate in predicates:
+            if isinstance(predicate, AllOf):
+                flattened.extend(predicate.predicates)
+            else:
+                flattened.append(predicate)
+        self.predicates: List[VacancyPredicate] = sorted(
+            flattened,
+            key=lambda predicate: predicate.cost / max(
+                1.0 - predicate.selectivity, 1e-9
+            )
+        )
+        self.cost = sum(predicate.cost for predicate in self.predicates)
+        self.selectivity = 1.0
+        for predicate in self.predicates:
+            self.selectivity *= predicate.selectivity
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return all(predicate.matches(vacancy) for predicate in self.predicates)
+
+    def to_sql(self) -> SQLCondition | None:
+        conditions = [predicate.to_sql() for predicate in self.predicates]
+        if not conditions or None in conditions:
+            return None
+        return (
+            ' AND '.join(f'({condition})' for condition, _ in conditions),
+            [value for _, parameters in conditions for value in parameters]
+        )
+
+
+class AnyOf(VacancyPredicate):
+    """
+    Matches vacancies that satisfy at least one predicate.
+
+    Predicates are evaluated in ascending cost / selectivity, so the cheap
+    ones that accept the most vacancies run first, and evaluation stops at
+    the first match.
+    """
+
+    def __init__(self, predicates: Iterable[VacancyPredicate]):
+        flattened = []
+        for predicate in predicates:
+            if isinstance(predicate, AnyOf):
+                flattened.extend(predicate.predicates)
+            else:
+                flattened.append(predicate)
+        self.predicates: List[VacancyPredicate] = sorted(
+            flattened,
+            key=lambda predicate: predicate.cost / max(
+                predicate.selectivity, 1e-9
+            )
+        )
+        self.cost = sum(predicate.cost for predicate in self.predicates)
+        rejected = 1.0
+        for predicate in self.predicates:
+            rejected *= 1.0 - predicate.selectivity
+        self.selectivity = 1.0 - rejected
+
+    def matches(self, vacancy: Vacancy) -> bool:
+        return any(predicate.matches(vacancy) for predicate in self.predicates)
+
+    def to_sql(self) -> SQLCondition | None:
+        conditions = [predicate.to_sql() for predicate in self.predicates]
+        if not conditions or None in conditions:
+            return None
+        return (
+            ' OR '.join(f'({condition})' for condition, _ in conditions),
+            [value for _, parameters in conditions for value in parameters]
+        )
+
+
+class FilterPipeline:
+    """
+    A predicate with an optional result limit.
+
+    The pipeline consumes vacancies lazily and stops as soon as limit
+    vacancies matched, so upstream generators (parsers, storage cursors)
+    are not drained further than needed.
+    """
+
+    def __init__(
+            self, predicate: VacancyPredicate | None = None,
+            limit: int | None = None
+    ):
+        """
+        Initializes the pipeline.
+
+        Args:
+            predicate (VacancyPredicate | None): The predicate vacancies must
+            satisfy. All vacancies match if None.
+            limit (int | None): The maximum number of results, unlimited if
+            None.
+        """
+        self.predicate: VacancyPredicate | None = predicate
+        self.limit: int | None = limit
+
+    @classmethod
+    def from_arguments(
+            cls,
+            platforms: Dict[str, str] | None, count: int | None,
+            word_to_search: str | None, salary_min_max: List[int | None]
+    ) -> 'FilterPipeline':
+        """
+        Builds the pipeline for the arguments of FileHandler._load_vacancies.
+
+        Args:
+            platforms (Dict[str, str] | None): The selected platforms.
+            count (int | None): The maximum number of results.
+            word_to_search (str | None): The word to search for.
+            salary_min_max (List[int | None]): The salary range.
+
+        Returns:
+            FilterPipeline: The pipeline.
+        """
+        predicates = [SalaryRangePredicate(*salary_min_max)]
+        if platforms is not None:
+            predicates.append(PlatformPredicate(platforms.values()))
+        if word_to_search:
+            predicates.append(KeywordPredicate(word_to_search))
+        return cls(AllOf(predicates), count if count else None)
+
+    def _parts(self) -> List[VacancyPredicate]:
+        if self.predicate is None:
+            return []
+        if isinstance(self.predicate, AllOf):
+            return self.predicate.predicates
+        return [self.predicate]
+
+    def accepts_platform(self, platform: str) -> bool:
+        """
+        Checks whether vacancies of a platform can match at all, so sources
+        of other platforms can be skipped without reading them.
+
+        Args:
+            platform (str): The platform name.
+
+        Returns:
+            bool: False if a platform condition rules the platform out.
+        """
+        return all(
+            platform in predicate.platforms
+            for predicate in self._parts()
+            if isinstance(predicate, PlatformPredicate)
+        )
+
+    def split_sql(self) -> Tuple[SQLCondition | None, VacancyPredicate | None]:
+        """
+        Splits the predicate into the part SQL can evaluate and the rest.
+
+        Returns:
+            Tuple[SQLCondition | None, VacancyPredicate | None]: The pushed
+            down condition and the residual predicate, either may be None.
+        """
+        pushed, residual = [], []
+        for predicate in self._parts():
+            condition = predicate.to_sql()
+            if condition is None:
+                residual.append(predicate)
+            else:
+                pushed.append(condition)
+
+        sql = None
+        if pushed:
+            sql = (
+                ' AND '.join(f'({condition})' for condition, _ in pushed),
+                [value for _, parameters in pushed for value in parameters]
+            )
+        if not residual:
+            return sql, None
+        if len(residual) == 1:
+            return sql, residual[0]
+        return sql, AllOf(residual)
+
+    def run(self, vacancies: Iterable[Vacancy]) -> Iterator[Vacancy]:
+        """
+        Lazily yields the matching vacancies, up to the limit.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies to filter.
+
+        Returns:
+            Iterator[Vacancy]: The matching vacancies.
+        """
+        matching = (
+            vacancies if self.predicate is None
+            else filter(self.predicate.matches, vacancies)
+        )
+        return iter(matching) if self.limit is None \
+            else islice(matching, self.limit)
+
+    def top(self, vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+        """
+        Returns the best-paid matching vacancies, up to the limit.
+
+        Unlike run, every vacancy has to be seen, but only limit of them
+        are kept.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies to filter.
+
+        Returns:
+            List[Vacancy]: The matching vacancies, highest salary first.
+        """
+        matching = (
+            vacancies if self.predicate is None
+            else filter(self.predicate.matches, vacancies)
+        )
+        return top_by_salary(matching, self.limit)
+
+    def apply(self, vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+        """
+        Returns the matching vacancies, up to the limit.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies to filter.
+
+        Returns:
+            List[Vacancy]: The matching vacancies.
+        """
+        return list(self.run(vacancies))
@@ -0,0 +1,406 @@
+""" Full-text inverted index module"""
+import math
+import os
+import re
+import tempfile
+from bisect import bisect_left
+from collections import Counter
+from heapq import nlargest
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from src.json_codec import JSONCodec, get_codec
+from src.vacancy import Vacancy
+
+DocumentKey = Tuple[str, int]
+
+TAG_PATTERN = re.compile(r'<[^>]*>')
+TOKEN_PATTERN = re.compile(r'\w+')
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str | None) -> List[str]:
+    """
+    Splits Russian or English text into normalized tokens.
+
+    Markup such as the <highlighttext> tags of HH.ru snippets is dropped,
+    tokens are case-folded and 'ё' is folded to 'е'. Single letters are
+    skipped, single digits are kept.
+
+    Args:
+        text (str | None): The text to tokenize.
+
+    Returns:
+        List[str]: The tokens in text order.
+    """
+    if not text:
+        return []
+    text = TAG_PATTERN.sub(' ', text).casefold().replace('ё', 'е')
+    return [
+        token for token in TOKEN_PATTERN.findall(text)
+        if len(token) > 1 or token.isdigit()
+    ]
+
+
+class InvertedIndex:
+    """
+    Inverted index over vacancy titles and descriptions.
+
+    Postings map every token to the documents containing it and the term
+    frequency, keyed by (platform, vacancy_id). Boolean queries intersect
+    or unite postings starting from the rarest token, ranked queries use
+    BM25. A query token ending with '*' matches every token with that
+    prefix.
+
+    Prefix queries run on the sorted vocabulary, which is sorted once on
+    the first prefix query after tokens were added or removed, so building
+    or loading an index never keeps it sorted token by token.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[DocumentKey, int]] = {}
+        self._documents: Dict[DocumentKey, Dict[str, int]] = {}
+        self._lengths: Dict[DocumentKey, int] = {}
+        self._vocabulary: List[str] | None = None
+        self._total_length: int = 0
+        self.source_signature: Any = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, key: DocumentKey) -> bool:
+        return key in self._documents
+
+    @staticmethod
+    def vacancy_text(vacancy: Dict[str, Any]) -> str:
+        """
+        Returns the indexed text of a vacancy dictionary.
+
+        Args:
+            vacancy (Dict[str, Any]): The vacancy as a dictionary.
+
+        Returns:
+            str: The title and description.
+        """
+        return f'{vacancy["title"] or ""} {vacancy["description"] or ""}'
+
+    @classmethod
+    def from_dicts(
+            cls, vacancies: Iterable[Dict[str, Any]]
+    ) -> 'InvertedIndex':
+        """
+        Builds an index over vacancy dictionaries.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): The vacancy dictionaries.
+
+        Returns:
+            InvertedIndex: The index.
+        """
+        index = cls()
+        for vacancy in vacancies:
+            index.add_dict(vacancy)
+        return index
+
+    def add_document(self, key: DocumentKey, text: str) -> None:
+        """
+        Indexes a document, replacing a previous version with the same key.
+
+        Args:
+            key (DocumentKey): The (platform, vacancy_id) of the document.
+            text (str): The text to index.
+
+        Returns:
+            None
+        """
+        self.remove_document(key)
+        tokens = tokenize(text)
+        frequencies = dict(Counter(tokens))
+        self._set_document(key, frequencies, len(tokens))
+
+    def _set_document(
+            self, key: DocumentKey, frequencies: Dict[str, int], length: int
+    ) -> None:
+        """
+        Stores the token frequencies of a document in the postings.
+
+        Args:
+            key (DocumentKey): The (platform, vacancy_id) of the document.
+            frequencies (Dict[str, int]): The term frequencies.
+            length (int): The number of tokens of the document.
+
+        Returns:
+            None
+        """
+        self._documents[key] = frequencies
+        self._lengths[key] = length
+        self._total_length += length
+        for token, frequency in frequencies.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                self._vocabulary = None
+            postings[key] = frequency
+
+    def remove_document(self, key: DocumentKey) -> None:
+        """
+        Removes a document from the index.
+
+        Args:
+            key (DocumentKey): The (platform, vacancy_id) of the document.
+
+        Returns:
+            None
+        """
+        frequencies = self._documents.pop(key, None)
+        if frequencies is None:
+            return
+        self._total_length -= self._lengths.pop(key)
+        for token in frequencies:
+            postings = self._postings[token]
+            del postings[key]
+            if not postings:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def add_dict(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Indexes a vacancy dictionary.
+
+        Args:
+            vacancy (Dict[str, Any]): The vacancy as a dictionary.
+
+        Returns:
+            None
+        """
+        self.add_document(
+            (vacancy['platform'], int(vacancy['vacancy_id'])),
+            self.vacancy_text(vacancy)
+        )
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Indexes a vacancy.
+
+        Args:
+            vacancy (Vacancy): The vacancy to index.
+
+        Returns:
+            None
+        """
+        self.add_dict(vacancy.to_dict())
+
+    def remove(self, vacancy: Vacancy) -> None:
+        """
+        Removes a vacancy from the index.
+
+        Args:
+            vacancy (Vacancy): The vacancy to remove.
+
+        Returns:
+            None
+        """
+        self.remove_document((vacancy.platform, vacancy.vacancy_id))
+
+    def _expand(self, token: str) -> List[str]:
+        """
+        Expands a query token to the indexed tokens it matches.
+
+        Args:
+            token (str): A normalized token, a trailing '*' marks a prefix.
+
+        Returns:
+            List[str]: The matching indexed tokens.
+        """
+        if not token.endswith('*'):
+            return [token] if token in self._postings else []
+
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        prefix = token[:-1]
+        start = bisect_left(vocabulary, prefix)
+        matches = []
+        for position in range(start, len(vocabulary)):
+            if not vocabulary[position].startswith(prefix):
+                break
+            matches.append(vocabulary[position])
+        return matches
+
+    def _query_terms(self, query: str) -> List[List[str]]:
+        """
+        Parses a query into groups of indexed tokens, one per query word.
+
+        Args:
+            query (str): The query, words may end with '*'.
+
+        Returns:
+            List[List[str]]: The indexed tokens matching each word.
+        """
+        terms = []
+        for word in query.split():
+            prefix = word.endswith('*')
+            tokens = tokenize(word.rstrip('*'))
+            for position, token in enumerate(tokens):
+                if prefix and position == len(tokens) - 1:
+                    token += '*'
+                terms.append(self._expand(token))
+        return terms
+
+    def _documents_of(self, tokens: List[str]) -> Set[DocumentKey]:
+        if len(tokens) == 1:
+            return set(self._postings[tokens[0]])
+        documents = set()
+        for token in tokens:
+            documents.update(self._postings[token])
+        return documents
+
+    def search(self, query: str, match_all: bool = True) -> Set[DocumentKey]:
+        """
+        Finds the documents matching a boolean query.
+
+        Args:
+            query (str): The query words.
+            match_all (bool): Require every word (AND) instead of any (OR).
+
+        Returns:
+            Set[DocumentKey]: The keys of the matching documents.
+        """
+        terms = self._query_terms(query)
+        if not terms:
+            return set()
+
+        if not match_all:
+            return self._documents_of(
+                [token for tokens in terms for token in tokens]
+            )
+
+        if not all(terms):
+            return set()
+        terms.sort(
+            key=lambda tokens: sum(
+                len(self._postings[token]) for token in tokens
+            )
+        )
+        documents = self._documents_of(terms[0])
+        for tokens in terms[1:]:
+            if not documents:
+                break
+            if len(tokens) == 1:
+                documents.intersection_update(self._postings[tokens[0]])
+            else:
+                documents &= self._documents_of(tokens)
+        return documents
+
+    def rank(
+            self, query: str, limit: int | None = None,
+            match_all: bool = False
+    ) -> List[Tuple[DocumentKey, float]]:
+        """
+        Ranks the documents matching a query with BM25.
+
+        Args:
+            query (str): The query words.
+            limit (int | None): The maximum number of results.
+            match_all (bool): Only rank documents containing every word.
+
+        Returns:
+            List[Tuple[DocumentKey, float]]: The keys and scores, best first.
+        """
+        terms = self._query_terms(query)
+        candidates = self.search(query, match_all) if match_all else None
+        if not self._documents:
+            return []
+
+        total = len(self._documents)
+        lengths = self._lengths
+        base = BM25_K1 * (1 - BM25_B)
+        scale = BM25_K1 * BM25_B / (self._total_length / total or 1.0)
+        scores: Dict[DocumentKey, float] = {}
+        for token in {token for tokens in terms for token in tokens}:
+            postings = self._postings[token]
+            idf = math.log(1 + (total - len(postings) + 0.5) /
+                           (len(postings) + 0.5))
+            weight = idf * (BM25_K1 + 1)
+            for key, frequency in postings.items():
+                if candidates is not None and key not in candidates:
+                    continue
+                scores[key] = scores.get(key, 0.0) + weight * frequency / (
+                    frequency + base + scale * lengths[key]
+                )
+
+        if limit is None:
+            return sorted(scores.items(), key=lambda item: -item[1])
+        return nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def save(self, file_path: str, codec: JSONCodec | None = None) -> None:
+        """
+        Atomically saves the index to a JSON file.
+
+        The index is written and synced to a temporary file in the same
+        directory, which then replaces the target. The temporary file is
+        removed if the save fails.
+
+        Args:
+            file_path (str): The path of the index file.
+            codec (JSONCodec | None): The JSON codec. Defaults to the
+            fastest installed one.
+
+        Returns:
+            None
+        """
+        data = {
+            'source_signature': self.source_signature,
+            'documents': [
+                [platform, vacancy_id, self._lengths[(platform, vacancy_id)],
+                 frequencies]
+                for (platform, vacancy_id), frequencies
+                in self._documents.items()
+            ]
+        }
+        encoded = (codec if codec is not None else get_codec()).dumps(
+            data, compact=True
+        )
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(file_path)),
+            prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                f.write(encoded)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(
+            cls, file_path: str, codec: JSONCodec | None = None
+    ) -> 'InvertedIndex':
+        """
+        Loads an index saved by save().
+
+        Args:
+            file_path (str): The path of the index file.
+            codec (JSONCodec | None): The JSON codec. Defaults to the
+            fastest installed one.
+
+        Returns:
+            InvertedIndex: The index.
+        """
+        with open(file_path, 'rb') as f:
+            data = (codec if codec is not None else get_codec()).loads(
+                f.read()
+            )
+
+        index = cls()
+        source_signature = data['source_signature']
+        index.source_signature = (
+            tuple(source_signature) if source_signature is not None else None
+        )
+        for platform, vacancy_id, length, frequencies in data['documents']:
+            index._set_document((platform, vacancy_id), frequencies, length)
+        return index
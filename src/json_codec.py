@@ -0,0 +1,143 @@
+""" Pluggable JSON codec module"""
+import json
+from abc import ABC, abstractmethod
+from json import JSONDecodeError
+from typing import Any, Dict, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONCodec(ABC):
+    """
+    Abstract base class for JSON encoders and decoders.
+
+    Codecs work on UTF-8 bytes and keep non-ASCII characters as they are.
+    Decoding errors are raised as json.JSONDecodeError whatever library
+    is used.
+    """
+
+    name: str = ''
+
+    @abstractmethod
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        """
+        Encodes data as JSON.
+
+        Args:
+            data (Any): The data to encode.
+            compact (bool): Omit indentation and whitespace.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decodes a JSON document.
+
+        Args:
+            data (bytes | str): The JSON document.
+
+        Returns:
+            Any: The decoded data.
+        """
+        pass
+
+
+class StdlibCodec(JSONCodec):
+    """
+    Codec built on the standard json module, always available.
+    """
+
+    name = 'json'
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        if compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+        return text.encode('utf-8')
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec built on orjson.
+    """
+
+    name = 'orjson'
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        if compact:
+            return orjson.dumps(data)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def loads(self, data: bytes | str) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Codec built on msgspec.
+    """
+
+    name = 'msgspec'
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        encoded = self._encoder.encode(data)
+        if compact:
+            return encoded
+        return msgspec.json.format(encoded, indent=2)
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as error:
+            raise JSONDecodeError(str(error), '', 0) from None
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {'json': StdlibCodec}
+if msgspec is not None:
+    CODECS['msgspec'] = MsgspecCodec
+if orjson is not None:
+    CODECS['orjson'] = OrjsonCodec
+
+PREFERRED_CODECS = ('orjson', 'msgspec', 'json')
+
+
+def get_codec(name: str | None = None) -> JSONCodec:
+    """
+    Returns a codec by name, or the fastest installed one.
+
+    Args:
+        name (str | None): 'orjson', 'msgspec' or 'json'. If None, the
+        first installed codec of PREFERRED_CODECS is used.
+
+    Returns:
+        JSONCodec: The codec.
+
+    Raises:
+        ValueError: If the named codec is unknown or not installed.
+    """
+    if name is None:
+        name = next(name for name in PREFERRED_CODECS if name in CODECS)
+    if name not in CODECS:
+        raise ValueError(f'JSON codec "{name}" is not available')
+    return CODECS[name]()
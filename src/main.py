@@ -1,18 +1,71 @@
 """Main app module."""
 import os
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Tuple
 
 from src.constants import FILE_PATH
+from src.dedup import Deduplicator
 from src.file_handler_json import JSONFileHandler
+from src.filter_pipeline import FilterPipeline
+from src.parser import Parser
 from src.parser_hh import HHParser
 from src.parser_superjob import SuperJobParser
 from src.vacancy import Vacancy
 from src.vacancy_filter import SalaryRangeFilter
 
 
+def stream_platform_vacancies(
+        parser: Parser, count: int, word_ro_search: str,
+        salary_filter: SalaryRangeFilter, salary_min_max: List[int | None],
+        pipeline: FilterPipeline | None = None,
+        deduplicator: Deduplicator | None = None
+) -> Iterator[Vacancy]:
+    """
+    Stream filtered vacancies of a platform page by page.
+
+    Nothing is fetched until the stream is consumed, and the parser is
+    closed once the stream is exhausted or closed. Once the pipeline limit
+    is reached no further pages are requested.
+
+    Args:
+        parser (Parser): The platform parser.
+        count (int): The number of vacancies to fetch.
+        word_ro_search (str): The keyword to search for in vacancies.
+        salary_filter (SalaryRangeFilter): The salary range filter.
+        salary_min_max (List[int | None]): The salary range
+        [min_salary, max_salary] for filtering.
+        pipeline (FilterPipeline | None): Additional filters and limit.
+        deduplicator (Deduplicator | None): Drops postings already seen,
+        on this or another platform sharing the deduplicator. Applied
+        before the pipeline, so duplicates do not count towards its limit.
+
+    Returns:
+        Iterator[Vacancy]: The filtered vacancies.
+    """
+    with parser:
+        parsed = parser.stream_vacancies(word_ro_search, count)
+        vacancies = parsed
+
+        if salary_min_max.count(None) != 2:
+            vacancies = salary_filter.iter_filtered_vacancies(
+                vacancies, salary_min_max
+            )
+        if deduplicator is not None:
+            vacancies = deduplicator.filter(vacancies)
+        if pipeline is not None:
+            vacancies = pipeline.run(vacancies)
+
+        try:
+            yield from vacancies
+        finally:
+            parsed.close()
+
+
 def hh_processor(
         count: int, word_ro_search: str, salary_filter: SalaryRangeFilter,
-        salary_min_max: List[int]
+        salary_min_max: List[int], max_workers: int = 1,
+        deduplicator: Deduplicator | None = None, processes: int = 0
 ) -> List[Vacancy]:
     """
     Process vacancies from HH.ru.
@@ -23,50 +76,28 @@ def hh_processor(
         salary_filter (SalaryRangeFilter): The salary range filter.
         salary_min_max (List[int]): The salary range [min_salary, max_salary]
         for filtering.
+        max_workers (int): The maximum number of pages fetched concurrently.
+        deduplicator (Deduplicator | None): Drops postings already seen.
+        processes (int): The number of processes converting pages of pulls
+        of at least CONVERSION_THRESHOLD vacancies, 0 to convert them
+        in-process.
 
     Returns:
         List[Vacancy]: The list of filtered vacancies from HH.ru.
     """
-    hh_parser = HHParser()
-    hh_vacancies = hh_parser.parse_vacancies(word_ro_search, count)
-
-    hh_vacancy_obj_list = [
-        Vacancy(
-            platform='HH.ru',
-            vacancy_id=vacancy['id'],
-            title=vacancy['name'],
-            url=vacancy['alternate_url'],
-            salary_from=(
-                vacancy['salary']['from'] if vacancy['salary'] else None
-            ),
-            salary_to=(
-                vacancy['salary']['to'] if vacancy['salary'] else None
-            ),
-            currency=(
-                vacancy['salary']['currency'] if vacancy['salary'] else None
-            ),
-            description=vacancy['snippet'][
-                'requirement'
-            ] if vacancy['snippet'][
-                'requirement'
-            ] else vacancy['snippet'][
-                'responsibility'
-            ]
-        )
-        for vacancy in hh_vacancies
-    ]
-
-    if salary_min_max.count(None) == 2:
-        return hh_vacancy_obj_list
-    else:
-        return salary_filter.filter_vacancies(
-            hh_vacancy_obj_list, salary_min_max
+    return list(
+        stream_platform_vacancies(
+            HHParser(max_workers=max_workers, processes=processes),
+            count, word_ro_search,
+            salary_filter, salary_min_max, deduplicator=deduplicator
         )
+    )
 
 
 def superjob_processor(
         count: int, word_ro_search: str, salary_filter: SalaryRangeFilter,
-        salary_min_max: List[int | None]
+        salary_min_max: List[int | None], max_workers: int = 1,
+        deduplicator: Deduplicator | None = None, processes: int = 0
 ) -> List[Vacancy]:
     """
     Process vacancies from SuperJob.ru.
@@ -77,33 +108,22 @@ def superjob_processor(
         salary_filter (SalaryRangeFilter): The salary range filter.
         salary_min_max (List[int | None]): The salary range
         [min_salary, max_salary] for filtering.
+        max_workers (int): The maximum number of pages fetched concurrently.
+        deduplicator (Deduplicator | None): Drops postings already seen.
+        processes (int): The number of processes converting pages of pulls
+        of at least CONVERSION_THRESHOLD vacancies, 0 to convert them
+        in-process.
 
     Returns:
         List[Vacancy]: The list of filtered vacancies from SuperJob.ru.
     """
-    sj_parser = SuperJobParser()
-    sj_vacancies = sj_parser.parse_vacancies(word_ro_search, count)
-
-    sj_vacancy_obj_list = [
-        Vacancy(
-            platform='SuperJob.ru',
-            vacancy_id=vacancy['id'],
-            title=vacancy['profession'],
-            url=vacancy['link'],
-            salary_from=vacancy['payment_from'],
-            salary_to=vacancy['payment_to'],
-            currency=vacancy['currency'],
-            description=vacancy['vacancyRichText']
-        )
-        for vacancy in sj_vacancies
-    ]
-
-    if salary_min_max.count(None) == 2:
-        return sj_vacancy_obj_list
-    else:
-        return salary_filter.filter_vacancies(
-            sj_vacancy_obj_list, salary_min_max
+    return list(
+        stream_platform_vacancies(
+            SuperJobParser(max_workers=max_workers, processes=processes),
+            count, word_ro_search,
+            salary_filter, salary_min_max, deduplicator=deduplicator
         )
+    )
 
 
 def print_vacancies(platforms_vacancies: Dict[str, List[Vacancy]]):
@@ -127,9 +147,98 @@ def print_vacancies(platforms_vacancies: Dict[str, List[Vacancy]]):
             print(vacancy)
 
 
+def timed_processor(
+        processor: Callable[..., List[Vacancy]], *args
+) -> Tuple[List[Vacancy], float]:
+    """
+    Run a platform processor and measure how long it takes.
+
+    Args:
+        processor (Callable[..., List[Vacancy]]): The platform processor.
+        *args: The arguments passed to the processor.
+
+    Returns:
+        Tuple[List[Vacancy], float]: The processed vacancies and the elapsed
+        time in seconds.
+    """
+    start = time.perf_counter()
+    vacancies = processor(*args)
+    return vacancies, time.perf_counter() - start
+
+
+def print_timings(timings: Dict[str, float]):
+    """
+    Print how long each platform took to process.
+
+    Args:
+        timings (Dict[str, float]): The dictionary of platform and elapsed
+        time in seconds.
+    """
+    for platform, elapsed in timings.items():
+        print(f'{platform}: {elapsed:.2f} s')
+
+
+PLATFORM_PROCESSORS = {
+    '1': ('HH.ru', hh_processor),
+    '2': ('SuperJob.ru', superjob_processor)
+}
+
+PLATFORM_PARSERS = {
+    '1': ('HH.ru', HHParser),
+    '2': ('SuperJob.ru', SuperJobParser)
+}
+
+
+def stream_vacancies(
+        selected_platforms: Dict[str, str],
+        count: int, word_ro_search: str, salary_min_max: List[int],
+        max_workers: int = 1, pipeline: FilterPipeline | None = None,
+        deduplicator: Deduplicator | None = None, processes: int = 0
+) -> Dict[str, Iterator[Vacancy]]:
+    """
+    Lazy counterpart of main: streams filtered vacancies per platform.
+
+    Platforms ruled out by the pipeline are not queried at all.
+
+    Args:
+        selected_platforms (Dict[str, str]): The selected platforms.
+        count (int): The number of vacancies to fetch.
+        word_ro_search (str): The keyword to search for in vacancies.
+        salary_min_max (List[int]): The salary range [min_salary, max_salary]
+        for filtering.
+        max_workers (int): The maximum number of pages fetched concurrently
+        per platform.
+        pipeline (FilterPipeline | None): Additional filters and a limit
+        applied to every platform stream.
+        deduplicator (Deduplicator | None): Drops postings already seen in
+        any of the streams.
+        processes (int): The number of processes converting pages of large
+        pulls per platform, 0 to convert them in-process.
+
+    Returns:
+        Dict[str, Iterator[Vacancy]]: The dictionary of platform and
+        corresponding stream of filtered vacancies.
+    """
+    salary_filter = SalaryRangeFilter()
+
+    return {
+        platform: stream_platform_vacancies(
+            parser_class(max_workers=max_workers, processes=processes),
+            count, word_ro_search,
+            salary_filter, salary_min_max, pipeline, deduplicator
+        )
+        for key, (platform, parser_class) in PLATFORM_PARSERS.items()
+        if key in selected_platforms
+        and (pipeline is None or pipeline.accepts_platform(platform))
+    }
+
+
 def main(
         selected_platforms: Dict[str, str],
-        count: int, word_ro_search: str, salary_min_max: List[int]
+        count: int, word_ro_search: str, salary_min_max: List[int],
+        max_workers: int = 1, parallel: bool = False,
+        timings: Dict[str, float] | None = None,
+        deduplicate: bool = False, processes: int = 0
 ) -> Dict[str, List[Vacancy]]:
     """
     The main function to execute the Vacant app.
@@ -140,6 +249,17 @@ def main(
         word_ro_search (str): The keyword to search for in vacancies.
         salary_min_max (List[int]): The salary range [min_salary, max_salary]
         for filtering.
+        max_workers (int): The maximum number of pages fetched concurrently
+        per platform.
+        parallel (bool): Process the selected platforms at the same time
+        instead of one after another.
+        timings (Dict[str, float] | None): If given, filled with the elapsed
+        time in seconds of every processed platform.
+        deduplicate (bool): Drop postings that were already returned for
+        this or another platform. In parallel mode the platform whose copy
+        is kept depends on which page arrives first.
+        processes (int): The number of processes converting pages of large
+        pulls per platform, 0 to convert them in-process.
 
     Returns:
         Dict[str, List[Vacancy]]: The dictionary of platform and
@@ -147,25 +267,44 @@ def main(
     """
     salary_filter = SalaryRangeFilter()
 
-    hh_vacancies_filtered = []
-    sj_vacancies_filtered = []
+    result = {platform: [] for platform, _ in PLATFORM_PROCESSORS.values()}
+    if timings is None:
+        timings = {}
 
-    if '1' in selected_platforms:
-        hh_vacancies_filtered = hh_processor(
-            count, word_ro_search, salary_filter,
-            salary_min_max
-        )
+    jobs = [
+        (platform, processor)
+        for key, (platform, processor) in PLATFORM_PROCESSORS.items()
+        if key in selected_platforms
+    ]
+    arguments = (
+        count, word_ro_search, salary_filter,
+        salary_min_max, max_workers,
+        Deduplicator() if deduplicate else None, processes
+    )
+
+    if parallel and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                platform: executor.submit(
+                    timed_processor, processor, *arguments
+                )
+                for platform, processor in jobs
+            }
+            outcomes = {
+                platform: future.result()
+                for platform, future in futures.items()
+            }
+    else:
+        outcomes = {
+            platform: timed_processor(processor, *arguments)
+            for platform, processor in jobs
+        }
 
-    if '2' in selected_platforms:
-        sj_vacancies_filtered = superjob_processor(
-            count, word_ro_search, salary_filter,
-            salary_min_max
-        )
+    for platform, (vacancies, elapsed) in outcomes.items():
+        result[platform] = vacancies
+        timings[platform] = elapsed
 
-    return {
-        'HH.ru': hh_vacancies_filtered,
-        'SuperJob.ru': sj_vacancies_filtered
-    }
+    return result
 
 
 def user_interface():
@@ -244,10 +383,21 @@ def user_interface():
 
     salary_min_max = [min_salary, max_salary]
 
+    timings = {}
     if file_to_read.lower() != 'y':
+        parallel = False
+        if len(selected_platforms) > 1:
+            parallel = input(
+                'Search the platforms at the same time? (y/N): '
+            ) == 'y'
+        deduplicate = input(
+            'Drop vacancies already found on another platform? (y/N): '
+        ) == 'y'
+
         all_vacancies = main(
             selected_platforms, count,
-            word_to_search, salary_min_max
+            word_to_search, salary_min_max,
+            parallel=parallel, timings=timings, deduplicate=deduplicate
         )
     else:
         all_vacancies = (
@@ -258,6 +408,7 @@ def user_interface():
         )
 
     print_vacancies(all_vacancies)
+    print_timings(timings)
 
     if file_to_read.lower() != 'y':
         save_vacancies = input(
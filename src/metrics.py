@@ -0,0 +1,312 @@
+""" Run metrics module"""
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+from src.constants import METRICS_BUCKETS, METRICS_ENABLED
+
+
+class Histogram:
+    """
+    Histogram of observed values over fixed bucket upper bounds.
+    """
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds: Sequence[float] = METRICS_BUCKETS):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            bounds (Sequence[float]): The ascending bucket upper bounds.
+            Larger values fall into an implicit +Inf bucket.
+        """
+        self.bounds: Sequence[float] = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Records a value.
+
+        Args:
+            value (float): The observed value.
+
+        Returns:
+            None
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Dict[str, int]:
+        """
+        Returns the number of values up to every bucket bound.
+
+        Returns:
+            Dict[str, int]: The cumulative counts by upper bound, the last
+            one keyed '+Inf'.
+        """
+        result = {}
+        total = 0
+        for bound, count in zip([*self.bounds, '+Inf'], self.counts):
+            total += count
+            result[str(bound)] = total
+        return result
+
+
+class _Timer:
+    """
+    Context manager recording its duration in a histogram.
+    """
+
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics: 'Metrics', name: str):
+        self.metrics: Metrics = metrics
+        self.name: str = name
+        self.start: float = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+
+
+class _NullTimer:
+    """
+    Context manager that records nothing, used while metrics are disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Counters and latency histograms of a run.
+
+    Instrumented code checks enabled (or gets a shared no-op timer) before
+    doing any work, so disabled metrics cost an attribute lookup per
+    instrumented call. Stage durations are histograms named
+    '<stage>_seconds'; counters are named '<what>_total'.
+
+    Snapshots can be written as JSON or Prometheus text, and passed to
+    registered hooks. All methods are thread-safe.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initializes empty metrics.
+
+        Args:
+            enabled (bool): Record metrics.
+        """
+        self.enabled: bool = enabled
+        self._counters: Dict[str, float] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._hooks: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The counter name.
+            value (float): The amount to add.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Records a value in a histogram.
+
+        Args:
+            name (str): The histogram name.
+            value (float): The observed value, e.g. seconds.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def timer(self, name: str) -> _Timer | _NullTimer:
+        """
+        Returns a context manager recording its duration in a histogram.
+
+        Args:
+            name (str): The histogram name, e.g. 'fetch_seconds'.
+
+        Returns:
+            _Timer | _NullTimer: The timer, a shared no-op one while
+            disabled.
+        """
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name)
+
+    def counted(self, items: Iterable[Any], name: str) -> Iterator[Any]:
+        """
+        Passes items through, counting them once the iteration ends.
+
+        Args:
+            items (Iterable[Any]): The items.
+            name (str): The counter name.
+
+        Returns:
+            Iterator[Any]: The same items.
+        """
+        count = 0
+        try:
+            for item in items:
+                count += 1
+                yield item
+        finally:
+            self.increment(name, count)
+
+    def reset(self) -> None:
+        """
+        Drops all recorded values.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a copy of the recorded values.
+
+        Returns:
+            Dict[str, Any]: The counters, and every histogram as its count,
+            sum and cumulative bucket counts.
+        """
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'histograms': {
+                    name: {
+                        'count': histogram.count,
+                        'sum': histogram.sum,
+                        'buckets': histogram.cumulative()
+                    }
+                    for name, histogram in self._histograms.items()
+                }
+            }
+
+    def to_json(self) -> str:
+        """
+        Formats a snapshot as JSON.
+
+        Returns:
+            str: The JSON document.
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = 'vacant_') -> str:
+        """
+        Formats a snapshot in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix of every metric name.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f'# TYPE {prefix}{name} counter')
+            lines.append(f'{prefix}{name} {value}')
+        for name, histogram in sorted(snapshot['histograms'].items()):
+            lines.append(f'# TYPE {prefix}{name} histogram')
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{prefix}{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f'{prefix}{name}_sum {histogram["sum"]}')
+            lines.append(f'{prefix}{name}_count {histogram["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, file_path: str) -> None:
+        """
+        Atomically writes a snapshot to a file: JSON for '.json' files,
+        Prometheus text otherwise (e.g. for the node exporter textfile
+        collector).
+
+        Args:
+            file_path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        text = self.to_json() if file_path.endswith('.json') \
+            else self.to_prometheus()
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(file_path)),
+            prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def add_hook(self, hook: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Registers a callback receiving snapshots on publish().
+
+        Args:
+            hook (Callable[[Dict[str, Any]], None]): The callback.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def publish(self) -> None:
+        """
+        Passes a snapshot to every registered hook.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            hooks = list(self._hooks)
+        snapshot = self.snapshot()
+        for hook in hooks:
+            hook(snapshot)
+
+
+METRICS = Metrics(enabled=METRICS_ENABLED)
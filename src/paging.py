@@ -0,0 +1,156 @@
+""" Paging and retry helpers shared by the parsers module"""
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, List
+
+from src.metrics import METRICS
+from src.rate_limiter import TokenBucket, backoff_delay, parse_retry_after
+
+
+class PagingMixin:
+    """
+    Mixin class with the paging and retry rules of the platform APIs.
+
+    Shared by the synchronous and the asyncio parsers, which only differ
+    in how they wait and schedule requests. Subclasses set per_page, the
+    number of vacancies of a full page, and items_key, the key of the
+    vacancy list in a JSON page, and define max_retries.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def count_pages(self, count: int) -> int:
+        """
+        Calculates how many pages are needed to retrieve the given count.
+
+        Args:
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            int: The number of pages.
+        """
+        return count // self.per_page + 1 \
+            if count % self.per_page else count // self.per_page
+
+    def page_size(self, page: Any) -> int | None:
+        """
+        Counts the vacancies of a decoded page.
+
+        Args:
+            page (Any): A page decoded into a list of vacancies or into the
+            JSON response, whose vacancies are under items_key.
+
+        Returns:
+            int | None: The number of vacancies, None for undecoded bodies.
+        """
+        if isinstance(page, list):
+            return len(page)
+        if isinstance(page, dict):
+            return len(page.get(self.items_key) or ())
+        return None
+
+    def is_last_page(self, page: Any) -> bool:
+        """
+        Checks whether a decoded page is the last one of a search.
+
+        Args:
+            page (Any): The decoded page.
+
+        Returns:
+            bool: True if the page holds fewer than per_page vacancies.
+        """
+        size = self.page_size(page)
+        return size is not None and size < self.per_page
+
+    def can_retry(self, attempt: int) -> bool:
+        """
+        Checks whether a failed attempt may be retried.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 0.
+
+        Returns:
+            bool: True if fewer than max_retries retries were made.
+        """
+        return attempt < self.max_retries
+
+    @staticmethod
+    def retry_delay(
+            bucket: TokenBucket, attempt: int, status: int | None = None,
+            retry_after: str | None = None
+    ) -> float:
+        """
+        Records the retry of a failed attempt and returns how long to wait.
+
+        The delay is taken from Retry-After, with exponential backoff as
+        the fallback. A 429 response slows the whole bucket down instead,
+        so the next acquire waits for it.
+
+        Args:
+            bucket (TokenBucket): The rate limiter bucket of the host.
+            attempt (int): The number of the failed attempt, starting at 0.
+            status (int | None): The response status, None if no response
+            was received.
+            retry_after (str | None): The Retry-After header.
+
+        Returns:
+            float: The seconds to wait before the retry.
+        """
+        METRICS.increment('retries_total')
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = backoff_delay(attempt)
+        if status == 429:
+            METRICS.increment('throttled_total')
+            bucket.throttled(delay)
+            return 0.0
+        return delay
+
+
+class PageWindow:
+    """
+    Requests pages ahead of the consumer and hands them out in page order.
+
+    Iterating submits up to width pages at a time and yields the pending
+    request of the oldest page, a concurrent.futures.Future or an
+    asyncio.Task, for the consumer to wait on. Stopping the iteration
+    early leaves the later requests pending until cancel() is called.
+    """
+
+    def __init__(
+            self, pages: int, width: int, submit: Callable[[int], Any]
+    ):
+        """
+        Initializes the window.
+
+        Args:
+            pages (int): The maximum number of pages to request.
+            width (int): The maximum number of pending requests.
+            submit (Callable[[int], Any]): Starts the request of a page
+            and returns its future or task.
+        """
+        self.pages: int = pages
+        self.width: int = max(1, width)
+        self.submit: Callable[[int], Any] = submit
+        self.pending: Deque[Any] = deque()
+        self.next_page: int = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        while self.next_page < self.pages or self.pending:
+            while self.next_page < self.pages \
+                    and len(self.pending) < self.width:
+                self.pending.append(self.submit(self.next_page))
+                self.next_page += 1
+            yield self.pending.popleft()
+
+    def cancel(self) -> List[Any]:
+        """
+        Cancels the pending requests.
+
+        Returns:
+            List[Any]: The cancelled futures or tasks.
+        """
+        cancelled = list(self.pending)
+        self.pending.clear()
+        for request in cancelled:
+            request.cancel()
+        return cancelled
@@ -0,0 +1,167 @@
+""" Process-pool conversion of API pages module"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List
+
+from src.constants import CONVERSION_CHUNK_PAGES, CONVERSION_THRESHOLD
+from src.decoders import VacancyDecoder
+from src.metrics import METRICS
+from src.vacancy import Vacancy
+
+
+def _decode_chunk(
+        decoder_factory: Callable[[], VacancyDecoder], bodies: List[bytes]
+) -> List[List[tuple]]:
+    """
+    Decodes a chunk of pages in a worker process.
+
+    Args:
+        decoder_factory (Callable[[], VacancyDecoder]): Creates the page
+        decoder, must be picklable.
+        bodies (List[bytes]): The raw page bodies.
+
+    Returns:
+        List[List[tuple]]: The vacancies of every page made by
+        Vacancy.to_tuple, in page order.
+    """
+    decoder = decoder_factory()
+    return [
+        [vacancy.to_tuple() for vacancy in decoder.decode(body)]
+        for body in bodies
+    ]
+
+
+class PageConverter:
+    """
+    Converts raw API pages into vacancies on a pool of processes.
+
+    Workers receive raw page bodies, which are cheap to pickle, and do
+    the JSON decoding, field lookups, description truncation and salary
+    computation. They return vacancies as compact tuples, which the
+    parent rebuilds without running Vacancy.__init__ again. Pulls of
+    fewer than threshold vacancies are not worth the inter-process
+    overhead and should be converted in-process, see use_for.
+
+    The pool is started on first use and reused until close().
+    """
+
+    def __init__(
+            self, decoder_factory: Callable[[], VacancyDecoder],
+            processes: int | None = None,
+            threshold: int = CONVERSION_THRESHOLD,
+            chunk_pages: int = CONVERSION_CHUNK_PAGES
+    ):
+        """
+        Initializes the converter.
+
+        Args:
+            decoder_factory (Callable[[], VacancyDecoder]): Creates the
+            page decoder in the workers, e.g. functools.partial of the
+            decoder class. Must be picklable.
+            processes (int | None): The number of worker processes.
+            Defaults to the number of CPUs.
+            threshold (int): The minimum number of vacancies of a pull
+            converted on the pool.
+            chunk_pages (int): The number of pages sent to a worker at
+            a time.
+        """
+        self.decoder_factory: Callable[[], VacancyDecoder] = decoder_factory
+        self.processes: int = processes if processes else os.cpu_count() or 1
+        self.threshold: int = threshold
+        self.chunk_pages: int = max(1, chunk_pages)
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def use_for(self, count: int) -> bool:
+        """
+        Checks whether a pull is large enough for the pool.
+
+        Args:
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            bool: True if count reaches the threshold.
+        """
+        return count >= self.threshold
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.processes)
+        return self.__executor
+
+    def close(self) -> None:
+        """
+        Shuts the worker processes down.
+
+        Returns:
+            None
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def decode_pages(
+            self, bodies: Iterable[bytes], per_page: int | None = None
+    ) -> Iterator[Vacancy]:
+        """
+        Converts page bodies as they arrive, chunk by chunk.
+
+        Up to twice the number of workers chunks are converted ahead of
+        the consumer. Vacancies are yielded in page order. Once a page
+        with fewer than per_page vacancies is converted, the pending
+        chunks are cancelled and bodies is closed, so no further pages
+        are requested.
+
+        Args:
+            bodies (Iterable[bytes]): The raw page bodies.
+            per_page (int | None): The number of vacancies of a full page,
+            or None to convert every body.
+
+        Returns:
+            Iterator[Vacancy]: The vacancies.
+        """
+        executor = self._get_executor()
+        window = 2 * self.processes
+        pending = deque()
+        chunk = []
+        last_page = False
+
+        def drain(limit: int) -> Iterator[Vacancy]:
+            nonlocal last_page
+            while not last_page and len(pending) > limit:
+                for rows in pending.popleft().result():
+                    METRICS.increment('vacancies_total', len(rows))
+                    yield from map(Vacancy.from_tuple, rows)
+                    if per_page is not None and len(rows) < per_page:
+                        last_page = True
+                        break
+
+        try:
+            for body in bodies:
+                chunk.append(body)
+                if len(chunk) == self.chunk_pages:
+                    pending.append(
+                        executor.submit(
+                            _decode_chunk, self.decoder_factory, chunk
+                        )
+                    )
+                    chunk = []
+                    yield from drain(window - 1)
+                    if last_page:
+                        return
+            if chunk:
+                pending.append(
+                    executor.submit(_decode_chunk, self.decoder_factory, chunk)
+                )
+            yield from drain(0)
+        finally:
+            for future in pending:
+                future.cancel()
+            if hasattr(bodies, 'close'):
+                bodies.close()
@@ -1,8 +1,21 @@
 """Abstract base class for parsers modules."""
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.constants import MAX_RETRIES, REQUEST_TIMEOUT
+from src.filter_pipeline import top_by_salary
+from src.json_codec import JSONCodec, get_codec
+from src.metrics import METRICS
+from src.paging import PageWindow, PagingMixin
+from src.parallel_convert import PageConverter
+from src.rate_limiter import RateLimiter
+from src.response_cache import ResponseCache
+from src.vacancy import Vacancy
 
 
 class Parser(ABC):
@@ -15,7 +28,16 @@ class Parser(ABC):
         'url',
         'headers',
         'per_page',
-        'parameters'
+        'parameters',
+        'max_workers',
+        'session',
+        'cache',
+        'rate_limiter',
+        'timeout',
+        'max_retries',
+        'codec',
+        'decoder',
+        'converter'
     )
 
     @abstractmethod
@@ -34,14 +56,275 @@ class Parser(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_vacancies(
+            self, keyword: str, count: int
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields raw vacancies page by page as soon as each page arrives.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The raw vacancies.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def to_vacancy(vacancy: Dict[str, Any]) -> Vacancy:
+        """
+        Converts a raw vacancy of the platform to a Vacancy object.
+
+        Args:
+            vacancy (Dict[str, Any]): The raw vacancy.
+
+        Returns:
+            Vacancy: The vacancy object.
+        """
+        pass
+
+    def stream_vacancies(self, keyword: str, count: int) -> Iterator[Vacancy]:
+        """
+        Yields Vacancy objects page by page as soon as each page arrives.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            Iterator[Vacancy]: The vacancy objects.
+        """
+        for vacancy in self.iter_vacancies(keyword, count):
+            yield self.to_vacancy(vacancy)
+
+    def top_vacancies(
+            self, keyword: str, count: int, top: int
+    ) -> List[Vacancy]:
+        """
+        Returns the best-paid of the parsed vacancies.
+
+        Pages are converted as they arrive and only top vacancies are
+        held at a time.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+            top (int): The number of vacancies to select.
+
+        Returns:
+            List[Vacancy]: The vacancies, highest salary first, see
+            top_by_salary for the order of equal salaries.
+        """
+        return top_by_salary(self.stream_vacancies(keyword, count), top)
+
+    @staticmethod
+    @abstractmethod
+    def published_at(vacancy: Dict[str, Any]) -> float:
+        """
+        Returns the publication time of a raw vacancy of the platform.
+
+        Args:
+            vacancy (Dict[str, Any]): The raw vacancy.
+
+        Returns:
+            float: The publication time as a Unix timestamp.
+        """
+        pass
+
+    @abstractmethod
+    def keyword_parameters(self, keyword: str) -> Dict[str, Any]:
+        """
+        Returns the request parameters that search for a keyword.
+
+        Args:
+            keyword (str): The keyword to search for.
+
+        Returns:
+            Dict[str, Any]: The request parameters.
+        """
+        pass
+
+    @abstractmethod
+    def since_parameters(
+            self, since: float | None, until: float | None = None
+    ) -> Dict[str, Any]:
+        """
+        Returns the request parameters that order vacancies newest first
+        and restrict them to those published in a time window.
+
+        Args:
+            since (float | None): The Unix timestamp of the oldest wanted
+            publication, or None to not restrict the date.
+            until (float | None): The Unix timestamp of the newest wanted
+            publication, or None for no upper bound.
+
+        Returns:
+            Dict[str, Any]: The request parameters.
+        """
+        pass
+
+    def iter_published_vacancies(
+            self, keyword: str, count: int, since: float | None = None,
+            until: float | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields up to count raw vacancies published in a time window, newest
+        first. Both bounds are inclusive.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The maximum number of vacancies to retrieve.
+            since (float | None): The Unix timestamp of the oldest wanted
+            publication, or None to not restrict the date.
+            until (float | None): The Unix timestamp of the newest wanted
+            publication, or None for no upper bound.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The raw vacancies.
+        """
+        saved_parameters = dict(self.parameters)
+        self.parameters.update(self.since_parameters(since, until))
+        try:
+            yield from self.iter_vacancies(keyword, count)
+        finally:
+            self.parameters.clear()
+            self.parameters.update(saved_parameters)
+
 
-class ParserMixin:
+class ParserMixin(PagingMixin):
     """
     Mixin class for making HTTP requests.
+
+    The mixin owns a pooled requests.Session, so connections are kept alive
+    and reused between pages. Call close() or use the parser as a context
+    manager to release them. An optional response cache serves repeated
+    requests without network I/O.
+
+    Requests are paced by a per-host rate limiter shared by all parsers of
+    the process. Timeouts, connection errors, 429 and 5xx responses are
+    retried with exponential backoff, honouring Retry-After.
     """
 
+    def __init__(
+            self, max_workers: int = 1, pool_size: int | None = None,
+            cache: ResponseCache | None = None,
+            rate_limiter: RateLimiter | None = None,
+            timeout: float | tuple = REQUEST_TIMEOUT,
+            max_retries: int = MAX_RETRIES,
+            converter: PageConverter | None = None
+    ):
+        """
+        Initializes the mixin.
+
+        Args:
+            max_workers (int): The maximum number of pages fetched at the
+            same time. 1 means pages are fetched one after another.
+            pool_size (int | None): The maximum number of kept-alive
+            connections. Defaults to max_workers.
+            cache (ResponseCache | None): The cache of response bodies.
+            Responses are not cached if None.
+            rate_limiter (RateLimiter | None): The rate limiter. Defaults to
+            the process-wide limiter.
+            timeout (float | tuple): The request timeout in seconds, or the
+            (connect, read) timeouts.
+            max_retries (int): The maximum number of retries of a request.
+            converter (PageConverter | None): Converts the pages of large
+            pulls on a process pool. Pages are converted in-process if
+            None.
+        """
+        self.max_workers: int = max(1, max_workers)
+        self.session: requests.Session = self.create_session(
+            pool_size if pool_size else self.max_workers
+        )
+        self.cache: ResponseCache | None = cache
+        self.rate_limiter: RateLimiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter.shared()
+        )
+        self.timeout: float | tuple = timeout
+        self.max_retries: int = max_retries
+        self.codec: JSONCodec = get_codec()
+        self.converter: PageConverter | None = converter
+
     @staticmethod
+    def create_session(pool_size: int) -> requests.Session:
+        """
+        Creates a session with a connection pool of the given size.
+
+        Args:
+            pool_size (int): The maximum number of connections kept alive
+            per host.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Closes the session and all of its pooled connections, and stops the
+        conversion processes.
+
+        Returns:
+            None
+        """
+        self.session.close()
+        if self.converter is not None:
+            self.converter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def request_body(
+            self,
+            url: str, parameters: Dict[str, Any], headers: Dict[str, str]
+    ) -> bytes:
+        """
+        Makes an HTTP GET request and returns the raw response body.
+
+        Successful responses are served from and stored in the cache, if
+        the parser has one. Failed requests are retried up to max_retries
+        times.
+
+        Args:
+            url (str): The URL to make the request to.
+            parameters (Dict[str, Any]): The request parameters.
+            headers (Dict[str, str]): The request headers.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            requests.RequestException: If the request still fails after
+            the last retry, or the server answered with another error.
+        """
+        if self.cache is not None:
+            body = self.cache.get(url, parameters)
+            if body is not None:
+                METRICS.increment('cache_hits_total')
+                return body
+            METRICS.increment('cache_misses_total')
+
+        with METRICS.timer('fetch_seconds'):
+            body = self._send(url, parameters, headers).content
+        METRICS.increment('response_bytes_total', len(body))
+        if self.cache is not None:
+            self.cache.set(url, parameters, body)
+        return body
+
     def make_request(
+            self,
             url: str, parameters: Dict[str, Any], headers: Dict[str, str]
     ) -> Dict[str, Any]:
         """
@@ -55,8 +338,148 @@ class ParserMixin:
         Returns:
             Dict[str, Any]: The JSON response.
         """
-        return requests.get(
-            url,
-            params=parameters,
-            headers=headers
-        ).json()
+        return self.codec.loads(self.request_body(url, parameters, headers))
+
+    def _send(
+            self,
+            url: str, parameters: Dict[str, Any], headers: Dict[str, str]
+    ) -> requests.Response:
+        """
+        Sends a rate-limited GET request, retrying transient failures.
+
+        Args:
+            url (str): The URL to make the request to.
+            parameters (Dict[str, Any]): The request parameters.
+            headers (Dict[str, str]): The request headers.
+
+        Returns:
+            requests.Response: The successful response.
+        """
+        bucket = self.rate_limiter.bucket(url)
+        attempt = 0
+        while True:
+            waited = bucket.acquire()
+            if waited:
+                METRICS.observe('rate_limit_wait_seconds', waited)
+            METRICS.increment('requests_total')
+            try:
+                with METRICS.timer('request_seconds'):
+                    response = self.session.get(
+                        url,
+                        params=parameters,
+                        headers=headers,
+                        timeout=self.timeout
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                if not self.can_retry(attempt):
+                    raise
+                time.sleep(self.retry_delay(bucket, attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES:
+                response.raise_for_status()
+                bucket.succeeded()
+                return response
+
+            if not self.can_retry(attempt):
+                response.raise_for_status()
+            delay = self.retry_delay(
+                bucket, attempt, response.status_code,
+                response.headers.get('Retry-After')
+            )
+            response.close()
+            if delay:
+                time.sleep(delay)
+            attempt += 1
+
+    def fetch_page(
+            self, page: int, parameters: Dict[str, Any] | None = None,
+            decode: Callable[[bytes], Any] | None = None
+    ) -> Any:
+        """
+        Fetches a single page.
+
+        Args:
+            page (int): The page number, starting at 0.
+            parameters (Dict[str, Any] | None): The request parameters.
+            Defaults to the current parameters.
+            decode (Callable[[bytes], Any] | None): Decodes the response
+            body. Defaults to JSON decoding.
+
+        Returns:
+            Any: The decoded response.
+        """
+        if parameters is None:
+            parameters = self.parameters
+        if decode is None:
+            decode = self.codec.loads
+        body = self.request_body(
+            self.url, {**parameters, 'page': page}, self.headers
+        )
+        METRICS.increment('pages_total')
+        with METRICS.timer('decode_seconds'):
+            return decode(body)
+
+    def iter_pages(
+            self, pages: int, decode: Callable[[bytes], Any] | None = None
+    ) -> Iterator[Any]:
+        """
+        Yields up to the given number of pages using the current parameters.
+
+        When max_workers is greater than 1, up to max_workers pages are
+        requested ahead of the consumer. Pages are always yielded in page
+        order, and no more pages are requested than the consumer asks for.
+        Iteration stops after the first page with fewer than per_page
+        vacancies, see is_last_page.
+
+        Args:
+            pages (int): The maximum number of pages to fetch.
+            decode (Callable[[bytes], Any] | None): Decodes a response
+            body, in the fetching thread. Defaults to JSON decoding.
+
+        Returns:
+            Iterator[Any]: The decoded responses ordered by page.
+        """
+        parameters = dict(self.parameters)
+
+        def fetch(page: int) -> Any:
+            return self.fetch_page(page, parameters, decode)
+
+        workers = min(self.max_workers, pages)
+        if workers <= 1:
+            for page in range(0, pages):
+                response = fetch(page)
+                yield response
+                if self.is_last_page(response):
+                    return
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            window = PageWindow(
+                pages, workers, lambda page: executor.submit(fetch, page)
+            )
+            try:
+                for future in window:
+                    response = future.result()
+                    yield response
+                    if self.is_last_page(response):
+                        return
+            finally:
+                window.cancel()
+
+    def fetch_pages(self, pages: int) -> List[Dict[str, Any]]:
+        """
+        Fetches up to the given number of pages using the current
+        parameters, stopping at the last page of the search.
+
+        Pages are fetched concurrently when max_workers is greater than 1,
+        the responses are always returned in page order.
+
+        Args:
+            pages (int): The maximum number of pages to fetch.
+
+        Returns:
+            List[Dict[str, Any]]: The JSON responses ordered by page.
+        """
+        return list(self.iter_pages(pages))
@@ -1,5 +1,15 @@
 """ Parser implementation for the HH.ru website. """
+from datetime import datetime, timezone
+from functools import partial
+from typing import Iterator
+
+from src.decoders import HHPageDecoder
+from src.metrics import METRICS
+from src.parallel_convert import PageConverter
 from src.parser import Parser, ParserMixin
+from src.rate_limiter import RateLimiter
+from src.response_cache import ResponseCache
+from src.vacancy import Vacancy
 
 
 class HHParser(Parser, ParserMixin):
@@ -7,8 +17,21 @@ class HHParser(Parser, ParserMixin):
     Parser implementation for the HH.ru website.
     """
 
-    def __init__(self):
-        super().__init__()
+    platform: str = 'HH.ru'
+    items_key: str = 'items'
+
+    def __init__(
+            self, max_workers: int = 1, pool_size: int | None = None,
+            cache: ResponseCache | None = None,
+            rate_limiter: RateLimiter | None = None, processes: int = 0
+    ):
+        super().__init__(
+            max_workers=max_workers, pool_size=pool_size, cache=cache,
+            rate_limiter=rate_limiter,
+            converter=PageConverter(
+                partial(HHPageDecoder, HHParser.to_vacancy), processes
+            ) if processes else None
+        )
         self.per_page: int = 20
         self.url: str = 'https://api.hh.ru/vacancies'
         self.headers: dict = {
@@ -20,6 +43,9 @@ class HHParser(Parser, ParserMixin):
             'text': '',
             'search_field': 'name'
         }
+        self.decoder: HHPageDecoder = HHPageDecoder(
+            self.to_vacancy, self.codec
+        )
 
     def parse_vacancies(self, keyword: str, count: int) -> list[dict]:
         """
@@ -33,16 +59,143 @@ class HHParser(Parser, ParserMixin):
         Returns:
             list[dict]: The parsed vacancies.
         """
-        self.parameters.update({'text': keyword if keyword else ''})
-        result = []
-        pages = count // self.per_page + 1 \
-            if count % self.per_page else count // self.per_page
+        return list(self.iter_vacancies(keyword, count))
+
+    def iter_vacancies(self, keyword: str, count: int) -> Iterator[dict]:
+        """
+        Yields vacancies from the HH.ru website page by page.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            Iterator[dict]: The raw vacancies.
+        """
+        self.parameters.update(self.keyword_parameters(keyword))
+        pages = self.count_pages(count)
+
+        for response in self.iter_pages(pages):
+            yield from response[self.items_key]
+
+    def stream_vacancies(self, keyword: str, count: int) -> Iterator[Vacancy]:
+        """
+        Yields Vacancy objects from the HH.ru website page by page.
 
-        for page in range(0, pages):
-            self.parameters.update({'page': page})
+        Pages are decoded straight into vacancies in the fetching threads,
+        without building the raw vacancy dictionaries. Large pulls are
+        converted on the process pool of the converter, if any.
 
-            response = self.make_request(
-                self.url, self.parameters, self.headers
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            Iterator[Vacancy]: The vacancy objects.
+        """
+        self.parameters.update(self.keyword_parameters(keyword))
+        pages = self.count_pages(count)
+
+        if self.converter is not None and self.converter.use_for(count):
+            yield from self.converter.decode_pages(
+                self.iter_pages(pages, bytes), self.per_page
             )
-            result.extend(response['items'])
-        return result
+            return
+
+        for vacancies in self.iter_pages(pages, self.decoder.decode):
+            METRICS.increment('vacancies_total', len(vacancies))
+            yield from vacancies
+
+    @staticmethod
+    def to_vacancy(vacancy: dict) -> Vacancy:
+        """
+        Converts a raw HH.ru vacancy to a Vacancy object.
+
+        Args:
+            vacancy (dict): The raw vacancy.
+
+        Returns:
+            Vacancy: The vacancy object.
+        """
+        return Vacancy(
+            platform='HH.ru',
+            vacancy_id=vacancy['id'],
+            title=vacancy['name'],
+            url=vacancy['alternate_url'],
+            salary_from=(
+                vacancy['salary']['from'] if vacancy['salary'] else None
+            ),
+            salary_to=(
+                vacancy['salary']['to'] if vacancy['salary'] else None
+            ),
+            currency=(
+                vacancy['salary']['currency'] if vacancy['salary'] else None
+            ),
+            description=vacancy['snippet'][
+                'requirement'
+            ] if vacancy['snippet'][
+                'requirement'
+            ] else vacancy['snippet'][
+                'responsibility'
+            ],
+            employer=(
+                vacancy['employer']['name'] if vacancy.get('employer')
+                else None
+            )
+        )
+
+    @staticmethod
+    def published_at(vacancy: dict) -> float:
+        """
+        Returns the publication time of a raw HH.ru vacancy.
+
+        Args:
+            vacancy (dict): The raw vacancy.
+
+        Returns:
+            float: The publication time as a Unix timestamp.
+        """
+        return datetime.strptime(
+            vacancy['published_at'], '%Y-%m-%dT%H:%M:%S%z'
+        ).timestamp()
+
+    def keyword_parameters(self, keyword: str) -> dict:
+        """
+        Returns the HH.ru parameters that search for a keyword.
+
+        Args:
+            keyword (str): The keyword to search for.
+
+        Returns:
+            dict: The request parameters.
+        """
+        return {'text': keyword if keyword else ''}
+
+    def since_parameters(
+            self, since: float | None, until: float | None = None
+    ) -> dict:
+        """
+        Returns the HH.ru parameters that order vacancies newest first and
+        restrict them to those published in a time window.
+
+        Args:
+            since (float | None): The Unix timestamp of the oldest wanted
+            publication, or None to not restrict the date.
+            until (float | None): The Unix timestamp of the newest wanted
+            publication, or None for no upper bound.
+
+        Returns:
+            dict: The request parameters.
+        """
+        parameters = {'order_by': 'publication_time'}
+        if since is not None:
+            parameters['date_from'] = self._format_date(since)
+        if until is not None:
+            parameters['date_to'] = self._format_date(until)
+        return parameters
+
+    @staticmethod
+    def _format_date(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, timezone.utc).strftime(
+            '%Y-%m-%dT%H:%M:%S%z'
+        )
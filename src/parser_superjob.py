@@ -1,6 +1,15 @@
 """ Parser implementation for the SuperJob website. """
+from functools import partial
+from typing import Iterator
+
 from src.constants import SUPER_JOB_API_SECRET
+from src.decoders import SuperJobPageDecoder
+from src.metrics import METRICS
+from src.parallel_convert import PageConverter
 from src.parser import Parser, ParserMixin
+from src.rate_limiter import RateLimiter
+from src.response_cache import ResponseCache
+from src.vacancy import Vacancy
 
 
 class SuperJobParser(Parser, ParserMixin):
@@ -8,8 +17,22 @@ class SuperJobParser(Parser, ParserMixin):
     Parser implementation for the SuperJob website.
     """
 
-    def __init__(self):
-        super().__init__()
+    platform: str = 'SuperJob.ru'
+    items_key: str = 'objects'
+
+    def __init__(
+            self, max_workers: int = 1, pool_size: int | None = None,
+            cache: ResponseCache | None = None,
+            rate_limiter: RateLimiter | None = None, processes: int = 0
+    ):
+        super().__init__(
+            max_workers=max_workers, pool_size=pool_size, cache=cache,
+            rate_limiter=rate_limiter,
+            converter=PageConverter(
+                partial(SuperJobPageDecoder, SuperJobParser.to_vacancy),
+                processes
+            ) if processes else None
+        )
         self.per_page: int = 20
         self.url: str = "https://api.superjob.ru/2.0/vacancies/"
         self.headers: dict = {'X-Api-App-Id': SUPER_JOB_API_SECRET}
@@ -20,6 +43,9 @@ class SuperJobParser(Parser, ParserMixin):
             'keywords[0][skwc]': 'or',
             'keywords[0][keys]': ''
         }
+        self.decoder: SuperJobPageDecoder = SuperJobPageDecoder(
+            self.to_vacancy, self.codec
+        )
 
     def parse_vacancies(self, keyword: str, count: int) -> list[dict]:
         """
@@ -33,19 +59,120 @@ class SuperJobParser(Parser, ParserMixin):
         Returns:
             list[dict]: The parsed vacancies.
         """
+        return list(self.iter_vacancies(keyword, count))
 
-        self.parameters.update(
-            {'keywords[0][keys]': keyword if keyword else ''}
-        )
-        result = []
-        pages = count // self.per_page + 1 \
-            if count % self.per_page else count // self.per_page
+    def iter_vacancies(self, keyword: str, count: int) -> Iterator[dict]:
+        """
+        Yields vacancies from the SuperJob website page by page.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
 
-        for page in range(0, pages):
-            self.parameters.update({'page': page})
+        Returns:
+            Iterator[dict]: The raw vacancies.
+        """
+        self.parameters.update(self.keyword_parameters(keyword))
+        pages = self.count_pages(count)
+
+        for response in self.iter_pages(pages):
+            yield from response[self.items_key]
 
-            response = self.make_request(
-                self.url, self.parameters, self.headers
+    def stream_vacancies(self, keyword: str, count: int) -> Iterator[Vacancy]:
+        """
+        Yields Vacancy objects from the SuperJob website page by page.
+
+        Pages are decoded straight into vacancies in the fetching threads,
+        without building the raw vacancy dictionaries. Large pulls are
+        converted on the process pool of the converter, if any.
+
+        Args:
+            keyword (str): The keyword to search for.
+            count (int): The number of vacancies to retrieve.
+
+        Returns:
+            Iterator[Vacancy]: The vacancy objects.
+        """
+        self.parameters.update(self.keyword_parameters(keyword))
+        pages = self.count_pages(count)
+
+        if self.converter is not None and self.converter.use_for(count):
+            yield from self.converter.decode_pages(
+                self.iter_pages(pages, bytes), self.per_page
             )
-            result.extend(response['objects'])
-        return result
+            return
+
+        for vacancies in self.iter_pages(pages, self.decoder.decode):
+            METRICS.increment('vacancies_total', len(vacancies))
+            yield from vacancies
+
+    @staticmethod
+    def to_vacancy(vacancy: dict) -> Vacancy:
+        """
+        Converts a raw SuperJob vacancy to a Vacancy object.
+
+        Args:
+            vacancy (dict): The raw vacancy.
+
+        Returns:
+            Vacancy: The vacancy object.
+        """
+        return Vacancy(
+            platform='SuperJob.ru',
+            vacancy_id=vacancy['id'],
+            title=vacancy['profession'],
+            url=vacancy['link'],
+            salary_from=vacancy['payment_from'],
+            salary_to=vacancy['payment_to'],
+            currency=vacancy['currency'],
+            description=vacancy['vacancyRichText'],
+            employer=vacancy.get('firm_name')
+        )
+
+    @staticmethod
+    def published_at(vacancy: dict) -> float:
+        """
+        Returns the publication time of a raw SuperJob vacancy.
+
+        Args:
+            vacancy (dict): The raw vacancy.
+
+        Returns:
+            float: The publication time as a Unix timestamp.
+        """
+        return float(vacancy['date_published'])
+
+    def keyword_parameters(self, keyword: str) -> dict:
+        """
+        Returns the SuperJob parameters that search for a keyword.
+
+        Args:
+            keyword (str): The keyword to search for.
+
+        Returns:
+            dict: The request parameters.
+        """
+        return {'keywords[0][keys]': keyword if keyword else ''}
+
+    def since_parameters(
+            self, since: float | None, until: float | None = None
+    ) -> dict:
+        """
+        Returns the SuperJob parameters that order vacancies newest first
+        and restrict them to those published in a time window.
+
+        Args:
+            since (float | None): The Unix timestamp of the oldest wanted
+            publication, or None to not restrict the date.
+            until (float | None): The Unix timestamp of the newest wanted
+            publication, or None for no upper bound.
+
+        Returns:
+            dict: The request parameters.
+        """
+        parameters = {'order_field': 'date', 'order_direction': 'desc'}
+        if since is not None:
+            parameters['date_published_from'] = int(since)
+        if until is not None:
+            parameters['date_published_to'] = int(until)
+        return parameters
@@ -0,0 +1,221 @@
+""" Client-side rate limiting module"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict
+from urllib.parse import urlsplit
+
+from src.constants import (
+    BACKOFF_BASE, BACKOFF_MAX, DEFAULT_RATE_LIMIT, RATE_LIMITS
+)
+
+
+def backoff_delay(
+        attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX
+) -> float:
+    """
+    Returns the delay before a retry, exponential with full jitter.
+
+    Args:
+        attempt (int): The number of the failed attempt, starting at 0.
+        base (float): The delay ceiling of the first retry in seconds.
+        cap (float): The maximum delay in seconds.
+
+    Returns:
+        float: A random delay between 0 and min(cap, base * 2 ** attempt).
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header.
+
+    Args:
+        value (str | None): The header value, in seconds or an HTTP date.
+
+    Returns:
+        float | None: The delay in seconds, or None if the header is
+        missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with an adaptive rate.
+
+    The rate follows additive increase / multiplicative decrease: every
+    successful request raises it by a small step up to max_rate, every
+    throttled request halves it, empties the bucket and pauses it, so
+    concurrent workers settle just below the throughput the server
+    accepts. Tokens only accrue again once the pause is over.
+    """
+
+    def __init__(
+            self, max_rate: float, capacity: float | None = None,
+            min_rate: float | None = None
+    ):
+        """
+        Initializes a full bucket.
+
+        Args:
+            max_rate (float): The maximum number of requests per second.
+            capacity (float | None): The maximum burst. Defaults to one
+            second worth of requests.
+            min_rate (float | None): The lowest rate the bucket backs off
+            to. Defaults to a sixteenth of max_rate.
+        """
+        self.max_rate: float = max_rate
+        self.min_rate: float = min_rate if min_rate else max_rate / 16
+        self.rate: float = max_rate
+        self.capacity: float = capacity if capacity else max(max_rate, 1.0)
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while the bucket is paused, so the pause after a
+        # throttled request is not followed by a full burst.
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - start) * self.rate
+            )
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Takes a token if one is available, without waiting.
+
+        Returns:
+            float: 0.0 if a token was taken, otherwise the number of
+            seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Takes a token, sleeping until one is available.
+
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def succeeded(self) -> None:
+        """
+        Raises the rate additively after a successful request.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def throttled(self, delay: float) -> None:
+        """
+        Halves the rate and pauses the bucket after a throttled request.
+
+        Args:
+            delay (float): The number of seconds no request may be sent.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + delay)
+
+
+class RateLimiter:
+    """
+    Registry of token buckets, one per host.
+
+    The instance returned by shared() is used by every parser of the
+    process, so parsers running in parallel share the per-host budget.
+    """
+
+    _shared: 'RateLimiter | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+            self, rates: Dict[str, float] | None = None,
+            default_rate: float = DEFAULT_RATE_LIMIT
+    ):
+        """
+        Initializes the limiter.
+
+        Args:
+            rates (Dict[str, float] | None): The maximum requests per second
+            by host name. Defaults to RATE_LIMITS.
+            default_rate (float): The maximum requests per second of hosts
+            missing from rates.
+        """
+        self.rates: Dict[str, float] = dict(
+            RATE_LIMITS if rates is None else rates
+        )
+        self.default_rate: float = default_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'RateLimiter':
+        """
+        Returns the process-wide limiter, creating it on first use.
+
+        Returns:
+            RateLimiter: The shared limiter.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        Returns the bucket of the host of a URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            TokenBucket: The bucket of the host.
+        """
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(
+                    self.rates.get(host, self.default_rate)
+                )
+            return bucket
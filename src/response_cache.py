@@ -0,0 +1,242 @@
+""" HTTP response cache module"""
+import hashlib
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict
+from urllib.parse import urlencode
+
+from src.constants import CACHE_DIR, CACHE_MAX_ENTRIES, CACHE_TTL
+
+
+class ResponseCache(ABC):
+    """
+    An abstract base class for caches of raw HTTP response bodies.
+
+    Entries are keyed by URL plus normalized request parameters, expire
+    after ttl seconds and are evicted in least recently used order once
+    max_entries is exceeded. All methods are thread-safe.
+    """
+
+    def __init__(
+            self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            ttl (float): Seconds after which an entry expires.
+            max_entries (int): The maximum number of cached responses.
+        """
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, parameters: Dict[str, Any]) -> str:
+        """
+        Builds the cache key of a request.
+
+        Parameters are sorted and stringified, so the same request always
+        maps to the same key regardless of the parameter order.
+
+        Args:
+            url (str): The request URL.
+            parameters (Dict[str, Any]): The request parameters.
+
+        Returns:
+            str: The cache key.
+        """
+        query = urlencode(
+            sorted((str(key), str(value)) for key, value in parameters.items())
+        )
+        return hashlib.sha256(f'{url}?{query}'.encode('utf-8')).hexdigest()
+
+    def get(self, url: str, parameters: Dict[str, Any]) -> bytes | None:
+        """
+        Returns the cached response body of a request.
+
+        Args:
+            url (str): The request URL.
+            parameters (Dict[str, Any]): The request parameters.
+
+        Returns:
+            bytes | None: The response body, or None on a miss.
+        """
+        key = self.make_key(url, parameters)
+        with self._lock:
+            stored_at = self._entries.get(key)
+            if stored_at is None:
+                return None
+            if time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                self._discard(key)
+                return None
+
+            body = self._read(key)
+            if body is None:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, url: str, parameters: Dict[str, Any], body: bytes) -> None:
+        """
+        Stores the response body of a request.
+
+        Args:
+            url (str): The request URL.
+            parameters (Dict[str, Any]): The request parameters.
+            body (bytes): The response body.
+
+        Returns:
+            None
+        """
+        key = self.make_key(url, parameters)
+        with self._lock:
+            self._write(key, body)
+            self._entries[key] = time.time()
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Removes all cached responses.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            for key in self._entries:
+                self._discard(key)
+            self._entries.clear()
+
+    def _evict(self) -> None:
+        """
+        Drops the least recently used entries above max_entries.
+
+        Returns:
+            None
+        """
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            self._discard(key)
+
+    @abstractmethod
+    def _read(self, key: str) -> bytes | None:
+        """
+        Reads the body stored under the key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bytes | None: The body, or None if it is gone.
+        """
+        pass
+
+    @abstractmethod
+    def _write(self, key: str, body: bytes) -> None:
+        """
+        Stores the body under the key.
+
+        Args:
+            key (str): The cache key.
+            body (bytes): The body to store.
+
+        Returns:
+            None
+        """
+        pass
+
+    @abstractmethod
+    def _discard(self, key: str) -> None:
+        """
+        Removes the body stored under the key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            None
+        """
+        pass
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    A response cache that lives in process memory.
+    """
+
+    def __init__(
+            self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES
+    ):
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self._bodies: Dict[str, bytes] = {}
+
+    def _read(self, key: str) -> bytes | None:
+        return self._bodies.get(key)
+
+    def _write(self, key: str, body: bytes) -> None:
+        self._bodies[key] = body
+
+    def _discard(self, key: str) -> None:
+        self._bodies.pop(key, None)
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    A response cache that persists bodies as files in a directory.
+
+    File modification times are the storage times, so entries survive
+    restarts and keep expiring on schedule.
+    """
+
+    def __init__(
+            self, directory: str = CACHE_DIR,
+            ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES
+    ):
+        """
+        Initializes the cache and indexes the responses already on disk.
+
+        Args:
+            directory (str): The directory holding the cached responses.
+            ttl (float): Seconds after which an entry expires.
+            max_entries (int): The maximum number of cached responses.
+        """
+        super().__init__(ttl=ttl, max_entries=max_entries)
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+        stored = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stored.append((entry.stat().st_mtime, entry.name))
+        for stored_at, key in sorted(stored):
+            self._entries[key] = stored_at
+        self._evict()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, body: bytes) -> None:
+        temp_path = f'{self._path(key)}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(body)
+        os.replace(temp_path, self._path(key))
+
+    def _discard(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,157 @@
+""" Salary index module"""
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple
+
+from src.vacancy import Vacancy
+
+salary_of = itemgetter(0)
+
+
+class SalaryIndex:
+    """
+    Index of vacancies sorted by average salary.
+
+    Range queries cost O(log n + k) for k results. Adding and removing a
+    vacancy keeps the index sorted without rebuilding it.
+    """
+
+    __slots__ = ('_entries', '_vacancies')
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """
+        Builds the index.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The initial vacancies.
+        """
+        self._vacancies: Dict[Tuple[str, int], Vacancy] = {}
+        for vacancy in vacancies:
+            self._vacancies[self._key(vacancy)] = vacancy
+        self._entries: List[Tuple[int, str, int]] = sorted(
+            self._entry(vacancy) for vacancy in self._vacancies.values()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, vacancy: Vacancy) -> bool:
+        return self._key(vacancy) in self._vacancies
+
+    @staticmethod
+    def _key(vacancy: Vacancy) -> Tuple[str, int]:
+        return vacancy.platform, vacancy.vacancy_id
+
+    @staticmethod
+    def _entry(vacancy: Vacancy) -> Tuple[int, str, int]:
+        return vacancy.avg_salary, vacancy.platform, vacancy.vacancy_id
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Adds a vacancy, replacing one with the same platform and ID.
+
+        Args:
+            vacancy (Vacancy): The vacancy to add.
+
+        Returns:
+            None
+        """
+        previous = self._vacancies.get(self._key(vacancy))
+        if previous is not None:
+            self.remove(previous)
+        self._vacancies[self._key(vacancy)] = vacancy
+        insort(self._entries, self._entry(vacancy))
+
+    def remove(self, vacancy: Vacancy) -> None:
+        """
+        Removes a vacancy by its platform and ID.
+
+        Args:
+            vacancy (Vacancy): The vacancy to remove.
+
+        Returns:
+            None
+        """
+        stored = self._vacancies.pop(self._key(vacancy), None)
+        if stored is None:
+            return
+        entry = self._entry(stored)
+        position = bisect_left(self._entries, entry)
+        del self._entries[position]
+
+    def _bounds(
+            self, min_salary: int | None, max_salary: int | None
+    ) -> Tuple[int, int]:
+        """
+        Finds the slice of entries within a salary range.
+
+        The bounds match SalaryRangeFilter: vacancies without salary are
+        skipped and both bounds are exclusive.
+
+        Args:
+            min_salary (int | None): The lower bound, if any.
+            max_salary (int | None): The upper bound, if any.
+
+        Returns:
+            Tuple[int, int]: The start and end positions of the slice.
+        """
+        low = 0 if min_salary is None else max(min_salary, 0)
+        start = bisect_right(self._entries, low, key=salary_of)
+        if max_salary is None:
+            return start, len(self._entries)
+        return start, bisect_left(
+            self._entries, max_salary, lo=start, key=salary_of
+        )
+
+    def count_range(
+            self, min_salary: int | None, max_salary: int | None
+    ) -> int:
+        """
+        Counts the vacancies within a salary range in O(log n).
+
+        Args:
+            min_salary (int | None): The lower bound, if any.
+            max_salary (int | None): The upper bound, if any.
+
+        Returns:
+            int: The number of matching vacancies.
+        """
+        start, end = self._bounds(min_salary, max_salary)
+        return max(end - start, 0)
+
+    def range(
+            self, min_salary: int | None, max_salary: int | None
+    ) -> List[Vacancy]:
+        """
+        Returns the vacancies within a salary range.
+
+        Args:
+            min_salary (int | None): The lower bound, if any.
+            max_salary (int | None): The upper bound, if any.
+
+        Returns:
+            List[Vacancy]: The matching vacancies, lowest salary first.
+        """
+        start, end = self._bounds(min_salary, max_salary)
+        vacancies = self._vacancies
+        return [
+            vacancies[(platform, vacancy_id)]
+            for _, platform, vacancy_id in self._entries[start:end]
+        ]
+
+    def top(self, count: int) -> List[Vacancy]:
+        """
+        Returns the best-paid vacancies in O(count).
+
+        Args:
+            count (int): The number of vacancies to return.
+
+        Returns:
+            List[Vacancy]: At most count vacancies, highest salary first.
+        """
+        vacancies = self._vacancies
+        start = max(len(self._entries) - max(count, 0), 0)
+        return [
+            vacancies[(platform, vacancy_id)]
+            for _, platform, vacancy_id in reversed(self._entries[start:])
+        ]
@@ -0,0 +1,189 @@
+""" Incremental vacancy sync module"""
+import json
+import os
+import sys
+import tempfile
+from json import JSONDecodeError
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from src.constants import SYNC_MAX_COUNT, SYNC_STATE_PATH
+from src.parser import Parser
+from src.vacancy import Vacancy
+
+
+class SyncState:
+    """
+    High-water marks of incremental syncs, persisted as JSON.
+
+    For every (platform, keyword) query the state keeps the publication
+    time of the newest synced vacancy and the IDs of the vacancies
+    published at that exact time, since the date filters of the APIs
+    include the boundary.
+    """
+
+    def __init__(self, file_path: str = SYNC_STATE_PATH):
+        """
+        Loads the state, starting empty if the file does not exist.
+
+        Args:
+            file_path (str): The path of the state file.
+        """
+        self.file_path: str = file_path
+        self.__queries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self.__queries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except JSONDecodeError:
+            print(
+                f'File {file_path} is not valid JSON, sync state reset',
+                file=sys.stderr
+            )
+
+    @staticmethod
+    def _query_key(platform: str, keyword: str) -> str:
+        return f'{platform}:{keyword.strip().casefold()}'
+
+    def get(
+            self, platform: str, keyword: str
+    ) -> Tuple[float | None, Set[int]]:
+        """
+        Returns the high-water mark of a query.
+
+        Args:
+            platform (str): The platform name.
+            keyword (str): The search keyword.
+
+        Returns:
+            Tuple[float | None, Set[int]]: The publication time of the
+            newest synced vacancy, None if the query was never synced, and
+            the IDs of the vacancies published at that time.
+        """
+        query = self.__queries.get(self._query_key(platform, keyword))
+        if query is None:
+            return None, set()
+        return query['published_at'], set(query['ids'])
+
+    def update(
+            self, platform: str, keyword: str,
+            published_at: float, ids: Iterable[int]
+    ) -> None:
+        """
+        Moves the high-water mark of a query.
+
+        Args:
+            platform (str): The platform name.
+            keyword (str): The search keyword.
+            published_at (float): The publication time of the newest synced
+            vacancy.
+            ids (Iterable[int]): The IDs of the vacancies published at that
+            time.
+
+        Returns:
+            None
+        """
+        self.__queries[self._query_key(platform, keyword)] = {
+            'published_at': published_at,
+            'ids': sorted(ids)
+        }
+
+    def save(self) -> None:
+        """
+        Atomically writes the state to its file.
+
+        Returns:
+            None
+        """
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.file_path)),
+            suffix='.tmp'
+        )
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            json.dump(self.__queries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.file_path)
+
+
+def sync_vacancies(
+        parser: Parser, keyword: str, state: SyncState,
+        save: Callable[[List[Vacancy]], None],
+        count: int = SYNC_MAX_COUNT
+) -> List[Vacancy]:
+    """
+    Fetches the vacancies published since the last sync of a query and
+    merges them into a store.
+
+    Vacancies are requested newest first and restricted to the high-water
+    mark by the API date filter, at most count at a time. If a window of
+    count vacancies does not reach the mark, the next window ends at the
+    oldest vacancy fetched so far, until the mark is reached. The first
+    sync of a query fetches up to count vacancies.
+
+    The mark moves to the newest vacancy only once paging reached the old
+    mark, and the state is saved only after the store accepted the new
+    vacancies. Otherwise the next sync starts from the old mark again.
+
+    Args:
+        parser (Parser): The platform parser.
+        keyword (str): The search keyword.
+        state (SyncState): The sync state.
+        save (Callable[[List[Vacancy]], None]): Merges vacancies into the
+        store, e.g. JSONFileHandler.add_vacancies_to_json.
+        count (int): The maximum number of vacancies of a request window.
+
+    Returns:
+        List[Vacancy]: The new vacancies, newest first.
+    """
+    since, known_ids = state.get(parser.platform, keyword)
+    seen_ids = set(known_ids)
+    found = []
+
+    def collect(raw: Dict[str, Any], published: float) -> None:
+        vacancy = parser.to_vacancy(raw)
+        if vacancy.vacancy_id not in seen_ids:
+            seen_ids.add(vacancy.vacancy_id)
+            found.append((published, vacancy))
+
+    with parser:
+        if since is None:
+            for raw in parser.iter_published_vacancies(keyword, count):
+                collect(raw, parser.published_at(raw))
+            reached = True
+        else:
+            reached, until = False, None
+            while not reached:
+                fetched, oldest = 0, None
+                for raw in parser.iter_published_vacancies(
+                        keyword, count, since, until
+                ):
+                    fetched += 1
+                    oldest = parser.published_at(raw)
+                    if oldest < since:
+                        break
+                    collect(raw, oldest)
+                reached = fetched < count or oldest < since
+                if not reached and oldest == until:
+                    # More than count vacancies share one publication
+                    # time, the window cannot be narrowed any further.
+                    print(
+                        f'{parser.platform} sync of "{keyword}" stopped '
+                        f'short of the last synced vacancy',
+                        file=sys.stderr
+                    )
+                    break
+                until = oldest
+
+    vacancies = [vacancy for _, vacancy in found]
+    if vacancies:
+        save(vacancies)
+        if reached:
+            newest = max(published for published, _ in found)
+            newest_ids = {
+                vacancy.vacancy_id
+                for published, vacancy in found if published == newest
+            }
+            if newest == since:
+                newest_ids |= known_ids
+            state.update(parser.platform, keyword, newest, newest_ids)
+            state.save()
+    return vacancies
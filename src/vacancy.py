@@ -15,14 +15,16 @@ class Vacancy:
         '_salary_to',
         '_currency',
         '_description',
-        '_avg_salary'
+        '_avg_salary',
+        '_employer'
     ]
 
     def __init__(
             self,
             platform: str, vacancy_id: int, title: str, url: str,
             salary_from: int,
-            salary_to: int, currency: str, description: str
+            salary_to: int, currency: str, description: str,
+            employer: str | None = None
     ):
         self._platform: str = platform
         self._vacancy_id: int = int(vacancy_id)
@@ -35,6 +37,7 @@ class Vacancy:
             description[:200] if len(description) > 200 else description
         ) if description is not None else "Missing description"
         self._avg_salary: int = 0
+        self._employer: str | None = employer
 
         if isinstance(salary_from, int):
             if isinstance(salary_to, int):
@@ -104,6 +107,16 @@ class Vacancy:
         """
         return self._salary_to
 
+    @property
+    def currency(self) -> str:
+        """
+        Get the salary currency of the vacancy.
+
+        Returns:
+            str: The salary currency of the vacancy.
+        """
+        return self._currency
+
     @property
     def description(self) -> str:
         """
@@ -124,6 +137,16 @@ class Vacancy:
         """
         return self._avg_salary
 
+    @property
+    def employer(self) -> str | None:
+        """
+        Get the employer name of the vacancy.
+
+        Returns:
+            str | None: The employer name, or None if unknown.
+        """
+        return self._employer
+
     def to_dict(self) -> dict:
         """
         Convert the vacancy object to a dictionary.
@@ -140,9 +163,72 @@ class Vacancy:
             'salary_to': self._salary_to,
             'currency': self._currency,
             'description': self._description,
-            'avg_salary': self._avg_salary
+            'avg_salary': self._avg_salary,
+            'employer': self._employer
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Vacancy':
+        """
+        Create a vacancy object from a dictionary made by to_dict.
+
+        Dictionaries saved before the employer was stored are accepted.
+
+        Args:
+            data (dict): The vacancy as a dictionary.
+
+        Returns:
+            Vacancy: The vacancy object.
+        """
+        return cls(
+            platform=data['platform'],
+            vacancy_id=data['vacancy_id'],
+            title=data['title'],
+            url=data['url'],
+            salary_from=data['salary_from'],
+            salary_to=data['salary_to'],
+            currency=data['currency'],
+            description=data['description'],
+            employer=data['employer'] if 'employer' in data.keys() else None
+        )
+
+    def to_tuple(self) -> tuple:
+        """
+        Convert the vacancy object to a tuple of its attribute values.
+
+        The tuple is a compact form for pickling, e.g. between processes.
+
+        Returns:
+            tuple: The attribute values ordered as __slots__.
+        """
+        return (
+            self._platform, self._vacancy_id, self._title, self._url,
+            self._salary_from, self._salary_to, self._currency,
+            self._description, self._avg_salary, self._employer
+        )
+
+    @classmethod
+    def from_tuple(cls, values: tuple) -> 'Vacancy':
+        """
+        Create a vacancy object from a tuple made by to_tuple.
+
+        The values are already normalized, so __init__ is skipped.
+
+        Args:
+            values (tuple): The attribute values ordered as __slots__.
+
+        Returns:
+            Vacancy: The vacancy object.
+        """
+        vacancy = cls.__new__(cls)
+        (
+            vacancy._platform, vacancy._vacancy_id, vacancy._title,
+            vacancy._url, vacancy._salary_from, vacancy._salary_to,
+            vacancy._currency, vacancy._description, vacancy._avg_salary,
+            vacancy._employer
+        ) = values
+        return vacancy
+
     def __str__(self):
         """
         Return a string representation of the vacancy.
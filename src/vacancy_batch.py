@@ -0,0 +1,316 @@
+""" Columnar vacancy batch module"""
+import heapq
+from array import array
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Sequence
+
+from src.vacancy import Vacancy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MISSING_SALARY = -1
+
+
+class VacancyBatch:
+    """
+    Columnar container of vacancies.
+
+    Numeric fields are stored in typed arrays, platform and currency as
+    small integer codes, and the remaining strings in side lists. Salary
+    filtering, sorting and top-N selection work on the arrays directly,
+    and use NumPy when it is installed.
+    """
+
+    __slots__ = (
+        'vacancy_id',
+        'avg_salary',
+        'salary_from',
+        'salary_to',
+        'platform_code',
+        'currency_code',
+        'platforms',
+        'currencies',
+        'titles',
+        'urls',
+        'descriptions',
+        'employers'
+    )
+
+    def __init__(self):
+        self.vacancy_id: array = array('q')
+        self.avg_salary: array = array('q')
+        self.salary_from: array = array('q')
+        self.salary_to: array = array('q')
+        self.platform_code: array = array('B')
+        self.currency_code: array = array('B')
+        self.platforms: List[str] = []
+        self.currencies: List[str | None] = []
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.descriptions: List[str] = []
+        self.employers: List[str | None] = []
+
+    def __len__(self) -> int:
+        return len(self.vacancy_id)
+
+    @staticmethod
+    def _code(table: List[Any], value: Any) -> int:
+        """
+        Returns the code of a value in a side table, adding it if needed.
+
+        Args:
+            table (List[Any]): The side table.
+            value (Any): The value to encode.
+
+        Returns:
+            int: The position of the value in the table.
+        """
+        try:
+            return table.index(value)
+        except ValueError:
+            table.append(value)
+            return len(table) - 1
+
+    def append_dict(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Appends a vacancy dictionary made by Vacancy.to_dict.
+
+        Args:
+            vacancy (Dict[str, Any]): The vacancy as a dictionary.
+
+        Returns:
+            None
+        """
+        salary_from = vacancy['salary_from']
+        salary_to = vacancy['salary_to']
+        self.vacancy_id.append(int(vacancy['vacancy_id']))
+        self.avg_salary.append(vacancy['avg_salary'])
+        self.salary_from.append(
+            MISSING_SALARY if salary_from is None else salary_from
+        )
+        self.salary_to.append(
+            MISSING_SALARY if salary_to is None else salary_to
+        )
+        self.platform_code.append(
+            self._code(self.platforms, vacancy['platform'])
+        )
+        self.currency_code.append(
+            self._code(self.currencies, vacancy['currency'])
+        )
+        self.titles.append(vacancy['title'])
+        self.urls.append(vacancy['url'])
+        self.descriptions.append(vacancy['description'])
+        self.employers.append(vacancy.get('employer'))
+
+    def append(self, vacancy: Vacancy) -> None:
+        """
+        Appends a vacancy object.
+
+        Args:
+            vacancy (Vacancy): The vacancy to append.
+
+        Returns:
+            None
+        """
+        self.append_dict(vacancy.to_dict())
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> 'VacancyBatch':
+        """
+        Builds a batch from vacancy objects.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies.
+
+        Returns:
+            VacancyBatch: The batch.
+        """
+        batch = cls()
+        for vacancy in vacancies:
+            batch.append(vacancy)
+        return batch
+
+    @classmethod
+    def from_dicts(
+            cls, vacancies: Iterable[Dict[str, Any]]
+    ) -> 'VacancyBatch':
+        """
+        Builds a batch from stored vacancy dictionaries, without creating
+        Vacancy objects.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): The vacancy dictionaries.
+
+        Returns:
+            VacancyBatch: The batch.
+        """
+        batch = cls()
+        for vacancy in vacancies:
+            batch.append_dict(vacancy)
+        return batch
+
+    def to_vacancy(self, position: int) -> Vacancy:
+        """
+        Builds the vacancy object at a position of the batch.
+
+        Args:
+            position (int): The position in the batch.
+
+        Returns:
+            Vacancy: The vacancy object.
+        """
+        salary_from = self.salary_from[position]
+        salary_to = self.salary_to[position]
+        return Vacancy(
+            platform=self.platforms[self.platform_code[position]],
+            vacancy_id=self.vacancy_id[position],
+            title=self.titles[position],
+            url=self.urls[position],
+            salary_from=None if salary_from == MISSING_SALARY else salary_from,
+            salary_to=None if salary_to == MISSING_SALARY else salary_to,
+            currency=self.currencies[self.currency_code[position]],
+            description=self.descriptions[position],
+            employer=self.employers[position]
+        )
+
+    def to_vacancies(self) -> List[Vacancy]:
+        """
+        Converts the batch to vacancy objects.
+
+        Returns:
+            List[Vacancy]: The vacancies in batch order.
+        """
+        return [self.to_vacancy(position) for position in range(len(self))]
+
+    def take(self, positions: Sequence[int]) -> 'VacancyBatch':
+        """
+        Builds a new batch from the given positions.
+
+        Args:
+            positions (Sequence[int]): The positions to take, in order.
+
+        Returns:
+            VacancyBatch: The new batch sharing the side tables.
+        """
+        batch = VacancyBatch()
+        batch.platforms = self.platforms
+        batch.currencies = self.currencies
+        if not positions:
+            return batch
+
+        getter = itemgetter(*positions)
+        single = len(positions) == 1
+        for column in self.__slots__:
+            if column in ('platforms', 'currencies'):
+                continue
+            values = getter(getattr(self, column))
+            if single:
+                values = (values,)
+            target = getattr(batch, column)
+            if isinstance(target, array):
+                target.extend(values)
+            else:
+                setattr(batch, column, list(values))
+        return batch
+
+    def salary_range_positions(
+            self, min_salary: int | None, max_salary: int | None
+    ) -> Sequence[int]:
+        """
+        Finds the positions within a salary range.
+
+        The bounds match SalaryRangeFilter: vacancies without salary are
+        skipped and both bounds are exclusive.
+
+        Args:
+            min_salary (int | None): The lower bound, if any.
+            max_salary (int | None): The upper bound, if any.
+
+        Returns:
+            Sequence[int]: The matching positions in batch order.
+        """
+        if numpy is not None and len(self):
+            salaries = numpy.frombuffer(self.avg_salary, dtype=numpy.int64)
+            mask = salaries != 0
+            if min_salary is not None:
+                mask &= salaries > min_salary
+            if max_salary is not None:
+                mask &= salaries < max_salary
+            return numpy.flatnonzero(mask).tolist()
+
+        low = 0 if min_salary is None else max(min_salary, 0)
+        if max_salary is None:
+            matches = (salary > low for salary in self.avg_salary)
+        else:
+            matches = (low < salary < max_salary for salary in self.avg_salary)
+        return list(compress(range(len(self)), matches))
+
+    def filter_salary(self, salary_range: List[int | None]) -> 'VacancyBatch':
+        """
+        Filters the batch by a salary range.
+
+        Args:
+            salary_range (List[int | None]): The salary range
+            [min_salary, max_salary].
+
+        Returns:
+            VacancyBatch: The matching vacancies.
+        """
+        min_salary, max_salary = salary_range
+        return self.take(self.salary_range_positions(min_salary, max_salary))
+
+    def salary_order(self) -> Sequence[int]:
+        """
+        Returns the positions ordered by average salary, highest first.
+
+        Vacancies with equal salary keep their batch order.
+
+        Returns:
+            Sequence[int]: The ordered positions.
+        """
+        if numpy is not None and len(self):
+            salaries = numpy.frombuffer(self.avg_salary, dtype=numpy.int64)
+            return numpy.argsort(-salaries, kind='stable').tolist()
+        return sorted(
+            range(len(self)), key=self.avg_salary.__getitem__, reverse=True
+        )
+
+    def sort_by_salary(self) -> 'VacancyBatch':
+        """
+        Sorts the batch by average salary, highest first.
+
+        Returns:
+            VacancyBatch: The sorted vacancies.
+        """
+        return self.take(self.salary_order())
+
+    def top_n(self, count: int) -> 'VacancyBatch':
+        """
+        Selects the best-paid vacancies without sorting the whole batch.
+
+        Args:
+            count (int): The number of vacancies to select.
+
+        Returns:
+            VacancyBatch: At most count vacancies, highest salary first.
+        """
+        if count >= len(self):
+            return self.sort_by_salary()
+        if count <= 0:
+            return self.take([])
+
+        if numpy is not None:
+            salaries = numpy.frombuffer(self.avg_salary, dtype=numpy.int64)
+            selected = numpy.argpartition(-salaries, count - 1)[:count]
+            order = numpy.lexsort((selected, -salaries[selected]))
+            return self.take(selected[order].tolist())
+
+        return self.take(
+            heapq.nlargest(
+                count, range(len(self)), key=self.avg_salary.__getitem__
+            )
+        )
@@ -1,8 +1,11 @@
 """ Vacancy filter module"""
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List
 
+from src.metrics import METRICS
+from src.salary_index import SalaryIndex
 from src.vacancy import Vacancy
+from src.vacancy_batch import VacancyBatch
 
 
 class VacancyFilter(ABC):
@@ -24,23 +27,78 @@ class VacancyFilter(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_filtered_vacancies(
+            self,
+            vacancies: Iterable[Vacancy],
+            salary_range: List[int]
+    ) -> Iterator[Vacancy]:
+        """
+        Abstract method to lazily filter a stream of vacancies based on a salary range.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies to filter.
+            salary_range (List[int]): The salary range [min_salary, max_salary] to filter the vacancies.
+
+        Returns:
+            Iterator[Vacancy]: The filtered vacancies.
+        """
+        pass
+
 
 class SalaryRangeFilter(VacancyFilter):
     def filter_vacancies(
-            self, vacancies: List[Vacancy], salary_range: List[int]
-    ) -> List[Vacancy]:
+            self, vacancies: List[Vacancy] | VacancyBatch | SalaryIndex,
+            salary_range: List[int]
+    ) -> List[Vacancy] | VacancyBatch:
         """
         Filter vacancies based on a salary range.
 
+        A VacancyBatch is filtered column-wise and returned as a batch. A
+        SalaryIndex answers with a range query, lowest salary first.
+
         Args:
-            vacancies (List[Vacancy]): The list of vacancies to filter.
+            vacancies (List[Vacancy] | VacancyBatch | SalaryIndex): The vacancies to filter.
             salary_range (List[int]): The salary range [min_salary, max_salary] to filter the vacancies.
 
         Returns:
-            List[Vacancy]: The filtered list of vacancies.
+            List[Vacancy] | VacancyBatch: The filtered vacancies.
         """
+        with METRICS.timer('filter_seconds'):
+            if isinstance(vacancies, VacancyBatch):
+                return vacancies.filter_salary(salary_range)
+            if isinstance(vacancies, SalaryIndex):
+                return vacancies.range(*salary_range)
+            return list(self.iter_filtered_vacancies(vacancies, salary_range))
+
+    def iter_filtered_vacancies(
+            self, vacancies: Iterable[Vacancy], salary_range: List[int]
+    ) -> Iterator[Vacancy]:
+        """
+        Lazily filter a stream of vacancies based on a salary range.
+
+        Args:
+            vacancies (Iterable[Vacancy]): The vacancies to filter.
+            salary_range (List[int]): The salary range [min_salary, max_salary] to filter the vacancies.
+
+        Returns:
+            Iterator[Vacancy]: The filtered vacancies.
+        """
+        if not METRICS.enabled:
+            return self._filtered(vacancies, salary_range)
+        return METRICS.counted(
+            self._filtered(
+                METRICS.counted(vacancies, 'filter_input_total'),
+                salary_range
+            ),
+            'filter_output_total'
+        )
+
+    @staticmethod
+    def _filtered(
+            vacancies: Iterable[Vacancy], salary_range: List[int]
+    ) -> Iterator[Vacancy]:
         min_salary, max_salary = salary_range
-        filtered_vacancies = []
 
         for vacancy in vacancies:
             if vacancy.avg_salary == 0:
@@ -49,5 +107,4 @@ class SalaryRangeFilter(VacancyFilter):
                 continue
             if max_salary is not None and vacancy.avg_salary >= max_salary:
                 continue
-            filtered_vacancies.append(vacancy)
-        return filtered_vacancies
+            yield vacancy
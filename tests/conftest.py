@@ -0,0 +1,183 @@
+""" Shared pytest fixtures"""
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from src import main
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+from src.vacancy import Vacancy
+
+NEWEST = datetime(2024, 1, 1, tzinfo=timezone.utc)
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+
+class StubHHAPI:
+    """
+    A local stand-in for the HH.ru vacancies API.
+
+    Every keyword matches `totals[keyword]` vacancies (`total` if missing),
+    numbered from 0 and published one minute apart, newest first, and
+    restricted to the inclusive date_from/date_to window if given. Queued
+    failures are answered before any page, and every request is recorded
+    with the peak number of concurrent requests per keyword and overall.
+    """
+
+    def __init__(self):
+        self.total: int = 45
+        self.totals: dict = {}
+        self.delay: float = 0.0
+        self.failures: deque = deque()
+        self.requests: list = []
+        self.in_flight: dict = {}
+        self.max_in_flight: dict = {}
+        self.max_total_in_flight: int = 0
+        self.url: str = ''
+        self._lock = threading.Lock()
+
+    def fail(self, status: int, times: int = 1, retry_after: str = '0'):
+        self.failures.extend([(status, retry_after)] * times)
+
+    @staticmethod
+    def published_at(vacancy_id: int) -> datetime:
+        return NEWEST - timedelta(minutes=vacancy_id)
+
+    def page(self, parameters: dict) -> dict:
+        keyword = parameters.get('text', '')
+        total = self.totals.get(keyword, self.total)
+        per_page = int(parameters.get('per_page', 20))
+        date_from, date_to = (
+            datetime.strptime(parameters[name], DATE_FORMAT)
+            if name in parameters else None
+            for name in ('date_from', 'date_to')
+        )
+        ids = [
+            vacancy_id for vacancy_id in range(total)
+            if (date_from is None
+                or self.published_at(vacancy_id) >= date_from)
+            and (date_to is None or self.published_at(vacancy_id) <= date_to)
+        ]
+        start = int(parameters.get('page', 0)) * per_page
+        return {'items': [
+            {
+                'id': str(vacancy_id),
+                'name': f'{keyword} developer {vacancy_id}'.strip(),
+                'alternate_url': f'https://hh.ru/vacancy/{vacancy_id}',
+                'snippet': {'requirement': 'Python', 'responsibility': None},
+                'salary': {
+                    'from': 1000 * (vacancy_id + 1), 'to': None,
+                    'currency': 'RUR'
+                },
+                'employer': {'name': 'Acme'},
+                'published_at': self.published_at(vacancy_id).strftime(
+                    DATE_FORMAT
+                )
+            }
+            for vacancy_id in ids[start:start + per_page]
+        ]}
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        parameters = dict(parse_qsl(urlsplit(request.path).query))
+        keyword = parameters.get('text', '')
+        with self._lock:
+            self.requests.append(parameters)
+            failure = self.failures.popleft() if self.failures else None
+            self.in_flight[keyword] = self.in_flight.get(keyword, 0) + 1
+            self.max_in_flight[keyword] = max(
+                self.max_in_flight.get(keyword, 0), self.in_flight[keyword]
+            )
+            self.max_total_in_flight = max(
+                self.max_total_in_flight, sum(self.in_flight.values())
+            )
+        try:
+            time.sleep(self.delay)
+            if failure is not None:
+                status, retry_after = failure
+                request.send_response(status)
+                request.send_header('Retry-After', retry_after)
+                request.send_header('Content-Length', '0')
+                request.end_headers()
+                return
+            body = json.dumps(self.page(parameters)).encode('utf-8')
+            request.send_response(200)
+            request.send_header('Content-Type', 'application/json')
+            request.send_header('Content-Length', str(len(body)))
+            request.end_headers()
+            request.wfile.write(body)
+        finally:
+            with self._lock:
+                self.in_flight[keyword] -= 1
+
+
+@pytest.fixture
+def hh_api():
+    """
+    Serves a StubHHAPI on a free local port for the duration of a test.
+    """
+    api = StubHHAPI()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            api.handle(self)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.01,), daemon=True
+    )
+    thread.start()
+    api.url = f'http://127.0.0.1:{server.server_port}/vacancies'
+    yield api
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def hh_platform(hh_api, monkeypatch):
+    """
+    Points the HH.ru platform of src.main at the stub server, without rate
+    limiting.
+    """
+
+    class StubHHParser(HHParser):
+        def __init__(self, **kwargs):
+            super().__init__(rate_limiter=RateLimiter({}, 1000), **kwargs)
+            self.url = hh_api.url
+
+    monkeypatch.setitem(
+        main.PLATFORM_PARSERS, '1', ('HH.ru', StubHHParser)
+    )
+    return hh_api
+
+
+@pytest.fixture
+def make_vacancy():
+    """
+    Returns a factory of vacancies with default field values.
+    """
+
+    def factory(
+            vacancy_id: int, platform: str = 'HH.ru',
+            title: str = 'Python developer', salary_from: int | None = 100,
+            salary_to: int | None = 200, employer: str | None = 'Acme',
+            url: str | None = None, description: str = 'Write Python code'
+    ) -> Vacancy:
+        if url is None:
+            url = f'https://{platform.lower()}/vacancy/{vacancy_id}'
+        return Vacancy(
+            platform, vacancy_id, title, url, salary_from, salary_to,
+            'RUR', description, employer
+        )
+
+    return factory
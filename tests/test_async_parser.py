@@ -0,0 +1,121 @@
+""" Tests of the asyncio parsers against a stub server"""
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from src import async_parser  # noqa: E402
+from src.async_parser import gather_vacancies  # noqa: E402
+from src.async_parser_hh import AsyncHHParser  # noqa: E402
+from src.rate_limiter import RateLimiter  # noqa: E402
+from src.response_cache import (  # noqa: E402
+    DiskResponseCache, MemoryResponseCache
+)
+
+
+@pytest.fixture
+def make_parser(hh_api):
+    def factory(**kwargs) -> AsyncHHParser:
+        parser = AsyncHHParser(rate_limiter=RateLimiter({}, 1000), **kwargs)
+        parser.url = hh_api.url
+        return parser
+
+    return factory
+
+
+async def _vacancies(parser, keyword, count):
+    async with parser:
+        return await parser.vacancies(keyword, count)
+
+
+def test_vacancies_arrive_in_page_order(hh_api, make_parser):
+    vacancies = asyncio.run(_vacancies(make_parser(), 'python', 40))
+
+    assert [vacancy.vacancy_id for vacancy in vacancies] == list(range(40))
+    assert vacancies[0].title == 'python developer 0'
+
+
+def test_parse_vacancies_sync(hh_api, make_parser):
+    raw = make_parser().parse_vacancies_sync('python', 100)
+
+    assert [int(vacancy['id']) for vacancy in raw] == list(range(45))
+
+
+def test_stream_stops_at_the_last_page(hh_api, make_parser):
+    vacancies = asyncio.run(_vacancies(make_parser(max_in_flight=1), '', 200))
+
+    assert len(vacancies) == hh_api.total
+    assert [request['page'] for request in hh_api.requests] == ['0', '1', '2']
+
+
+def test_pages_in_flight_are_capped(hh_api, make_parser):
+    hh_api.delay = 0.02
+    asyncio.run(_vacancies(make_parser(max_in_flight=2), 'python', 100))
+
+    assert hh_api.max_in_flight['python'] == 2
+
+
+def test_shared_session_serves_several_platforms(hh_api, make_parser):
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            first = make_parser(session=session)
+            second = make_parser(session=session)
+            second.platform = 'Mirror'
+            results = await gather_vacancies([first, second], 'go', 20)
+            await first.aclose()
+            assert not session.closed
+            return results
+
+    results = asyncio.run(run())
+    assert sorted(results) == ['HH.ru', 'Mirror']
+    assert all(len(vacancies) == 20 for vacancies in results.values())
+
+
+def test_throttled_and_failed_requests_are_retried(hh_api, make_parser):
+    hh_api.fail(429)
+    hh_api.fail(502)
+    vacancies = asyncio.run(_vacancies(make_parser(), 'python', 20))
+
+    assert len(vacancies) == 20
+    assert len(hh_api.requests) == 3
+
+
+def test_client_errors_are_raised(hh_api, make_parser):
+    hh_api.fail(404)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(_vacancies(make_parser(), 'python', 20))
+    assert len(hh_api.requests) == 1
+
+
+def test_disk_cache_runs_in_worker_threads(
+        hh_api, make_parser, tmp_path, monkeypatch
+):
+    offloaded = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(function, *args):
+        offloaded.append(function.__name__)
+        return await to_thread(function, *args)
+
+    monkeypatch.setattr(async_parser.asyncio, 'to_thread', recording_to_thread)
+    cache = DiskResponseCache(str(tmp_path / 'cache'))
+    for _ in range(2):
+        asyncio.run(_vacancies(make_parser(cache=cache), 'python', 40))
+
+    assert len(hh_api.requests) == 2
+    assert offloaded.count('get') == 4
+    assert offloaded.count('set') == 2
+
+
+def test_memory_cache_is_used_inline(hh_api, make_parser, monkeypatch):
+    async def fail(function, *args):
+        raise AssertionError('memory cache offloaded to a thread')
+
+    monkeypatch.setattr(async_parser.asyncio, 'to_thread', fail)
+    cache = MemoryResponseCache()
+    for _ in range(2):
+        asyncio.run(_vacancies(make_parser(cache=cache), 'python', 40))
+
+    assert len(hh_api.requests) == 2
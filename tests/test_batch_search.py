@@ -0,0 +1,105 @@
+""" Tests of the multi-keyword batch search"""
+import json
+
+import pytest
+
+from src.batch_search import BatchSearch, SearchQuery, save_results
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def make_batch(hh_api):
+    batches = []
+
+    def factory(concurrency: int = 2, max_workers: int = 8) -> BatchSearch:
+        parser = HHParser(rate_limiter=RateLimiter({}, 1000))
+        parser.url = hh_api.url
+        batch = BatchSearch(
+            {'HH.ru': parser}, max_workers, {'HH.ru': concurrency}
+        )
+        batches.append(batch)
+        return batch
+
+    yield factory
+    for batch in batches:
+        batch.close()
+
+
+def test_queries_collect_their_vacancies(hh_api, make_batch):
+    hh_api.totals = {'python': 45, 'java': 10, 'go': 0}
+    queries = [
+        SearchQuery('python', count=50),
+        SearchQuery('java', count=50),
+        SearchQuery('go', count=50),
+        SearchQuery('python', count=25)
+    ]
+    results = make_batch().search(queries)
+
+    assert [
+        (query.keyword, query.count, len(by_platform.get('HH.ru', [])))
+        for query, by_platform in results
+    ] == [('python', 50, 45), ('java', 50, 10), ('go', 50, 0),
+          ('python', 25, 25)]
+
+
+def test_streams_stop_at_the_first_short_page(hh_api, make_batch):
+    hh_api.totals = {'java': 10}
+    results = make_batch(concurrency=1).search([
+        SearchQuery('java', count=100)
+    ])
+
+    assert len(results[0][1]['HH.ru']) == 10
+    assert [request['page'] for request in hh_api.requests] == ['0']
+
+
+def test_platform_concurrency_is_capped(hh_api, make_batch):
+    hh_api.delay = 0.02
+    queries = [SearchQuery(f'keyword {i}', count=40) for i in range(6)]
+    for _ in make_batch(concurrency=3).run(queries):
+        pass
+
+    assert 1 < hh_api.max_total_in_flight <= 3
+
+
+def test_salary_filter_applies_per_query(hh_api, make_batch):
+    results = make_batch().search([
+        SearchQuery('python', count=45, salary_min_max=[29999, None])
+    ])
+
+    assert sorted(
+        vacancy.vacancy_id for vacancy in results[0][1]['HH.ru']
+    ) == list(range(29, 45))
+
+
+def test_failed_query_is_dropped(hh_api, make_batch, capsys):
+    hh_api.fail(404)
+    hh_api.fail(200)
+    results = make_batch(concurrency=1, max_workers=1).search([
+        SearchQuery('python', count=20),
+        SearchQuery('java', count=20),
+        SearchQuery('go', count=20)
+    ])
+
+    assert [len(by_platform) for _, by_platform in results] == [0, 0, 1]
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'Query "python" failed on HH.ru' in captured.err
+    assert 'Query "java" failed on HH.ru' in captured.err
+
+
+def test_save_results_tags_vacancies_with_their_query(
+        hh_api, make_batch, tmp_path
+):
+    path = str(tmp_path / 'batch.jsonl')
+    hh_api.totals = {'python': 5, 'java': 3}
+    written = save_results(
+        make_batch().run([SearchQuery('python'), SearchQuery('java')]), path
+    )
+
+    with open(path, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert written == 8
+    assert {
+        (record['query'], record['vacancy_id']) for record in records
+    } == {('python', i) for i in range(5)} | {('java', i) for i in range(3)}
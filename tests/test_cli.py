@@ -0,0 +1,124 @@
+""" Tests of the command line interface"""
+import csv
+import io
+import json
+
+import pytest
+
+from src import cli
+from src.file_handler_json import JSONFileHandler
+from src.file_handler_jsonl import JSONLFileHandler
+from src.file_handler_sqlite import COLUMNS, SQLiteFileHandler
+
+PLATFORMS = {'1': 'HH.ru', '2': 'SuperJob.ru'}
+
+pytestmark = pytest.mark.usefixtures('hh_platform')
+
+
+def _run(argv, capsysbinary):
+    status = cli.main(['-p', 'hh', *argv])
+    captured = capsysbinary.readouterr()
+    return status, captured.out, captured.err.decode('utf-8')
+
+
+def test_jsonl_to_stdout(capsysbinary):
+    status, out, err = _run(['python', '-n', '40'], capsysbinary)
+
+    assert status == 0
+    assert err == ''
+    records = [json.loads(line) for line in out.splitlines()]
+    assert [record['vacancy_id'] for record in records] == list(range(40))
+    assert set(records[0]) == set(COLUMNS)
+    assert records[1]['title'] == 'python developer 1'
+
+
+def test_csv_to_file(tmp_path, capsysbinary):
+    path = tmp_path / 'out.csv'
+    status, out, _ = _run(
+        ['python', '-n', '20', '-f', 'csv', '-o', str(path)], capsysbinary
+    )
+
+    assert status == 0
+    assert out == b''
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert tuple(rows[0]) == COLUMNS
+    assert [row['vacancy_id'] for row in rows] == [str(i) for i in range(20)]
+    assert rows[5]['salary_from'] == '6000'
+
+
+def test_salary_range(capsysbinary):
+    status, out, _ = _run(
+        ['-n', '20', '--salary-min', '9999', '--salary-max', '15000'],
+        capsysbinary
+    )
+
+    assert status == 0
+    assert [
+        json.loads(line)['vacancy_id'] for line in out.splitlines()
+    ] == list(range(9, 14))
+
+
+@pytest.mark.parametrize('name', ['store.jsonl', 'store.json', 'store.db'])
+def test_store(tmp_path, capsysbinary, name):
+    path = str(tmp_path / name)
+    status, out, _ = _run(['-n', '20', '-s', path], capsysbinary)
+
+    assert status == 0
+    assert len(out.splitlines()) == 20
+    if name.endswith('.jsonl'):
+        loaded = JSONLFileHandler(path).load_vacancies(
+            PLATFORMS, 100, None, [None, None]
+        )
+    elif name.endswith('.json'):
+        loaded = JSONFileHandler(path).load_vacancies_from_json(
+            PLATFORMS, 100, None, [None, None]
+        )
+    else:
+        with SQLiteFileHandler(path) as handler:
+            loaded = handler.load_vacancies(
+                PLATFORMS, 100, None, [None, None]
+            )
+    assert len(loaded['HH.ru']) == 20
+
+
+def test_unsupported_store_is_rejected(tmp_path, capsys):
+    with pytest.raises(SystemExit) as raised:
+        cli.main(['-s', str(tmp_path / 'store.txt')])
+
+    assert raised.value.code == 2
+    assert 'unsupported store' in capsys.readouterr().err
+
+
+def test_request_failure(hh_api, capsysbinary):
+    hh_api.fail(404)
+    status, out, err = _run(['python'], capsysbinary)
+
+    assert status == 1
+    assert out == b''
+    assert err.startswith('Request failed: 404')
+
+
+def test_invalid_response(hh_api, capsysbinary):
+    hh_api.fail(200)
+    status, out, err = _run(['python'], capsysbinary)
+
+    assert status == 1
+    assert out == b''
+    assert err.startswith('Invalid response: ')
+
+
+def test_write_jsonl_and_csv_stream(make_vacancy):
+    output = io.BytesIO()
+    assert cli.write_jsonl([make_vacancy(1), make_vacancy(2)], output) == 2
+    assert [
+        json.loads(line)['vacancy_id']
+        for line in output.getvalue().splitlines()
+    ] == [1, 2]
+
+    output = io.BytesIO()
+    assert cli.write_csv([make_vacancy(3)], output) == 1
+    assert not output.closed
+    assert output.getvalue().decode('utf-8').splitlines()[0] == ','.join(
+        COLUMNS
+    )
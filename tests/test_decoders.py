@@ -0,0 +1,77 @@
+""" Tests of the schema-driven page decoders"""
+import json
+
+import pytest
+
+from src.decoders import DECODE_ERRORS, HHPageDecoder, SuperJobPageDecoder
+from src.json_codec import get_codec
+from src.parser_hh import HHParser
+from src.parser_superjob import SuperJobParser
+
+HH_PAGE = {'found': 2, 'items': [
+    {
+        'id': '1', 'name': 'Python developer', 'premium': False,
+        'alternate_url': 'https://hh.ru/vacancy/1',
+        'salary': {'from': 100000, 'to': None, 'currency': 'RUR'},
+        'snippet': {'requirement': None, 'responsibility': 'Write code'},
+        'employer': {'name': 'Acme', 'id': '7'}
+    },
+    {
+        'id': '2', 'name': 'Go developer',
+        'alternate_url': 'https://hh.ru/vacancy/2', 'salary': None,
+        'snippet': {'requirement': 'Go', 'responsibility': None},
+        'employer': None
+    }
+]}
+
+SUPERJOB_PAGE = {'total': 1, 'objects': [
+    {
+        'id': 3, 'profession': 'Python developer', 'town': {'id': 4},
+        'link': 'https://www.superjob.ru/vakansii/3.html',
+        'payment_from': 90000, 'payment_to': 0, 'currency': 'rub',
+        'vacancyRichText': '<p>Python</p>', 'firm_name': 'Acme'
+    }
+]}
+
+DECODERS = [
+    (HHPageDecoder, HHParser.to_vacancy, HH_PAGE, 'items'),
+    (SuperJobPageDecoder, SuperJobParser.to_vacancy, SUPERJOB_PAGE,
+     'objects')
+]
+
+
+def _decoder(decoder_class, convert, typed):
+    decoder = decoder_class(convert, get_codec('json'))
+    if not typed:
+        decoder._decoder = None
+    elif decoder._decoder is None:
+        pytest.skip('msgspec is not installed')
+    return decoder
+
+
+@pytest.mark.parametrize('typed', [True, False])
+@pytest.mark.parametrize('decoder_class, convert, page, key', DECODERS)
+def test_decoded_vacancies_match_the_converter(
+        decoder_class, convert, page, key, typed
+):
+    decoder = _decoder(decoder_class, convert, typed)
+    vacancies = decoder.decode(json.dumps(page).encode('utf-8'))
+
+    assert [vacancy.to_dict() for vacancy in vacancies] == [
+        convert(item).to_dict() for item in page[key]
+    ]
+
+
+@pytest.mark.parametrize('typed', [True, False])
+@pytest.mark.parametrize('document', [
+    b'', b'not json', b'[]', b'{}', b'{"items": [{"id": "1"}]}',
+    b'{"objects": [{"id": 1}]}'
+])
+@pytest.mark.parametrize('decoder_class, convert, page, key', DECODERS)
+def test_invalid_documents_raise_decode_errors(
+        decoder_class, convert, page, key, typed, document
+):
+    decoder = _decoder(decoder_class, convert, typed)
+
+    with pytest.raises(DECODE_ERRORS):
+        decoder.decode(document)
@@ -0,0 +1,130 @@
+""" Tests of the vacancy de-duplication"""
+import pytest
+
+from src.dedup import (
+    Deduplicator, MinHasher, fingerprint, normalize_currency,
+    normalize_text, normalize_url
+)
+from src.parser_hh import HHParser
+from src.parser_superjob import SuperJobParser
+
+
+def hh_vacancy(
+        vacancy_id, title='Python developer', salary_from=100000,
+        salary_to=None, employer='Acme', url=None
+):
+    salary = None
+    if salary_from is not None or salary_to is not None:
+        salary = {'from': salary_from, 'to': salary_to, 'currency': 'RUR'}
+    return HHParser.to_vacancy({
+        'id': str(vacancy_id),
+        'name': title,
+        'alternate_url': url or f'https://hh.ru/vacancy/{vacancy_id}',
+        'salary': salary,
+        'snippet': {'requirement': 'Python', 'responsibility': None},
+        'employer': {'name': employer}
+    })
+
+
+def superjob_vacancy(
+        vacancy_id, title='Python developer', salary_from=100000,
+        salary_to=0, employer='Acme'
+):
+    return SuperJobParser.to_vacancy({
+        'id': vacancy_id,
+        'profession': title,
+        'link': f'https://www.superjob.ru/vakansii/{vacancy_id}.html',
+        'payment_from': salary_from,
+        'payment_to': salary_to,
+        'currency': 'rub',
+        'vacancyRichText': '<p>Python</p>',
+        'firm_name': employer
+    })
+
+
+def test_normalization():
+    assert normalize_text('<b>Python</b>-разработчик (Ёлка)') == (
+        'python разработчик елка'
+    )
+    assert normalize_url('HTTPS://www.hh.ru/vacancy/1/?from=main#top') == (
+        'hh.ru/vacancy/1'
+    )
+    assert normalize_url(None) == ''
+    assert normalize_currency('RUR') == normalize_currency('rub') == 'rub'
+    assert normalize_currency('USD') == 'usd'
+    assert normalize_currency(None) == ''
+
+
+def test_fingerprint_matches_across_platforms():
+    assert fingerprint(hh_vacancy(1)) == fingerprint(
+        superjob_vacancy(2, title='PYTHON  developer!')
+    )
+    assert fingerprint(hh_vacancy(1, salary_from=None)) == fingerprint(
+        superjob_vacancy(2, salary_from=0)
+    )
+    assert fingerprint(hh_vacancy(1)) != fingerprint(
+        superjob_vacancy(2, salary_to=150000)
+    )
+
+
+def test_same_id_and_same_url_are_duplicates():
+    deduplicator = Deduplicator()
+    vacancies = [
+        hh_vacancy(1),
+        hh_vacancy(1, title='Other title'),
+        hh_vacancy(2, title='Other', url='https://hh.ru/vacancy/1'),
+        hh_vacancy(3, title='Other', url='http://www.hh.ru/vacancy/1/')
+    ]
+
+    assert [deduplicator.is_duplicate(vacancy) for vacancy in vacancies] == [
+        False, True, True, True
+    ]
+    assert len(deduplicator) == 1
+    assert deduplicator.duplicates == 3
+
+
+def test_content_is_only_compared_across_platforms():
+    deduplicator = Deduplicator()
+    vacancies = [
+        hh_vacancy(1),
+        hh_vacancy(2),
+        superjob_vacancy(3),
+        superjob_vacancy(4, salary_to=150000),
+        superjob_vacancy(5, salary_from=0, employer='Other'),
+        hh_vacancy(6, salary_from=None, employer='Other')
+    ]
+
+    assert [
+        vacancy.vacancy_id for vacancy in deduplicator.filter(vacancies)
+    ] == [1, 2, 4, 5]
+
+
+def test_near_duplicates_across_platforms():
+    deduplicator = Deduplicator(near_duplicates=True)
+    vacancies = [
+        hh_vacancy(1, title='Senior Python developer (remote)'),
+        hh_vacancy(2, title='Senior Python developer, remote'),
+        superjob_vacancy(3, title='Senior Python developers, remote'),
+        superjob_vacancy(
+            4, title='Senior Python developers, remote', salary_to=150000
+        ),
+        superjob_vacancy(5, title='Accountant')
+    ]
+
+    assert [
+        vacancy.vacancy_id for vacancy in deduplicator.filter(vacancies)
+    ] == [1, 2, 4, 5]
+
+
+def test_minhash_similarity_estimates_jaccard():
+    hasher = MinHasher(num_perm=128)
+    same = hasher.signature('python developer')
+
+    assert MinHasher.similarity(same, hasher.signature('python developer')) \
+        == 1.0
+    assert MinHasher.similarity(same, hasher.signature('accountant')) < 0.2
+
+
+def test_bands_must_divide_num_perm():
+    with pytest.raises(ValueError):
+        Deduplicator(num_perm=64, bands=10)
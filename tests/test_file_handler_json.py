@@ -0,0 +1,180 @@
+""" Tests of the JSON file store"""
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src import file_handler_json
+from src.file_handler_json import JSONFileHandler
+from src.vacancy import Vacancy
+
+
+def _read(path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _add_vacancies(path: str, start: int, count: int) -> None:
+    handler = JSONFileHandler(path)
+    for vacancy_id in range(start, start + count):
+        handler.add_vacancy_to_json(Vacancy(
+            'HH.ru', vacancy_id, f'Vacancy {vacancy_id}',
+            f'https://hh.ru/vacancy/{vacancy_id}', 100, 200, 'RUR', ''
+        ))
+
+
+def _delete_vacancy(path: str, vacancy_id: int) -> None:
+    handler = JSONFileHandler(path)
+    handler.delete_vacancy_from_json(Vacancy.from_dict(
+        handler.get_vacancy_from_json(vacancy_id)
+    ))
+
+
+def _in_process(target, *args) -> None:
+    process = multiprocessing.Process(target=target, args=args)
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+def test_add_get_and_delete(tmp_path, make_vacancy):
+    path = tmp_path / 'vacancies.json'
+    handler = JSONFileHandler(str(path))
+    handler.add_vacancy_to_json(make_vacancy(1))
+    handler.add_vacancy_to_json(make_vacancy(2, platform='SuperJob.ru'))
+
+    assert handler.get_vacancy_from_json(1, 'HH.ru')['vacancy_id'] == 1
+    assert handler.get_vacancy_from_json(2)['platform'] == 'SuperJob.ru'
+    assert handler.get_vacancy_from_json(2, 'HH.ru') is None
+
+    handler.delete_vacancy_from_json(make_vacancy(1))
+    assert handler.get_vacancy_from_json(1, 'HH.ru') is None
+    assert _read(path) == {
+        'HH.ru': [],
+        'SuperJob.ru': [make_vacancy(2, platform='SuperJob.ru').to_dict()]
+    }
+
+
+def test_add_replaces_vacancy_with_same_key(tmp_path, make_vacancy):
+    handler = JSONFileHandler(str(tmp_path / 'vacancies.json'))
+    handler.add_vacancies_to_json([make_vacancy(1), make_vacancy(2)])
+    handler.add_vacancies_to_json([make_vacancy(1, title='Go developer')])
+
+    saved = _read(tmp_path / 'vacancies.json')['HH.ru']
+    assert [vacancy['title'] for vacancy in saved] == [
+        'Go developer', 'Python developer'
+    ]
+
+
+def test_missing_file_is_reported_on_stderr(tmp_path, capsys):
+    handler = JSONFileHandler(str(tmp_path / 'vacancies.json'))
+    assert handler.get_vacancy_from_json(1) is None
+
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'not found' in captured.err
+
+
+def test_failed_save_keeps_previous_file(tmp_path, make_vacancy, monkeypatch):
+    path = tmp_path / 'vacancies.json'
+    handler = JSONFileHandler(str(path))
+    handler.add_vacancy_to_json(make_vacancy(1))
+    before = path.read_bytes()
+
+    def fail(source, target):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(file_handler_json.os, 'replace', fail)
+    with pytest.raises(OSError):
+        handler.add_vacancy_to_json(make_vacancy(2))
+
+    assert path.read_bytes() == before
+    assert sorted(os.listdir(tmp_path)) == [
+        'vacancies.json', 'vacancies.json.lock'
+    ]
+
+
+def test_handlers_merge_each_others_writes(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.json')
+    first = JSONFileHandler(path)
+    second = JSONFileHandler(path)
+    first.add_vacancy_to_json(make_vacancy(1))
+    second.add_vacancy_to_json(make_vacancy(2))
+    first.delete_vacancy_from_json(make_vacancy(1))
+    first.add_vacancy_to_json(make_vacancy(3))
+
+    assert [
+        vacancy['vacancy_id'] for vacancy in _read(path)['HH.ru']
+    ] == [2, 3]
+
+
+def test_cached_handler_writes_on_flush(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.json')
+    JSONFileHandler(path).add_vacancy_to_json(make_vacancy(1))
+
+    with JSONFileHandler(path, cached=True) as cached:
+        cached.add_vacancy_to_json(make_vacancy(2))
+        assert len(_read(path)['HH.ru']) == 1
+        JSONFileHandler(path).add_vacancy_to_json(make_vacancy(3))
+
+    assert [
+        vacancy['vacancy_id'] for vacancy in _read(path)['HH.ru']
+    ] == [1, 3, 2]
+
+
+def test_cached_handler_sees_external_changes(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.json')
+    cached = JSONFileHandler(path, cached=True)
+    JSONFileHandler(path).add_vacancy_to_json(make_vacancy(1))
+    assert cached.get_vacancy_from_json(1) is not None
+
+    JSONFileHandler(path).add_vacancy_to_json(make_vacancy(2))
+    assert cached.get_vacancy_from_json(2) is not None
+
+
+def test_concurrent_processes_lose_no_updates(tmp_path):
+    path = str(tmp_path / 'vacancies.json')
+    JSONFileHandler(path).save_all_vacancies_to_json({})
+    processes = [
+        multiprocessing.Process(
+            target=_add_vacancies, args=(path, worker * 100, 10)
+        )
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert sorted(
+        vacancy['vacancy_id'] for vacancy in _read(path)['HH.ru']
+    ) == [
+        worker * 100 + offset for worker in range(4) for offset in range(10)
+    ]
+
+
+def test_cached_handler_sees_other_process_writes(tmp_path, monkeypatch):
+    path = str(tmp_path / 'vacancies.json')
+    _in_process(_add_vacancies, path, 0, 3)
+    cached = JSONFileHandler(path, cached=True)
+    parsed = []
+    parse_file = cached._parse_file
+    monkeypatch.setattr(
+        cached, '_parse_file',
+        lambda file_path: parsed.append(file_path) or parse_file(file_path)
+    )
+
+    assert len(cached.search_vacancies('vacancy')) == 3
+    assert cached.get_vacancy_from_json(2) is not None
+    assert len(parsed) == 1
+
+    _in_process(_add_vacancies, path, 10, 2)
+    _in_process(_delete_vacancy, path, 1)
+    assert cached.get_vacancy_from_json(11) is not None
+    assert cached.get_vacancy_from_json(1) is None
+    assert sorted(
+        vacancy.vacancy_id for vacancy in cached.search_vacancies('vacancy')
+    ) == [0, 2, 10, 11]
+    assert len(parsed) == 2
@@ -0,0 +1,149 @@
+""" Tests of the JSON Lines log store"""
+import json
+import multiprocessing
+import os
+
+from src.file_handler_jsonl import JSONLFileHandler
+from src.vacancy import Vacancy
+
+
+def _lines(path) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def _add_vacancies(path: str, start: int, count: int) -> None:
+    handler = JSONLFileHandler(path)
+    for vacancy_id in range(start, start + count):
+        handler.add_vacancy(Vacancy(
+            'HH.ru', vacancy_id, f'Vacancy {vacancy_id}',
+            f'https://hh.ru/vacancy/{vacancy_id}', 100, 200, 'RUR', ''
+        ))
+
+
+def test_latest_line_wins(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.jsonl')
+    handler = JSONLFileHandler(path)
+    handler.add_vacancies([make_vacancy(1), make_vacancy(2)])
+    handler.add_vacancy(make_vacancy(1, title='Go developer'))
+    handler.delete_vacancy(make_vacancy(2))
+
+    assert len(_lines(path)) == 4
+    replayed = JSONLFileHandler(path)
+    assert replayed.get_vacancy(1, 'HH.ru')['title'] == 'Go developer'
+    assert replayed.get_vacancy(2, 'HH.ru') is None
+
+
+def test_add_vacancies_stores_extra_fields(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.jsonl')
+    JSONLFileHandler(path).add_vacancies(
+        [make_vacancy(1)], {'query': 'python'}
+    )
+
+    assert _lines(path)[0]['query'] == 'python'
+
+
+def test_partial_line_is_ignored_and_truncated(tmp_path, make_vacancy):
+    path = tmp_path / 'vacancies.jsonl'
+    JSONLFileHandler(str(path)).add_vacancy(make_vacancy(1))
+    with open(path, 'ab') as f:
+        f.write(b'{"platform": "HH.ru", "vacancy_id": 2, "ti')
+
+    handler = JSONLFileHandler(str(path))
+    assert handler.get_vacancy(2) is None
+    handler.add_vacancy(make_vacancy(3))
+
+    assert [line['vacancy_id'] for line in _lines(path)] == [1, 3]
+    assert JSONLFileHandler(str(path)).get_vacancy(3) is not None
+
+
+def test_invalid_line_is_reported_on_stderr(tmp_path, make_vacancy, capsys):
+    path = tmp_path / 'vacancies.jsonl'
+    path.write_bytes(b'not json\n')
+    handler = JSONLFileHandler(str(path))
+    handler.add_vacancy(make_vacancy(1))
+
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'invalid line' in captured.err
+    assert handler.get_vacancy(1) is not None
+
+
+def test_handlers_catch_up_with_each_other(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.jsonl')
+    first = JSONLFileHandler(path)
+    second = JSONLFileHandler(path)
+    first.add_vacancy(make_vacancy(1))
+    assert second.get_vacancy(1) is not None
+
+    second.add_vacancy(make_vacancy(2))
+    first.delete_vacancy(make_vacancy(2))
+    assert second.get_vacancy(2) is None
+
+
+def test_compaction_keeps_live_records(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.jsonl')
+    handler = JSONLFileHandler(path, compact_min_records=4, compact_ratio=0.5)
+    reader = JSONLFileHandler(path)
+    for version in range(3):
+        handler.add_vacancies([
+            make_vacancy(1, title=f'Version {version}'), make_vacancy(2)
+        ])
+        if version == 1:
+            assert reader.get_vacancy(1)['title'] == 'Version 1'
+
+    assert [line['title'] for line in _lines(path)] == [
+        'Version 2', 'Python developer'
+    ]
+    assert sorted(os.listdir(tmp_path)) == [
+        'vacancies.jsonl', 'vacancies.jsonl.lock'
+    ]
+    assert reader.get_vacancy(1)['title'] == 'Version 2'
+
+    reader.add_vacancy(make_vacancy(3))
+    assert [line['vacancy_id'] for line in _lines(path)] == [1, 2, 3]
+
+
+def test_explicit_compaction(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.jsonl')
+    handler = JSONLFileHandler(path)
+    handler.add_vacancies([make_vacancy(1), make_vacancy(2)])
+    handler.delete_vacancy(make_vacancy(1))
+    handler.compact()
+
+    assert [line['vacancy_id'] for line in _lines(path)] == [2]
+
+
+def test_top_vacancies_per_platform(tmp_path, make_vacancy):
+    handler = JSONLFileHandler(str(tmp_path / 'vacancies.jsonl'))
+    handler.add_vacancies([
+        make_vacancy(1, salary_from=100, salary_to=None),
+        make_vacancy(2, salary_from=300, salary_to=None),
+        make_vacancy(3, salary_from=200, salary_to=None),
+        make_vacancy(4, platform='SuperJob.ru', salary_to=500)
+    ])
+
+    top = handler.top_vacancies(
+        {'1': 'HH.ru', '2': 'SuperJob.ru'}, 2, None, [None, None]
+    )
+    assert [vacancy.vacancy_id for vacancy in top['HH.ru']] == [2, 3]
+    assert [vacancy.vacancy_id for vacancy in top['SuperJob.ru']] == [4]
+
+
+def test_concurrent_processes_lose_no_appends(tmp_path):
+    path = str(tmp_path / 'vacancies.jsonl')
+    processes = [
+        multiprocessing.Process(
+            target=_add_vacancies, args=(path, worker * 100, 25)
+        )
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert sorted(line['vacancy_id'] for line in _lines(path)) == [
+        worker * 100 + offset for worker in range(4) for offset in range(25)
+    ]
@@ -0,0 +1,194 @@
+""" Tests of the SQLite store"""
+import sqlite3
+
+import pytest
+
+from src.file_handler_sqlite import SQLiteFileHandler
+
+PLATFORMS = {'1': 'HH.ru', '2': 'SuperJob.ru'}
+
+
+@pytest.fixture
+def handler(tmp_path):
+    with SQLiteFileHandler(str(tmp_path / 'vacancies.db')) as handler:
+        yield handler
+
+
+def test_add_get_and_delete(handler, make_vacancy, capsys):
+    handler.add_vacancies([
+        make_vacancy(1), make_vacancy(2, platform='SuperJob.ru')
+    ])
+    handler.add_vacancy(make_vacancy(1, title='Go developer'))
+
+    assert handler.get_vacancy(1, 'HH.ru')['title'] == 'Go developer'
+    assert handler.get_vacancy(2)['platform'] == 'SuperJob.ru'
+
+    handler.delete_vacancy(make_vacancy(1))
+    handler.delete_vacancy(make_vacancy(1))
+    assert handler.get_vacancy(1, 'HH.ru') is None
+
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'not found' in captured.err
+
+
+def test_load_vacancies_filters(handler, make_vacancy):
+    handler.add_vacancies([
+        make_vacancy(1, salary_from=100, salary_to=None),
+        make_vacancy(2, title='Java developer', salary_from=300,
+                     salary_to=None, description='Write Java code'),
+        make_vacancy(3, salary_from=500, salary_to=None),
+        make_vacancy(4, platform='SuperJob.ru', salary_from=400,
+                     salary_to=None)
+    ])
+
+    loaded = handler.load_vacancies(PLATFORMS, 10, 'python', [200, None])
+    assert {
+        platform: [vacancy.vacancy_id for vacancy in vacancies]
+        for platform, vacancies in loaded.items()
+    } == {'HH.ru': [3], 'SuperJob.ru': [4]}
+
+    loaded = handler.load_vacancies({'1': 'HH.ru'}, 2, None, [None, None])
+    assert [vacancy.vacancy_id for vacancy in loaded['HH.ru']] == [1, 2]
+
+
+def test_failed_save_all_keeps_previous_rows(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.db')
+    with SQLiteFileHandler(path) as handler:
+        handler.add_vacancies(make_vacancy(i) for i in range(5))
+        invalid = make_vacancy(6).to_dict()
+        invalid['platform'] = None
+        with pytest.raises(sqlite3.IntegrityError):
+            handler.save_all_vacancies({
+                'HH.ru': [make_vacancy(5).to_dict(), invalid]
+            })
+
+        loaded = handler.load_vacancies(PLATFORMS, 10, None, [None, None])
+        assert [vacancy.vacancy_id for vacancy in loaded['HH.ru']] == [
+            0, 1, 2, 3, 4
+        ]
+
+    with SQLiteFileHandler(path) as reopened:
+        assert reopened.get_vacancy(0, 'HH.ru') is not None
+        assert reopened.get_vacancy(5, 'HH.ru') is None
+
+
+def test_save_all_replaces_rows(handler, make_vacancy):
+    handler.add_vacancies(make_vacancy(i) for i in range(3))
+    handler.save_all_vacancies({'HH.ru': [make_vacancy(7).to_dict()]})
+
+    loaded = handler.load_vacancies(PLATFORMS, 10, None, [None, None])
+    assert [vacancy.vacancy_id for vacancy in loaded['HH.ru']] == [7]
+
+
+def test_top_vacancies_use_index_order(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.db')
+    statements = []
+    with SQLiteFileHandler(path) as handler:
+        handler.add_vacancies([
+            make_vacancy(1, salary_from=300, salary_to=None),
+            make_vacancy(2, salary_from=100, salary_to=None),
+            make_vacancy(3, salary_from=300, salary_to=None),
+            make_vacancy(4, salary_from=200, salary_to=None)
+        ])
+        handler._SQLiteFileHandler__connection.set_trace_callback(
+            statements.append
+        )
+        top = handler.top_vacancies({'1': 'HH.ru'}, 3, None, [150, None])
+
+    assert [vacancy.vacancy_id for vacancy in top['HH.ru']] == [3, 1, 4]
+    connection = sqlite3.connect(path)
+    try:
+        plan = connection.execute(
+            f'EXPLAIN QUERY PLAN {statements[0]}'
+        ).fetchall()
+    finally:
+        connection.close()
+    details = ' '.join(row[-1] for row in plan)
+    assert 'USING INDEX' in details
+    assert 'TEMP B-TREE' not in details
+
+
+def _plan(handler, query, parameters):
+    return ' '.join(
+        row[-1] for row in handler._SQLiteFileHandler__connection.execute(
+            f'EXPLAIN QUERY PLAN {query}', parameters
+        )
+    )
+
+
+def test_upsert_keeps_one_row_and_its_rowid(handler, make_vacancy):
+    handler.add_vacancies([make_vacancy(1), make_vacancy(2)])
+    connection = handler._SQLiteFileHandler__connection
+    rowid, = connection.execute(
+        "SELECT rowid FROM vacancies WHERE platform = 'HH.ru' "
+        'AND vacancy_id = 1'
+    ).fetchone()
+
+    handler.add_vacancy(make_vacancy(1, title='Go developer', employer=None))
+    handler.add_vacancy(make_vacancy(1, platform='SuperJob.ru'))
+
+    rows = connection.execute(
+        'SELECT rowid, platform, vacancy_id, title, employer '
+        'FROM vacancies ORDER BY rowid'
+    ).fetchall()
+    assert [tuple(row) for row in rows] == [
+        (rowid, 'HH.ru', 1, 'Go developer', None),
+        (rowid + 1, 'HH.ru', 2, 'Python developer', 'Acme'),
+        (rowid + 2, 'SuperJob.ru', 1, 'Python developer', 'Acme')
+    ]
+
+
+def test_lookups_and_salary_filters_use_indexes(handler, make_vacancy):
+    handler.add_vacancies(make_vacancy(i) for i in range(50))
+
+    assert 'sqlite_autoindex_vacancies_1' in _plan(
+        handler,
+        'SELECT * FROM vacancies WHERE platform = ? AND vacancy_id = ?',
+        ('HH.ru', 1)
+    )
+    assert 'idx_vacancies_platform_avg_salary' in _plan(
+        handler,
+        'SELECT * FROM vacancies WHERE platform = ? AND avg_salary > ?',
+        ('HH.ru', 100)
+    )
+    details = _plan(
+        handler,
+        'SELECT * FROM vacancies WHERE avg_salary > ? AND avg_salary < ? '
+        'ORDER BY avg_salary DESC',
+        (100, 200)
+    )
+    assert 'idx_vacancies_avg_salary' in details
+    assert 'TEMP B-TREE' not in details
+
+
+def test_migrate_adds_missing_employer_column(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.db')
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute(
+            'CREATE TABLE vacancies ('
+            'platform TEXT NOT NULL, vacancy_id INTEGER NOT NULL, '
+            'title TEXT, url TEXT, salary_from INTEGER, salary_to INTEGER, '
+            'currency TEXT, description TEXT, '
+            'avg_salary INTEGER NOT NULL DEFAULT 0, '
+            'PRIMARY KEY (platform, vacancy_id))'
+        )
+        connection.execute(
+            'INSERT INTO vacancies VALUES '
+            "('HH.ru', 1, 'Old', 'https://hh.ru/vacancy/1', 100, NULL, "
+            "'RUR', 'Python', 100)"
+        )
+    connection.close()
+
+    for _ in range(2):
+        with SQLiteFileHandler(path) as handler:
+            assert handler.get_vacancy(1, 'HH.ru')['employer'] is None
+            handler.add_vacancy(make_vacancy(2))
+
+    with SQLiteFileHandler(path) as handler:
+        loaded = handler.load_vacancies(PLATFORMS, 10, None, [None, None])
+        assert [
+            (vacancy.vacancy_id, vacancy.employer)
+            for vacancy in loaded['HH.ru']
+        ] == [(1, None), (2, 'Acme')]
@@ -0,0 +1,185 @@
+""" Tests of the filter pipeline and the top-N selection"""
+import pytest
+
+from src.file_handler_json import JSONFileHandler
+from src.file_handler_jsonl import JSONLFileHandler
+from src.file_handler_sqlite import SQLiteFileHandler
+from src.filter_pipeline import (
+    AllOf, FilterPipeline, KeywordPredicate, PlatformPredicate,
+    SalaryRangePredicate, VacancyPredicate, top_by_salary
+)
+
+
+def test_top_by_salary_puts_later_ties_first(make_vacancy):
+    vacancies = [
+        make_vacancy(1, salary_from=100, salary_to=None),
+        make_vacancy(2, salary_from=300, salary_to=None),
+        make_vacancy(3, salary_from=100, salary_to=None),
+        make_vacancy(4, salary_from=None, salary_to=None)
+    ]
+
+    assert [
+        vacancy.vacancy_id for vacancy in top_by_salary(vacancies, 2)
+    ] == [2, 3]
+    assert [
+        vacancy.vacancy_id for vacancy in top_by_salary(vacancies, None)
+    ] == [2, 3, 1, 4]
+
+
+def _json_store(path):
+    handler = JSONFileHandler(f'{path}.json')
+    return (
+        handler.add_vacancy_to_json, handler.top_vacancies_from_json,
+        lambda: None
+    )
+
+
+def _jsonl_store(path):
+    handler = JSONLFileHandler(f'{path}.jsonl')
+    return handler.add_vacancy, handler.top_vacancies, lambda: None
+
+
+def _sqlite_store(path):
+    handler = SQLiteFileHandler(f'{path}.db')
+    return handler.add_vacancy, handler.top_vacancies, handler.close
+
+
+@pytest.mark.parametrize('store', [_json_store, _jsonl_store, _sqlite_store])
+def test_stores_agree_on_top_order(tmp_path, make_vacancy, store):
+    add, top, close = store(str(tmp_path / 'vacancies'))
+    for vacancy in [
+        make_vacancy(1, salary_from=300, salary_to=None),
+        make_vacancy(2, salary_from=100, salary_to=None),
+        make_vacancy(3, salary_from=300, salary_to=None),
+        make_vacancy(4, salary_from=200, salary_to=None),
+        make_vacancy(5, platform='SuperJob.ru', salary_to=None),
+        make_vacancy(1, title='Senior Python developer', salary_from=300,
+                     salary_to=None)
+    ]:
+        add(vacancy)
+
+    result = top(None, 3, None, [None, None])
+    assert {
+        platform: [vacancy.vacancy_id for vacancy in vacancies]
+        for platform, vacancies in result.items()
+    } == {'HH.ru': [3, 1, 4], 'SuperJob.ru': [5]}
+    assert result['HH.ru'][1].title == 'Senior Python developer'
+
+    result = top({'2': 'SuperJob.ru'}, 3, None, [None, None])
+    assert list(result) == ['SuperJob.ru']
+    close()
+
+
+def _pipeline(*predicates, limit=None):
+    return FilterPipeline(AllOf(predicates), limit)
+
+
+def test_split_sql_pushes_down_every_translatable_predicate():
+    condition, residual = _pipeline(
+        SalaryRangePredicate(100, None),
+        PlatformPredicate(['HH.ru']),
+        KeywordPredicate('Py_thon')
+    ).split_sql()
+
+    assert residual is None
+    sql, parameters = condition
+    assert sql.count(') AND (') == 2
+    assert sorted(map(str, parameters)) == sorted(
+        ['100', 'HH.ru', '%py\\_thon%', '%py\\_thon%']
+    )
+
+
+def test_split_sql_keeps_untranslatable_predicates_as_residual():
+    keyword = KeywordPredicate('Разработчик')
+    condition, residual = _pipeline(
+        SalaryRangePredicate(None, 200), keyword
+    ).split_sql()
+    assert condition == ('(avg_salary != 0 AND avg_salary < ?)', [200])
+    assert residual is keyword
+
+    either = KeywordPredicate('python') | KeywordPredicate('Питон')
+    condition, residual = _pipeline(
+        PlatformPredicate(['HH.ru']), either, KeywordPredicate('Джуниор')
+    ).split_sql()
+    assert condition == ('(platform IN (?))', ['HH.ru'])
+    assert isinstance(residual, AllOf)
+    assert either in residual.predicates
+    assert len(residual.predicates) == 2
+
+    assert FilterPipeline().split_sql() == (None, None)
+    assert FilterPipeline(keyword).split_sql() == (None, keyword)
+
+
+@pytest.mark.parametrize('word', ['python', 'PYTHON', 'разработчик', '%'])
+def test_sql_pushdown_matches_python_filter(tmp_path, make_vacancy, word):
+    vacancies = [
+        make_vacancy(1, title='Python developer'),
+        make_vacancy(2, title='Разработчик Python', salary_from=500,
+                     salary_to=None),
+        make_vacancy(3, title='100% remote', description='Go'),
+        make_vacancy(4, platform='SuperJob.ru', title='РАЗРАБОТЧИК'),
+        make_vacancy(5, title='Java developer', description='Java',
+                     salary_from=None, salary_to=None)
+    ]
+    pipeline = FilterPipeline.from_arguments(
+        None, None, word, [50, None]
+    )
+    with SQLiteFileHandler(str(tmp_path / 'vacancies.db')) as handler:
+        for vacancy in vacancies:
+            handler.add_vacancy(vacancy)
+        found = list(handler.query_vacancies(pipeline))
+
+    assert [vacancy.vacancy_id for vacancy in found] == [
+        vacancy.vacancy_id for vacancy in pipeline.apply(vacancies)
+    ]
+    assert found
+
+
+def test_run_stops_consuming_at_the_limit(make_vacancy):
+    consumed = []
+
+    def stream():
+        for number in range(100):
+            consumed.append(number)
+            yield make_vacancy(
+                number, salary_from=100 if number % 2 else None,
+                salary_to=None
+            )
+
+    pipeline = _pipeline(SalaryRangePredicate(None, None), limit=3)
+    assert [vacancy.vacancy_id for vacancy in pipeline.run(stream())] == [
+        1, 3, 5
+    ]
+    assert consumed == list(range(6))
+
+    consumed.clear()
+    assert len(FilterPipeline(limit=None).apply(stream())) == 100
+    assert len(consumed) == 100
+
+
+def test_all_of_evaluates_cheap_rejecting_predicates_first(make_vacancy):
+    calls = []
+
+    class Recorded(VacancyPredicate):
+        def __init__(self, name, cost, selectivity, result):
+            self.name, self.result = name, result
+            self.cost, self.selectivity = cost, selectivity
+
+        def matches(self, vacancy):
+            calls.append(self.name)
+            return self.result
+
+    predicate = (
+        Recorded('expensive', 10.0, 0.1, True)
+        & Recorded('cheap', 1.0, 0.9, True)
+        & Recorded('rejecting', 1.0, 0.1, False)
+    )
+    assert not predicate.matches(make_vacancy(1))
+    assert calls == ['rejecting']
+
+    calls.clear()
+    assert (
+        Recorded('narrow', 1.0, 0.1, False)
+        | Recorded('broad', 1.0, 0.9, True)
+    ).matches(make_vacancy(1))
+    assert calls == ['broad']
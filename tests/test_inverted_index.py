@@ -0,0 +1,131 @@
+""" Tests of the full-text inverted index"""
+import os
+
+import pytest
+
+from src import inverted_index
+from src.file_handler_json import JSONFileHandler
+from src.inverted_index import InvertedIndex, tokenize
+from src.json_codec import CODECS, get_codec
+
+
+def test_tokenize_drops_markup_and_folds_case():
+    assert tokenize('<highlighttext>Python</highlighttext>-разработчик, Ёж'
+                    ' 3 a') == ['python', 'разработчик', 'еж', '3']
+
+
+def test_boolean_and_prefix_search():
+    index = InvertedIndex()
+    index.add_document(('HH.ru', 1), 'Senior Python developer')
+    index.add_document(('HH.ru', 2), 'Python programmer')
+    index.add_document(('SuperJob.ru', 3), 'Java developer')
+
+    assert index.search('python developer') == {('HH.ru', 1)}
+    assert index.search('python java', match_all=False) == {
+        ('HH.ru', 1), ('HH.ru', 2), ('SuperJob.ru', 3)
+    }
+    assert index.search('develop*') == {('HH.ru', 1), ('SuperJob.ru', 3)}
+    assert index.search('prog*') == {('HH.ru', 2)}
+
+
+def test_prefix_search_follows_adds_and_removes():
+    index = InvertedIndex()
+    index.add_document(('HH.ru', 1), 'Python developer')
+    assert index.search('py*') == {('HH.ru', 1)}
+
+    index.add_document(('HH.ru', 2), 'PyTorch engineer')
+    assert index.search('py*') == {('HH.ru', 1), ('HH.ru', 2)}
+
+    index.remove_document(('HH.ru', 1))
+    index.add_document(('HH.ru', 2), 'Java engineer')
+    assert index.search('py*') == set()
+    assert index.search('ja*') == {('HH.ru', 2)}
+
+
+def test_rank_prefers_more_relevant_documents():
+    index = InvertedIndex()
+    index.add_document(('HH.ru', 1), 'Python developer')
+    index.add_document(('HH.ru', 2), 'Python Python Python developer')
+    index.add_document(('HH.ru', 3), 'Java developer')
+
+    ranked = index.rank('python', limit=2)
+    assert [key for key, _ in ranked] == [('HH.ru', 2), ('HH.ru', 1)]
+
+
+@pytest.mark.parametrize('name', sorted(CODECS))
+def test_save_and_load_round_trip(tmp_path, name):
+    index = InvertedIndex()
+    index.add_document(('HH.ru', 1), 'Python разработчик')
+    index.source_signature = (1, 2, 3)
+    index.save(str(tmp_path / 'index.json'), get_codec(name))
+
+    loaded = InvertedIndex.load(str(tmp_path / 'index.json'))
+    assert loaded.source_signature == (1, 2, 3)
+    assert loaded.search('pyth*') == {('HH.ru', 1)}
+    assert loaded.search('разработчик') == {('HH.ru', 1)}
+    assert os.listdir(tmp_path) == ['index.json']
+
+
+def test_failed_save_keeps_the_previous_index(tmp_path, monkeypatch):
+    path = str(tmp_path / 'index.json')
+    index = InvertedIndex()
+    index.add_document(('HH.ru', 1), 'Python developer')
+    index.save(path)
+
+    def fail(source, target):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(inverted_index.os, 'replace', fail)
+    index.add_document(('HH.ru', 2), 'Go developer')
+    with pytest.raises(OSError):
+        index.save(path)
+
+    assert os.listdir(tmp_path) == ['index.json']
+    assert InvertedIndex.load(path).search('go') == set()
+
+
+def test_json_store_persists_index_on_flush(tmp_path, make_vacancy):
+    path = str(tmp_path / 'vacancies.json')
+    index_path = str(tmp_path / 'index.json')
+    handler = JSONFileHandler(path, index_path=index_path)
+    handler.add_vacancy_to_json(make_vacancy(1))
+    assert handler.search_vacancies('python')[0].vacancy_id == 1
+    saved = os.stat(index_path).st_mtime_ns
+
+    handler.add_vacancy_to_json(make_vacancy(2, title='Go developer'))
+    assert os.stat(index_path).st_mtime_ns == saved
+
+    handler.flush()
+    reopened = JSONFileHandler(path, index_path=index_path)
+    assert [
+        vacancy.vacancy_id for vacancy in reopened.search_vacancies('go')
+    ] == [2]
+    assert InvertedIndex.load(index_path).search('go') == {('HH.ru', 2)}
+
+
+def test_repeated_searches_parse_an_unchanged_file_once(
+        tmp_path, make_vacancy, monkeypatch
+):
+    path = str(tmp_path / 'vacancies.json')
+    JSONFileHandler(path).add_vacancies_to_json(
+        [make_vacancy(1), make_vacancy(2, title='Go developer')]
+    )
+    handler = JSONFileHandler(path)
+    parses = []
+    parse_file = handler._parse_file
+    monkeypatch.setattr(
+        handler, '_parse_file',
+        lambda file_path: parses.append(file_path) or parse_file(file_path)
+    )
+
+    for _ in range(3):
+        assert handler.search_vacancies('go')[0].vacancy_id == 2
+    assert len(parses) == 1
+
+    JSONFileHandler(path).add_vacancy_to_json(
+        make_vacancy(3, title='Go engineer')
+    )
+    assert {
+        vacancy.vacancy_id for vacancy in handler.search_vacancies('go')
+    } == {2, 3}
+    assert len(parses) == 2
@@ -0,0 +1,80 @@
+""" Tests of the pluggable JSON codecs"""
+from json import JSONDecodeError
+
+import pytest
+
+from src import json_codec
+from src.json_codec import (
+    CODECS, MsgspecCodec, OrjsonCodec, StdlibCodec, get_codec
+)
+
+DOCUMENT = {
+    'HH.ru': [{
+        'vacancy_id': 1,
+        'title': 'Разработчик Python',
+        'salary_from': None,
+        'avg_salary': 150000,
+        'tags': ['remote', 'junior'],
+        'ratio': 0.5,
+        'active': True
+    }],
+    'SuperJob.ru': []
+}
+
+
+@pytest.fixture(params=['json', 'msgspec', 'orjson'])
+def codec(request):
+    if request.param not in CODECS:
+        pytest.skip(f'{request.param} is not installed')
+    return get_codec(request.param)
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_round_trip(codec, compact):
+    encoded = codec.dumps(DOCUMENT, compact)
+
+    assert isinstance(encoded, bytes)
+    assert 'Разработчик'.encode('utf-8') in encoded
+    assert codec.loads(encoded) == DOCUMENT
+    assert codec.loads(encoded.decode('utf-8')) == DOCUMENT
+    assert (b'\n' not in encoded) == compact
+
+
+def test_codecs_decode_each_others_output(codec):
+    for name in CODECS:
+        for compact in (False, True):
+            encoded = get_codec(name).dumps(DOCUMENT, compact)
+            assert codec.loads(encoded) == DOCUMENT
+
+
+@pytest.mark.parametrize('document', [b'', b'{"a": ', b'[1, 2', b'nope'])
+def test_decoding_errors_are_json_decode_errors(codec, document):
+    with pytest.raises(JSONDecodeError):
+        codec.loads(document)
+
+
+@pytest.mark.parametrize('installed, expected', [
+    ({'json': StdlibCodec, 'msgspec': MsgspecCodec, 'orjson': OrjsonCodec},
+     OrjsonCodec),
+    ({'json': StdlibCodec, 'msgspec': MsgspecCodec}, MsgspecCodec),
+    ({'json': StdlibCodec, 'orjson': OrjsonCodec}, OrjsonCodec),
+    ({'json': StdlibCodec}, StdlibCodec)
+])
+def test_get_codec_prefers_the_fastest_installed(
+        monkeypatch, installed, expected
+):
+    if expected.name not in CODECS:
+        pytest.skip(f'{expected.name} is not installed')
+    monkeypatch.setattr(json_codec, 'CODECS', installed)
+
+    assert type(get_codec()) is expected
+    assert type(get_codec('json')) is StdlibCodec
+
+
+def test_get_codec_rejects_unavailable_codecs(monkeypatch):
+    monkeypatch.setattr(json_codec, 'CODECS', {'json': StdlibCodec})
+
+    with pytest.raises(ValueError, match='"orjson" is not available'):
+        get_codec('orjson')
+    with pytest.raises(ValueError, match='"yaml" is not available'):
+        get_codec('yaml')
@@ -0,0 +1,42 @@
+""" Tests of the interactive interface"""
+import pytest
+
+from src import main
+
+
+@pytest.fixture
+def answer(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_main(*args, **kwargs):
+        calls.append(kwargs)
+        return {'HH.ru': [], 'SuperJob.ru': []}
+
+    monkeypatch.setattr(main, 'main', fake_main)
+
+    def run(*answers):
+        replies = iter(answers)
+        monkeypatch.setattr('builtins.input', lambda prompt: next(replies))
+        main.user_interface()
+        return calls[-1]
+
+    return run
+
+
+def test_deduplication_and_parallel_search_are_opt_in(answer):
+    options = answer('1', '2', '3', 'python', '', '20', '', '', '')
+
+    assert options['parallel'] is False
+    assert options['deduplicate'] is False
+
+
+def test_options_follow_the_answers(answer):
+    options = answer('1', '3', 'python', '', '20', 'y', '')
+
+    assert options['parallel'] is False
+    assert options['deduplicate'] is True
+
+    options = answer('1', '2', '3', 'python', '', '20', 'y', 'n', '')
+    assert options['parallel'] is True
+    assert options['deduplicate'] is False
@@ -0,0 +1,82 @@
+""" Tests of the run metrics"""
+import json
+
+import pytest
+
+from src import cli
+from src.metrics import METRICS, Histogram, Metrics
+
+
+@pytest.fixture
+def global_metrics(monkeypatch):
+    METRICS.reset()
+    monkeypatch.setattr(METRICS, 'enabled', False)
+    yield METRICS
+    METRICS.reset()
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics()
+    metrics.increment('requests_total')
+    with metrics.timer('fetch_seconds'):
+        pass
+
+    assert metrics.snapshot() == {'counters': {}, 'histograms': {}}
+
+
+def test_counters_histograms_and_hooks():
+    metrics = Metrics(enabled=True)
+    snapshots = []
+    metrics.add_hook(snapshots.append)
+    metrics.increment('requests_total')
+    metrics.increment('requests_total', 2)
+    metrics.observe('fetch_seconds', 0.003)
+    metrics.observe('fetch_seconds', 100)
+    assert list(metrics.counted(range(4), 'items_total')) == [0, 1, 2, 3]
+    metrics.publish()
+
+    snapshot = snapshots[0]
+    assert snapshot['counters'] == {'requests_total': 3, 'items_total': 4}
+    histogram = snapshot['histograms']['fetch_seconds']
+    assert histogram['count'] == 2
+    assert histogram['buckets']['0.005'] == 1
+    assert histogram['buckets']['+Inf'] == 2
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 2))
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == {'1': 2, '2': 3, '+Inf': 4}
+    assert histogram.sum == 6
+
+
+def test_prometheus_format():
+    metrics = Metrics(enabled=True)
+    metrics.increment('pages_total', 2)
+    metrics.observe('decode_seconds', 0.2)
+
+    lines = metrics.to_prometheus().splitlines()
+    assert '# TYPE vacant_pages_total counter' in lines
+    assert 'vacant_pages_total 2' in lines
+    assert 'vacant_decode_seconds_bucket{le="0.25"} 1' in lines
+    assert 'vacant_decode_seconds_count 1' in lines
+
+
+@pytest.mark.parametrize('name', ['metrics.json', 'metrics.prom'])
+def test_cli_exports_run_metrics(
+        hh_platform, tmp_path, capsysbinary, global_metrics, name
+):
+    path = tmp_path / name
+    assert cli.main(['-p', 'hh', '-n', '40', '--metrics', str(path)]) == 0
+    assert len(capsysbinary.readouterr().out.splitlines()) == 40
+
+    text = path.read_text(encoding='utf-8')
+    if name.endswith('.json'):
+        snapshot = json.loads(text)
+        assert snapshot['counters']['pages_total'] == 2
+        assert snapshot['counters']['vacancies_total'] == 40
+        assert snapshot['histograms']['fetch_seconds']['count'] == 2
+    else:
+        assert 'vacant_pages_total 2' in text.splitlines()
@@ -0,0 +1,95 @@
+""" Tests of the process-pool page conversion"""
+import json
+from functools import partial
+
+import pytest
+
+from src.decoders import HHPageDecoder
+from src.parallel_convert import PageConverter
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+from tests.conftest import StubHHAPI
+
+PER_PAGE = 20
+
+
+def _decoder_factory():
+    return partial(HHPageDecoder, HHParser.to_vacancy)
+
+
+def _body(api, page):
+    return json.dumps(api.page({
+        'text': 'python', 'page': page, 'per_page': PER_PAGE
+    })).encode('utf-8')
+
+
+def _dicts(vacancies):
+    return [vacancy.to_dict() for vacancy in vacancies]
+
+
+@pytest.fixture
+def converter():
+    with PageConverter(
+            _decoder_factory(), processes=2, chunk_pages=2
+    ) as converter:
+        yield converter
+
+
+def test_use_for_threshold():
+    converter = PageConverter(_decoder_factory(), threshold=100)
+
+    assert not converter.use_for(99)
+    assert converter.use_for(100)
+    assert converter.use_for(5000)
+
+
+def test_decode_pages_matches_in_process_decoding(converter):
+    api = StubHHAPI()
+    api.total = 1000
+    bodies = [_body(api, page) for page in range(7)]
+    decoder = _decoder_factory()()
+
+    expected = [vacancy for body in bodies for vacancy in decoder.decode(body)]
+    assert _dicts(converter.decode_pages(iter(bodies))) == _dicts(expected)
+    assert _dicts(converter.decode_pages([])) == []
+
+
+def test_decode_pages_stops_after_a_short_page(converter):
+    api = StubHHAPI()
+    api.total = 2 * PER_PAGE + 5
+    sent = []
+    closed = []
+
+    def bodies():
+        try:
+            for page in range(1000):
+                sent.append(page)
+                yield _body(api, page)
+        finally:
+            closed.append(True)
+
+    vacancies = list(converter.decode_pages(bodies(), PER_PAGE))
+
+    assert [vacancy.vacancy_id for vacancy in vacancies] == list(
+        range(api.total)
+    )
+    assert closed == [True]
+    assert len(sent) < 20
+
+
+def test_parser_converts_large_pulls_on_the_pool(hh_api):
+    results = []
+    for processes in (0, 2):
+        parser = HHParser(
+            rate_limiter=RateLimiter({}, 1000), processes=processes
+        )
+        parser.url = hh_api.url
+        if parser.converter is not None:
+            parser.converter.threshold = 1
+        try:
+            results.append(_dicts(parser.stream_vacancies('python', 100)))
+        finally:
+            parser.close()
+
+    assert len(results[1]) == hh_api.total
+    assert results[1] == results[0]
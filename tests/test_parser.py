@@ -0,0 +1,124 @@
+""" Tests of the synchronous parsers against a stub server"""
+import pytest
+import requests
+
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+from src.response_cache import MemoryResponseCache
+
+
+@pytest.fixture
+def make_parser(hh_api):
+    parsers = []
+
+    def factory(**kwargs) -> HHParser:
+        parser = HHParser(rate_limiter=RateLimiter({}, 1000), **kwargs)
+        parser.url = hh_api.url
+        parsers.append(parser)
+        return parser
+
+    yield factory
+    for parser in parsers:
+        parser.close()
+
+
+def test_stream_vacancies_yields_count_in_order(hh_api, make_parser):
+    vacancies = list(make_parser().stream_vacancies('python', 40))
+
+    assert [vacancy.vacancy_id for vacancy in vacancies] == list(range(40))
+    assert vacancies[3].title == 'python developer 3'
+    assert vacancies[3].salary_from == 4000
+    assert [
+        (request['page'], request['text']) for request in hh_api.requests
+    ] == [('0', 'python'), ('1', 'python')]
+
+
+def test_stream_stops_at_the_last_page(hh_api, make_parser):
+    vacancies = list(make_parser().stream_vacancies('', 100))
+
+    assert len(vacancies) == hh_api.total
+    assert [request['page'] for request in hh_api.requests] == ['0', '1', '2']
+
+
+def test_concurrent_stream_stops_at_an_empty_page(hh_api, make_parser):
+    hh_api.total = 40
+    parser = make_parser(max_workers=2)
+    vacancies = list(parser.stream_vacancies('', 200))
+
+    assert len(vacancies) == 40
+    assert len(hh_api.requests) <= 4
+
+
+def test_top_vacancies_select_from_the_fetched_ones(hh_api, make_parser):
+    top = make_parser().top_vacancies('python', 40, 3)
+
+    assert [vacancy.vacancy_id for vacancy in top] == [39, 38, 37]
+    assert len(hh_api.requests) == 2
+
+
+def test_concurrent_pages_keep_page_order(hh_api, make_parser):
+    hh_api.delay = 0.02
+    parser = make_parser(max_workers=3)
+    raw = list(parser.iter_vacancies('python', 45))
+
+    assert [int(vacancy['id']) for vacancy in raw] == list(range(45))
+    assert hh_api.max_in_flight['python'] > 1
+
+
+def test_stream_is_lazy(hh_api, make_parser):
+    stream = make_parser().stream_vacancies('python', 100)
+    assert next(stream).vacancy_id == 0
+    stream.close()
+
+    assert len(hh_api.requests) == 1
+
+
+def test_cache_serves_repeated_requests(hh_api, make_parser):
+    parser = make_parser(cache=MemoryResponseCache())
+    first = [vacancy.to_dict() for vacancy in parser.stream_vacancies('a', 30)]
+    second = [
+        vacancy.to_dict() for vacancy in parser.stream_vacancies('a', 30)
+    ]
+
+    assert first == second
+    assert len(hh_api.requests) == 2
+
+
+def test_published_vacancies_window(hh_api, make_parser):
+    parser = make_parser()
+    since = hh_api.published_at(10).timestamp()
+    until = hh_api.published_at(2).timestamp()
+    list(parser.iter_published_vacancies('python', 20, since, until))
+
+    request = hh_api.requests[0]
+    assert request['order_by'] == 'publication_time'
+    assert request['date_from'] == '2023-12-31T23:50:00+0000'
+    assert request['date_to'] == '2023-12-31T23:58:00+0000'
+    assert 'date_from' not in parser.parameters
+
+
+def test_throttled_and_failed_requests_are_retried(hh_api, make_parser):
+    hh_api.fail(429, times=2)
+    hh_api.fail(503)
+    vacancies = list(make_parser().stream_vacancies('python', 20))
+
+    assert len(vacancies) == 20
+    assert len(hh_api.requests) == 4
+
+
+def test_retries_give_up_after_max_retries(hh_api, make_parser):
+    parser = make_parser()
+    parser.max_retries = 2
+    hh_api.fail(500, times=3)
+
+    with pytest.raises(requests.HTTPError):
+        list(parser.stream_vacancies('python', 20))
+    assert len(hh_api.requests) == 3
+
+
+def test_client_errors_are_not_retried(hh_api, make_parser):
+    hh_api.fail(404)
+
+    with pytest.raises(requests.HTTPError):
+        list(make_parser().stream_vacancies('python', 20))
+    assert len(hh_api.requests) == 1
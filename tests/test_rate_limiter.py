@@ -0,0 +1,91 @@
+""" Tests of the client-side rate limiter"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src import rate_limiter
+from src.rate_limiter import (
+    RateLimiter, TokenBucket, backoff_delay, parse_retry_after
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', clock)
+    return clock
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= min(
+            4, 0.5 * 2 ** attempt
+        )
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after('-1') == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 50 < parse_retry_after(format_datetime(retry_at, True)) <= 60
+
+
+def test_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(max_rate=10)
+    assert [bucket.try_acquire() for _ in range(10)] == [0.0] * 10
+    assert bucket.try_acquire() == pytest.approx(0.1)
+
+    assert bucket.acquire() == pytest.approx(0.1)
+    assert bucket.try_acquire() == pytest.approx(0.1)
+
+
+def test_throttled_bucket_pauses_without_refilling(clock):
+    bucket = TokenBucket(max_rate=10)
+    bucket.throttled(5)
+    assert bucket.rate == 5
+
+    clock.now += 4
+    assert bucket.try_acquire() == pytest.approx(1)
+
+    clock.now += 1.2
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() > 0
+
+
+def test_rate_recovers_additively(clock):
+    bucket = TokenBucket(max_rate=20)
+    for _ in range(4):
+        bucket.throttled(0)
+    assert bucket.rate == pytest.approx(1.25)
+
+    bucket.succeeded()
+    assert bucket.rate == pytest.approx(2.25)
+    for _ in range(40):
+        bucket.succeeded()
+    assert bucket.rate == 20
+
+
+def test_limiter_keeps_one_bucket_per_host():
+    limiter = RateLimiter({'api.hh.ru': 10}, default_rate=3)
+    bucket = limiter.bucket('https://api.hh.ru/vacancies?page=1')
+
+    assert bucket is limiter.bucket('https://api.hh.ru/areas')
+    assert bucket.max_rate == 10
+    assert limiter.bucket('https://api.superjob.ru/2.0/').max_rate == 3
@@ -0,0 +1,127 @@
+""" Tests of the salary index"""
+import random
+
+import pytest
+
+from src.salary_index import SalaryIndex
+from src.vacancy_filter import SalaryRangeFilter
+
+
+def _ids(vacancies):
+    return [vacancy.vacancy_id for vacancy in vacancies]
+
+
+@pytest.fixture
+def vacancies(make_vacancy):
+    generator = random.Random(3)
+    return [
+        make_vacancy(
+            number, platform='HH.ru' if number % 2 else 'SuperJob.ru',
+            salary_from=generator.choice([None, 0, 100, 150, 200, 250]),
+            salary_to=None
+        )
+        for number in range(60)
+    ]
+
+
+@pytest.mark.parametrize('salary_range', [
+    [None, None], [100, None], [None, 200], [99, 201], [100, 200],
+    [150, 151], [-50, 120], [300, None], [200, 100]
+])
+def test_range_matches_salary_range_filter(vacancies, salary_range):
+    index = SalaryIndex(vacancies)
+    expected = SalaryRangeFilter().filter_vacancies(vacancies, salary_range)
+
+    found = index.range(*salary_range)
+    assert sorted(_ids(found)) == sorted(_ids(expected))
+    assert [vacancy.avg_salary for vacancy in found] == sorted(
+        vacancy.avg_salary for vacancy in expected
+    )
+    assert index.count_range(*salary_range) == len(expected)
+
+
+def test_missing_and_zero_salaries_are_never_in_range(make_vacancy):
+    index = SalaryIndex([
+        make_vacancy(1, salary_from=None, salary_to=None),
+        make_vacancy(2, salary_from=0, salary_to=None),
+        make_vacancy(3, salary_from=100, salary_to=None)
+    ])
+
+    assert len(index) == 3
+    assert _ids(index.range(None, None)) == [3]
+    assert _ids(index.range(-1, None)) == [3]
+    assert index.count_range(None, 100) == 0
+
+
+def test_empty_index():
+    index = SalaryIndex()
+
+    assert len(index) == 0
+    assert index.range(None, None) == []
+    assert index.count_range(100, 200) == 0
+    assert index.top(5) == []
+
+
+def test_add_replaces_and_remove_keeps_order(make_vacancy):
+    index = SalaryIndex([
+        make_vacancy(1, salary_from=100, salary_to=None),
+        make_vacancy(2, salary_from=300, salary_to=None)
+    ])
+
+    index.add(make_vacancy(3, salary_from=200, salary_to=None))
+    index.add(make_vacancy(1, salary_from=400, salary_to=None))
+    assert len(index) == 3
+    assert _ids(index.range(None, None)) == [3, 2, 1]
+    assert index.range(350, None)[0].salary_from == 400
+
+    index.remove(make_vacancy(2))
+    index.remove(make_vacancy(2))
+    index.remove(make_vacancy(9))
+    assert make_vacancy(2) not in index
+    assert make_vacancy(3) in index
+    assert _ids(index.range(None, None)) == [3, 1]
+    assert _ids(index.top(1)) == [1]
+
+
+def test_same_id_on_two_platforms_are_separate(make_vacancy):
+    index = SalaryIndex([
+        make_vacancy(1, platform='HH.ru', salary_from=100, salary_to=None),
+        make_vacancy(
+            1, platform='SuperJob.ru', salary_from=100, salary_to=None
+        )
+    ])
+
+    index.remove(make_vacancy(1, platform='HH.ru'))
+    assert [vacancy.platform for vacancy in index.range(None, None)] == [
+        'SuperJob.ru'
+    ]
+
+
+def test_incremental_index_matches_rebuilt_index(vacancies):
+    generator = random.Random(4)
+    index = SalaryIndex()
+    live = {}
+    for _ in range(300):
+        vacancy = generator.choice(vacancies)
+        if generator.random() < 0.3:
+            index.remove(vacancy)
+            live.pop((vacancy.platform, vacancy.vacancy_id), None)
+        else:
+            index.add(vacancy)
+            live[(vacancy.platform, vacancy.vacancy_id)] = vacancy
+
+    rebuilt = SalaryIndex(live.values())
+    assert len(index) == len(rebuilt) == len(live)
+    assert index.range(None, None) == rebuilt.range(None, None)
+    assert index.range(120, 240) == rebuilt.range(120, 240)
+
+
+def test_top_returns_highest_salaries_first(vacancies):
+    index = SalaryIndex(vacancies)
+    salaries = sorted(
+        (vacancy.avg_salary for vacancy in vacancies), reverse=True
+    )
+
+    assert [vacancy.avg_salary for vacancy in index.top(7)] == salaries[:7]
+    assert len(index.top(1000)) == len(vacancies)
+    assert index.top(0) == index.top(-1) == []
@@ -0,0 +1,180 @@
+""" Tests of the incremental sync"""
+import pytest
+
+from src.parser_hh import HHParser
+from src.rate_limiter import RateLimiter
+from src.sync import SyncState, sync_vacancies
+from src.vacancy import Vacancy
+
+
+class FakeParser:
+    """
+    A parser over in-memory postings that applies the date window the way
+    the APIs do: newest first, both bounds inclusive, count at most.
+    """
+
+    platform = 'HH.ru'
+
+    def __init__(self):
+        self.postings = []
+        self.windows = []
+
+    def post(self, vacancy_id: int, published: float) -> None:
+        self.postings.append({'id': vacancy_id, 'published': published})
+
+    @staticmethod
+    def to_vacancy(raw: dict) -> Vacancy:
+        return Vacancy(
+            'HH.ru', raw['id'], f'Vacancy {raw["id"]}',
+            f'https://hh.ru/vacancy/{raw["id"]}', None, None, None, ''
+        )
+
+    @staticmethod
+    def published_at(raw: dict) -> float:
+        return raw['published']
+
+    def iter_published_vacancies(self, keyword, count, since=None, until=None):
+        self.windows.append((since, until))
+        postings = sorted(
+            self.postings, key=lambda raw: (-raw['published'], -raw['id'])
+        )
+        yield from [
+            raw for raw in postings
+            if (since is None or raw['published'] >= since)
+            and (until is None or raw['published'] <= until)
+        ][:count]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+@pytest.fixture
+def state(tmp_path):
+    return SyncState(str(tmp_path / 'sync_state.json'))
+
+
+def _sync(parser, state, count=10):
+    saved = []
+    found = sync_vacancies(parser, 'python', state, saved.extend, count)
+    assert [vacancy.vacancy_id for vacancy in saved] == [
+        vacancy.vacancy_id for vacancy in found
+    ]
+    return [vacancy.vacancy_id for vacancy in found]
+
+
+def test_first_sync_sets_the_mark(state):
+    parser = FakeParser()
+    for vacancy_id in range(15):
+        parser.post(vacancy_id, 100 + vacancy_id)
+
+    assert _sync(parser, state) == list(range(14, 4, -1))
+    assert state.get('HH.ru', ' Python ') == (114, {14})
+    assert SyncState(state.file_path).get('HH.ru', 'python') == (114, {14})
+
+
+def test_sync_without_new_postings_changes_nothing(state):
+    parser = FakeParser()
+    parser.post(1, 100)
+    _sync(parser, state)
+
+    assert _sync(parser, state) == []
+    assert state.get('HH.ru', 'python') == (100, {1})
+
+
+def test_sync_pages_down_to_the_mark(state):
+    parser = FakeParser()
+    parser.post(1, 100)
+    _sync(parser, state)
+
+    parser.post(2, 100)
+    for vacancy_id in range(3, 28):
+        parser.post(vacancy_id, 98 + vacancy_id)
+
+    found = _sync(parser, state)
+    assert sorted(found) == list(range(2, 28))
+    assert len(parser.windows) > 2
+    assert state.get('HH.ru', 'python') == (125, {27})
+
+
+def test_new_posting_at_the_mark_keeps_known_ids(state):
+    parser = FakeParser()
+    parser.post(1, 100)
+    _sync(parser, state)
+
+    parser.post(2, 100)
+    assert _sync(parser, state) == [2]
+    assert state.get('HH.ru', 'python') == (100, {1, 2})
+
+
+def test_mark_stays_when_the_window_cannot_shrink(state, capsys):
+    parser = FakeParser()
+    parser.post(1, 100)
+    _sync(parser, state)
+
+    for vacancy_id in range(2, 15):
+        parser.post(vacancy_id, 200)
+    found = _sync(parser, state)
+
+    assert len(found) == 10
+    assert state.get('HH.ru', 'python') == (100, {1})
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'stopped short' in captured.err
+
+
+def test_failed_save_keeps_the_mark(state):
+    parser = FakeParser()
+    parser.post(1, 100)
+    _sync(parser, state)
+    parser.post(2, 101)
+
+    def fail(vacancies):
+        raise OSError('disk full')
+
+    with pytest.raises(OSError):
+        sync_vacancies(parser, 'python', state, fail)
+    assert SyncState(state.file_path).get('HH.ru', 'python') == (100, {1})
+    assert _sync(parser, state) == [2]
+
+
+def test_invalid_state_file_is_reset(tmp_path, capsys):
+    path = tmp_path / 'sync_state.json'
+    path.write_text('{')
+
+    assert SyncState(str(path)).get('HH.ru', 'python') == (None, set())
+    assert 'not valid JSON' in capsys.readouterr().err
+
+
+@pytest.fixture
+def hh_parser(hh_api):
+    parser = HHParser(rate_limiter=RateLimiter({}, 1000))
+    parser.url = hh_api.url
+    return parser
+
+
+def test_hh_sync_stops_at_the_last_page(hh_api, hh_parser, state):
+    found = sync_vacancies(hh_parser, 'python', state, lambda vacancies: None)
+
+    assert [vacancy.vacancy_id for vacancy in found] == list(range(45))
+    assert [request['page'] for request in hh_api.requests] == ['0', '1', '2']
+    assert state.get('HH.ru', 'python') == (
+        hh_api.published_at(0).timestamp(), {0}
+    )
+
+
+def test_hh_sync_fetches_only_new_postings(hh_api, hh_parser, state):
+    state.update('HH.ru', 'python', hh_api.published_at(5).timestamp(), {5})
+    saved = []
+    found = sync_vacancies(hh_parser, 'python', state, saved.extend)
+
+    assert [vacancy.vacancy_id for vacancy in saved] == [0, 1, 2, 3, 4]
+    assert found == saved
+    assert len(hh_api.requests) == 1
+    assert hh_api.requests[0]['date_from'] == '2023-12-31T23:55:00+0000'
+
+    hh_api.requests.clear()
+    assert sync_vacancies(hh_parser, 'python', state, saved.extend) == []
+    assert len(hh_api.requests) == 1
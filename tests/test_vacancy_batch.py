@@ -0,0 +1,113 @@
+""" Tests of the columnar vacancy batch"""
+import random
+
+import pytest
+
+from src import vacancy_batch
+from src.vacancy_batch import VacancyBatch
+from src.vacancy_filter import SalaryRangeFilter
+
+
+@pytest.fixture(params=['array', 'numpy'])
+def backend(request, monkeypatch):
+    """
+    Runs a test with the pure-Python array code and, if installed, NumPy.
+    """
+    if request.param == 'numpy':
+        monkeypatch.setattr(
+            vacancy_batch, 'numpy', pytest.importorskip('numpy')
+        )
+    else:
+        monkeypatch.setattr(vacancy_batch, 'numpy', None)
+    return request.param
+
+
+@pytest.fixture
+def vacancies(make_vacancy):
+    generator = random.Random(5)
+    return [
+        make_vacancy(
+            number, platform='HH.ru' if number % 3 else 'SuperJob.ru',
+            salary_from=generator.choice([None, 0, 100, 150, 200, 250]),
+            salary_to=generator.choice([None, 120, 300]),
+            employer=generator.choice([None, 'Acme'])
+        )
+        for number in range(80)
+    ]
+
+
+def _ids(vacancies):
+    return [vacancy.vacancy_id for vacancy in vacancies]
+
+
+def test_round_trip(vacancies):
+    batch = VacancyBatch.from_vacancies(vacancies)
+    from_dicts = VacancyBatch.from_dicts(
+        vacancy.to_dict() for vacancy in vacancies
+    )
+
+    assert len(batch) == len(vacancies)
+    assert batch.platforms == ['SuperJob.ru', 'HH.ru']
+    for restored in (batch.to_vacancies(), from_dicts.to_vacancies()):
+        assert [vacancy.to_dict() for vacancy in restored] == [
+            vacancy.to_dict() for vacancy in vacancies
+        ]
+
+
+@pytest.mark.parametrize('salary_range', [
+    [None, None], [100, None], [None, 200], [99, 201], [120, 250],
+    [-10, 130], [400, None], [300, 100]
+])
+def test_filter_matches_salary_range_filter(
+        backend, vacancies, salary_range
+):
+    batch = VacancyBatch.from_vacancies(vacancies)
+
+    expected = SalaryRangeFilter().filter_vacancies(vacancies, salary_range)
+    filtered = SalaryRangeFilter().filter_vacancies(batch, salary_range)
+    assert isinstance(filtered, VacancyBatch)
+    assert _ids(filtered.to_vacancies()) == _ids(expected)
+
+
+@pytest.mark.parametrize('count', [0, 1, 5, 17, 79, 80, 200])
+def test_top_n_matches_sort(backend, vacancies, count):
+    batch = VacancyBatch.from_vacancies(vacancies)
+    expected = sorted(
+        vacancies, key=lambda vacancy: vacancy.avg_salary, reverse=True
+    )[:count]
+
+    assert _ids(batch.top_n(count).to_vacancies()) == _ids(expected)
+    assert _ids(batch.sort_by_salary().to_vacancies()) == _ids(
+        sorted(
+            vacancies, key=lambda vacancy: vacancy.avg_salary, reverse=True
+        )
+    )
+
+
+def test_ties_keep_batch_order(backend, make_vacancy):
+    batch = VacancyBatch.from_vacancies([
+        make_vacancy(1, salary_from=100, salary_to=None),
+        make_vacancy(2, salary_from=300, salary_to=None),
+        make_vacancy(3, salary_from=100, salary_to=None),
+        make_vacancy(4, salary_from=100, salary_to=None)
+    ])
+
+    assert _ids(batch.top_n(3).to_vacancies()) == [2, 1, 3]
+    assert _ids(batch.sort_by_salary().to_vacancies()) == [2, 1, 3, 4]
+
+
+def test_empty_batch(backend):
+    batch = VacancyBatch()
+
+    assert len(batch.filter_salary([None, None])) == 0
+    assert len(batch.top_n(3)) == 0
+    assert batch.to_vacancies() == []
+
+
+def test_take_single_position_and_shared_tables(vacancies):
+    batch = VacancyBatch.from_vacancies(vacancies)
+    taken = batch.take([7])
+
+    assert _ids(taken.to_vacancies()) == [7]
+    assert taken.platforms is batch.platforms
+    assert taken.to_vacancy(0).to_dict() == vacancies[7].to_dict()